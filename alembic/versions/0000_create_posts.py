@@ -0,0 +1,32 @@
+"""create posts table
+
+Revision ID: 0000_create_posts
+Revises:
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0000_create_posts"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "posts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False, unique=True),
+        sa.Column("content", sa.Text()),
+    )
+    op.create_index("ix_posts_id", "posts", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_id", table_name="posts")
+    op.drop_table("posts")
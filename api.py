@@ -1,21 +1,40 @@
-from fastapi import FastAPI, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import os
+import time
+from contextlib import asynccontextmanager
+
+from typing import Optional
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from slowapi import Limiter
+from limits import parse as parse_limit
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import logging
 
-from .database import get_db
+from scraper.client import ScraperClient
+from scraper.config import ScraperConfig
+from scraper.metrics import CONTENT_TYPE, configure_metrics, metrics, pool_gauges
+
+from .database import get_db, engine, async_engine
 from .models import Post
+from .pagination import decode_cursor, encode_cursor, post_count_cache
+from .rate_limit import build_limiter
+from .response_cache import CachedBody, etag_matches, post_response_cache
 from .schemas import (
+    PostBulkCreate,
+    PostBulkResponse,
     PostCreate,
     PostResponse,
     PostUpdate,
     PaginationResponse,
+    PostSummary,
+    PostSearchResponse,
 )
 from .routers import scraper_router
+from .services.post_service import bulk_upsert_posts
 
 # =========================================================
 # Logging Configuration
@@ -28,6 +47,28 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# =========================================================
+# Lifespan (shared HTTP client)
+# =========================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_metrics(ScraperConfig())
+    client = await ScraperClient.from_config(ScraperConfig()).open()
+    app.state.scraper_client = client
+    pool_gauges(client.pool_stats)
+    metrics.gauge("db_pool_checked_out", "Database connections in use.", engine.pool.checkedout)
+    metrics.gauge("db_pool_size", "Database connection pool size.", engine.pool.size)
+    logger.info("Application started successfully.")
+
+    try:
+        yield
+    finally:
+        await client.aclose()
+        await async_engine.dispose()
+        logger.info("Application shut down.")
+
+
 # =========================================================
 # FastAPI App
 # =========================================================
@@ -36,13 +77,15 @@ app = FastAPI(
     title="Blog Scraper API",
     version="1.0.0",
     description="Production-ready Blog Scraper Backend with PostgreSQL",
+    lifespan=lifespan,
 )
 
 # =========================================================
 # Rate Limiting
 # =========================================================
 
-limiter = Limiter(key_func=get_remote_address)
+# Shared across workers when RATE_LIMIT_STORAGE_URI is set.
+limiter = build_limiter(get_remote_address)
 app.state.limiter = limiter
 
 
@@ -54,19 +97,74 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     )
 
 
+# Bulk writes are charged per row rather than per request.
+BULK_ROW_LIMIT = parse_limit(os.getenv("POSTS_BULK_ROW_LIMIT", "10000/minute"))
+
+
+def charge_rows(request: Request, rows: int) -> None:
+    """
+    Count `rows` against the caller's bulk row budget.
+    """
+    key = get_remote_address(request)
+    if limiter.limiter.hit(BULK_ROW_LIMIT, key, "posts:rows", cost=rows):
+        return
+
+    reset_at, _ = limiter.limiter.get_window_stats(BULK_ROW_LIMIT, key, "posts:rows")
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Rate limit exceeded. Slow down.",
+        headers={"Retry-After": str(max(1, int(reset_at - time.time())))},
+    )
+
+
 # =========================================================
-# Database Dependency
+# Column Projection
 # =========================================================
 
+POST_COLUMNS = {
+    "id": Post.id,
+    "title": Post.title,
+    "url": Post.url,
+    "content": Post.content,
+}
+
+
+def post_columns(fields: Optional[str]):
+    """
+    Map a `fields=` query value to columns; `id` is always included.
+    """
+    if not fields:
+        return list(POST_COLUMNS.values())
+
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - POST_COLUMNS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+
+    return [column for name, column in POST_COLUMNS.items() if name == "id" or name in names]
+
+
 # =========================================================
-# Startup Event
+# Response Caching
 # =========================================================
 
-@app.on_event("startup")
-def startup():
-    logger.info("Application started successfully.")
+def cached_response(request: Request, entry: CachedBody) -> Response:
+    """
+    Serve a cached body, or 304 when the client already holds it.
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
 
 
+# =========================================================
+# Database Dependency
+# =========================================================
+
 # =========================================================
 # Routers
 # =========================================================
@@ -82,6 +180,16 @@ def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", tags=["System"])
+def prometheus_metrics():
+    if not metrics.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Metrics are disabled",
+        )
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
 # =========================================================
 # Create Post
 # =========================================================
@@ -99,10 +207,13 @@ def create_post(
     db: Session = Depends(get_db),
 ):
     try:
-        new_post = Post(**post.model_dump())
+        new_post = Post(**post.model_dump(mode="json"))
         db.add(new_post)
-        db.commit()
+        with metrics.time("db_commit"):
+            db.commit()
         db.refresh(new_post)
+        post_response_cache.invalidate_lists()
+        post_count_cache.invalidate()
 
         logger.info(f"Post created with ID {new_post.id}")
         return new_post
@@ -116,6 +227,62 @@ def create_post(
         )
 
 
+# =========================================================
+# Bulk Create / Upsert Posts
+# =========================================================
+
+@app.post(
+    "/posts/bulk",
+    response_model=PostBulkResponse,
+    tags=["Posts"],
+)
+def create_posts_bulk(
+    request: Request,
+    payload: PostBulkCreate,
+    db: Session = Depends(get_db),
+):
+    """
+    Create up to 5000 posts in one transaction. Existing URLs are
+    skipped, or updated with `on_conflict=update`. Every item is
+    reported in `results`, in request order, and counts against the
+    per-row rate limit.
+    """
+    charge_rows(request, len(payload.items))
+
+    try:
+        results = bulk_upsert_posts(db, payload.items, payload.on_conflict)
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during create_posts_bulk: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error",
+        )
+
+    counts = {"created": 0, "updated": 0, "exists": 0, "duplicate": 0, "invalid": 0}
+    for item in results:
+        counts[item["status"]] += 1
+
+    if counts["updated"]:
+        post_response_cache.invalidate_posts(
+            item["id"] for item in results if item["status"] == "updated"
+        )
+    elif counts["created"]:
+        post_response_cache.invalidate_lists()
+    if counts["created"]:
+        post_count_cache.invalidate()
+
+    logger.info(f"Bulk post write | {counts}")
+    return {
+        "total": len(results),
+        "created": counts["created"],
+        "updated": counts["updated"],
+        "existing": counts["exists"],
+        "duplicate": counts["duplicate"],
+        "invalid": counts["invalid"],
+        "results": results,
+    }
+
+
 # =========================================================
 # Get All Posts (Pagination)
 # =========================================================
@@ -123,23 +290,80 @@ def create_post(
 @app.get(
     "/posts",
     response_model=PaginationResponse,
+    response_model_exclude_unset=True,
     tags=["Posts"],
 )
 def get_posts(
-    skip: int = 0,
-    limit: int = 10,
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1),
+    after_id: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    fields: Optional[str] = Query(None, description="Comma-separated columns, e.g. title,url"),
     db: Session = Depends(get_db),
 ):
+    """
+    List posts ordered by id.
+
+    Only the columns named in `fields` are loaded (default: all), as
+    plain rows rather than ORM objects.
+
+    Offset mode uses `skip`. Cursor mode (`cursor` from a previous
+    `next_cursor`, or a raw `after_id`) seeks on the primary key, so
+    deep pages cost the same as the first one.
+
+    Responses are served from the post response cache when possible;
+    any write to posts invalidates the cached pages.
+    """
     try:
-        total = db.query(Post).count()
-        posts = db.query(Post).offset(skip).limit(limit).all()
+        if cursor is not None:
+            after_id = decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-        return {
-            "total": total,
+    columns = post_columns(fields)
+
+    generation = post_response_cache.generation()
+    key = post_response_cache.list_key(
+        generation,
+        skip=skip,
+        limit=limit,
+        after_id=after_id,
+        include_total=include_total,
+        fields=fields,
+    )
+    cached = post_response_cache.get(key)
+    if cached:
+        return cached_response(request, cached)
+
+    try:
+        query = select(*columns).order_by(Post.id)
+
+        if after_id is not None:
+            query = query.where(Post.id > after_id).limit(limit + 1)
+            posts = [dict(row) for row in db.execute(query).mappings()]
+            next_cursor = (
+                encode_cursor(posts[limit - 1]["id"]) if len(posts) > limit else None
+            )
+            posts = posts[:limit]
+            skip = 0
+        else:
+            query = query.offset(skip).limit(limit)
+            posts = [dict(row) for row in db.execute(query).mappings()]
+            next_cursor = encode_cursor(posts[-1]["id"]) if len(posts) == limit else None
+
+        page = {
             "skip": skip,
             "limit": limit,
+            "next_cursor": next_cursor,
             "data": posts,
         }
+        if include_total:
+            page["total"] = post_count_cache.get(db)
 
     except SQLAlchemyError as e:
         logger.error(f"Database error during get_posts: {e}")
@@ -148,6 +372,61 @@ def get_posts(
             detail="Database error",
         )
 
+    payload = PaginationResponse.model_validate(page).model_dump(mode="json", exclude_unset=True)
+    return cached_response(request, post_response_cache.set(key, payload))
+
+
+# =========================================================
+# Full-Text Search
+# =========================================================
+
+@app.get(
+    "/posts/search",
+    response_model=PostSearchResponse,
+    tags=["Posts"],
+)
+def search_posts(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0, le=1000),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Ranked full-text search over post titles and content.
+    Matches come from the GIN index on `posts.search_vector`.
+    """
+    query = func.websearch_to_tsquery("english", q)
+    rank = func.ts_rank_cd(Post.search_vector, query).label("rank")
+    headline = func.ts_headline(
+        "english",
+        func.coalesce(Post.content, Post.title),
+        query,
+        "MaxFragments=2, MaxWords=20, MinWords=5",
+    ).label("headline")
+
+    try:
+        rows = db.execute(
+            select(Post.id, Post.title, Post.url, rank, headline)
+            .where(Post.search_vector.op("@@")(query))
+            .order_by(rank.desc(), Post.id)
+            .offset(skip)
+            .limit(limit)
+        ).mappings()
+
+        return {
+            "query": q,
+            "skip": skip,
+            "limit": limit,
+            "data": [dict(row) for row in rows],
+        }
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during search_posts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error",
+        )
+
 
 # =========================================================
 # Get Single Post
@@ -155,11 +434,28 @@ def get_posts(
 
 @app.get(
     "/posts/{post_id}",
-    response_model=PostResponse,
+    response_model=PostSummary,
+    response_model_exclude_unset=True,
     tags=["Posts"],
 )
-def get_post(post_id: int, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
+def get_post(
+    request: Request,
+    post_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated columns, e.g. title,url"),
+    db: Session = Depends(get_db),
+):
+    columns = post_columns(fields)
+
+    version = post_response_cache.version(post_id)
+    key = post_response_cache.item_key(post_id, version, fields)
+    cached = post_response_cache.get(key)
+    if cached:
+        return cached_response(request, cached)
+
+    row = db.execute(
+        select(*columns).where(Post.id == post_id)
+    ).mappings().first()
+    post = dict(row) if row else None
 
     if not post:
         raise HTTPException(
@@ -167,7 +463,8 @@ def get_post(post_id: int, db: Session = Depends(get_db)):
             detail="Post not found",
         )
 
-    return post
+    payload = PostSummary.model_validate(post).model_dump(mode="json", exclude_unset=True)
+    return cached_response(request, post_response_cache.set(key, payload))
 
 
 # =========================================================
@@ -198,8 +495,10 @@ def update_post(
         setattr(post, key, value)
 
     try:
-        db.commit()
+        with metrics.time("db_commit"):
+            db.commit()
         db.refresh(post)
+        post_response_cache.invalidate_post(post_id)
         logger.info(f"Post {post_id} updated")
         return post
 
@@ -232,7 +531,10 @@ def delete_post(post_id: int, db: Session = Depends(get_db)):
 
     try:
         db.delete(post)
-        db.commit()
+        with metrics.time("db_commit"):
+            db.commit()
+        post_response_cache.invalidate_post(post_id)
+        post_count_cache.invalidate()
         logger.info(f"Post {post_id} deleted")
         return
 
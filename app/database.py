@@ -1,11 +1,54 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
+from typing import Any, Dict, Mapping
  
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+psycopg2://postgres:postgres@db:5432/scraper")
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("+psycopg2", "+asyncpg"),
+)
+
+
+def _env_int(environ: Mapping[str, str], name: str, default: int, minimum: int) -> int:
+    raw = environ.get(name, str(default))
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}.") from None
+    if value < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {value}.")
+    return value
+
+
+def pool_options(environ: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    """
+    Connection pool settings shared by the sync and async engines,
+    read from the DB_POOL_* / DB_MAX_OVERFLOW variables.
+    Raises ValueError for malformed values.
+    """
+    return {
+        "pool_size": _env_int(environ, "DB_POOL_SIZE", 5, 1),
+        "max_overflow": _env_int(environ, "DB_MAX_OVERFLOW", 10, 0),
+        "pool_pre_ping": environ.get("DB_POOL_PRE_PING", "true").lower() in {"1", "true", "yes"},
+        # -1 disables recycling
+        "pool_recycle": _env_int(environ, "DB_POOL_RECYCLE", 1800, -1),
+    }
+
+
+POOL_OPTIONS = pool_options()
  
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_OPTIONS)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
  
 Base = declarative_base()
 
@@ -14,4 +57,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
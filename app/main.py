@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+from dataclasses import asdict
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+import httpx
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from scraper.cache import ParsedPageMemo, build_response_cache
 from scraper.config import ScraperConfig
+from scraper.executor import ParseExecutor
 from scraper.client import ScraperClient
+from scraper.fingerprint import FingerprintStore, build_fingerprint_store
+from scraper.jobs import CrawlWorker, JobStore, build_job_store
+from scraper.metrics import CONTENT_TYPE, configure_metrics, pool_gauges
+from scraper.ratelimit import HostRateLimiter
 from scraper.service import ScraperService
 
 
@@ -22,6 +33,63 @@ logging.basicConfig(
 
 logger = logging.getLogger("ScraperAPI")
 
+# Buffered responses hold every record in memory; streamed ones do not.
+MAX_BUFFERED_LIMIT = 100
+MAX_STREAM_LIMIT = 10_000
+MAX_JOB_PAGES = 100_000
+
+
+# ==========================================
+# Lifespan (shared HTTP client)
+# ==========================================
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    config = ScraperConfig()
+    app.state.metrics = configure_metrics(config)
+    cache = build_response_cache(config)
+    client = await ScraperClient.from_config(config, cache=cache).open()
+    app.state.scraper_client = client
+    # One limiter for all requests, so per-host pacing and backoff
+    # carry over between scrapes.
+    app.state.rate_limiter = HostRateLimiter.from_delay(config.delay, config=config)
+    pool_gauges(client.pool_stats)
+    app.state.parse_memo = ParsedPageMemo() if cache else None
+    app.state.parse_executor = ParseExecutor.from_config(config)
+    app.state.fingerprints = build_fingerprint_store(config)
+    # Opened on first use unless the embedded worker needs it now, so
+    # an API that never runs crawl jobs does not create their database.
+    app.state.config = config
+    app.state.job_store = build_job_store(config) if config.job_embedded_worker else None
+    logger.info(f"Shared scraper client opened | {client.pool_stats()}")
+
+    stop_worker = asyncio.Event()
+    worker_task = None
+    if config.job_embedded_worker:
+        worker = CrawlWorker(
+            app.state.job_store,
+            client,
+            concurrency=config.job_worker_concurrency,
+            parser_engine=config.parser_engine,
+        )
+        worker_task = asyncio.create_task(worker.run(stop_worker))
+
+    try:
+        yield
+    finally:
+        stop_worker.set()
+        if worker_task:
+            await worker_task
+        if app.state.job_store:
+            await app.state.job_store.close()
+        await client.aclose()
+        if cache:
+            await cache.close()
+        app.state.parse_executor.close()
+        if app.state.fingerprints:
+            await app.state.fingerprints.close()
+        logger.info("Shared scraper client closed.")
+
 
 # ==========================================
 # FastAPI Application
@@ -31,6 +99,7 @@ app = FastAPI(
     title="Blog Scraper API",
     version="1.0.0",
     description="Professional Modular Web Scraper System",
+    lifespan=lifespan,
 )
 
 
@@ -38,10 +107,28 @@ app = FastAPI(
 # Dependency Factory
 # ==========================================
 
-def get_scraper_service(delay: float) -> ScraperService:
+def get_scraper_service(
+    client: ScraperClient,
+    delay: float,
+    parse_memo: Optional[ParsedPageMemo] = None,
+    parse_executor: Optional[ParseExecutor] = None,
+    fingerprints: Optional[FingerprintStore] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+) -> ScraperService:
     config = ScraperConfig(delay=delay)
-    client = ScraperClient(config.base_url)
-    return ScraperService(client, config.delay)
+    # The shared limiter adapts each host's rate across requests; the
+    # service still spaces this request's pages at least `delay` apart.
+    if rate_limiter is not None:
+        rate_limiter.seed(httpx.URL(client.base_url).host, config.delay)
+    return ScraperService(
+        client,
+        config.delay,
+        parse_memo=parse_memo,
+        parser_engine=config.parser_engine,
+        parse_executor=parse_executor,
+        rate_limiter=rate_limiter,
+        fingerprints=fingerprints,
+    )
 
 
 # ==========================================
@@ -53,26 +140,124 @@ def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/stats/pool", tags=["System"])
+def pool_stats(request: Request) -> Dict[str, Any]:
+    return request.app.state.scraper_client.pool_stats()
+
+
+@app.get("/metrics", tags=["System"])
+def prometheus_metrics(request: Request) -> Response:
+    """
+    Per-stage timings and counters in the Prometheus text format.
+    Enable with SCRAPER_METRICS_ENABLED=true.
+    """
+
+    metrics = request.app.state.metrics
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
 # ==========================================
 # Scrape Endpoint
 # ==========================================
 
+def ndjson_line(payload: Dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def stream_ndjson(
+    service: ScraperService,
+    limit: int,
+) -> AsyncIterator[bytes]:
+    """
+    Yield scraped records as newline-delimited JSON.
+    Each record is flushed as soon as its page is parsed.
+
+    The last line is a summary, `{"done": true, "records": n,
+    "failed_pages": [...]}`, or `{"error": ..., "records": n, ...}` if
+    scraping failed midway. A stream without one was cut off.
+    """
+
+    count = 0
+
+    async with contextlib.aclosing(service.iter_records(limit)) as records:
+        try:
+            async for record in records:
+                count += 1
+                yield ndjson_line(record)
+
+        except Exception:
+            # Headers are already sent; report the failure in-band.
+            logger.exception("Streaming scrape failed.")
+            yield ndjson_line({
+                "error": "Internal scraping error.",
+                "records": count,
+                "failed_pages": [asdict(failure) for failure in service.failures],
+            })
+            return
+
+    logger.info(f"Scrape stream completed | records={count}")
+    yield ndjson_line({
+        "done": True,
+        "records": count,
+        "failed_pages": [asdict(failure) for failure in service.failures],
+    })
+
+
 @app.get("/scrape", tags=["Scraper"])
-def scrape_posts(
-    limit: int = Query(20, ge=1, le=100),
+async def scrape_posts(
+    request: Request,
+    limit: int = Query(20, ge=1, le=MAX_STREAM_LIMIT),
     delay: float = Query(1.0, ge=0.0, le=10.0),
-) -> JSONResponse:
+    stream: bool = Query(False),
+    incremental: bool = Query(False),
+):
     """
     Scrape blog posts and return collected data.
+    With `stream=true` records are sent as NDJSON while scraping.
+    With `incremental=true` only records that are new or changed since
+    the previous incremental scrape are returned.
     """
 
-    logger.info(f"Scrape request received | limit={limit}, delay={delay}")
+    logger.info(
+        f"Scrape request received | limit={limit}, delay={delay}, "
+        f"stream={stream}, incremental={incremental}"
+    )
+
+    fingerprints = request.app.state.fingerprints
+    if incremental and fingerprints is None:
+        raise HTTPException(
+            status_code=422,
+            detail="incremental=true requires SCRAPER_FINGERPRINT_BACKEND.",
+        )
+
+    if not stream and limit > MAX_BUFFERED_LIMIT:
+        raise HTTPException(
+            status_code=422,
+            detail=f"limit above {MAX_BUFFERED_LIMIT} requires stream=true.",
+        )
 
     try:
-        service = get_scraper_service(delay)
-        data: List[Dict[str, Any]] = service.scrape(limit)
+        service = get_scraper_service(
+            request.app.state.scraper_client,
+            delay,
+            request.app.state.parse_memo,
+            request.app.state.parse_executor,
+            fingerprints if incremental else None,
+            request.app.state.rate_limiter,
+        )
+
+        if stream:
+            return StreamingResponse(
+                stream_ndjson(service, limit),
+                media_type="application/x-ndjson",
+            )
+
+        result = await service.scrape_result(limit)
+        data: List[Dict[str, Any]] = result.records
 
-        if not data:
+        if not data and result.delta is None:
             logger.warning("No data collected.")
             return JSONResponse(
                 status_code=204,
@@ -85,6 +270,8 @@ def scrape_posts(
             status_code=200,
             content={
                 "total_records": len(data),
+                "failed_pages": [asdict(failure) for failure in result.failures],
+                **({"delta": asdict(result.delta)} if result.delta else {}),
                 "data": data,
             },
         )
@@ -94,4 +281,77 @@ def scrape_posts(
         raise HTTPException(
             status_code=500,
             detail="Internal scraping error.",
-        )
\ No newline at end of file
+        )
+
+
+# ==========================================
+# Crawl Jobs
+# ==========================================
+
+def get_job_store(request: Request) -> JobStore:
+    state = request.app.state
+    if state.job_store is None:
+        state.job_store = build_job_store(state.config)
+    return state.job_store
+
+
+async def get_job_or_404(request: Request, job_id: int):
+    job = await get_job_store(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.post("/jobs", status_code=202, tags=["Jobs"])
+async def submit_job(
+    request: Request,
+    pages: int = Query(..., ge=1, le=MAX_JOB_PAGES),
+    delay: float = Query(1.0, ge=0.0, le=10.0),
+    lookahead: int = Query(10, ge=1, le=100),
+) -> Dict[str, Any]:
+    """
+    Queue a durable crawl of up to `pages` pages.
+    Progress is checkpointed per page and survives restarts.
+    """
+
+    job = await get_job_store(request).submit(pages, delay, lookahead)
+    logger.info(f"Crawl job {job.id} submitted | pages={pages}, delay={delay}")
+    return asdict(job)
+
+
+@app.get("/jobs/{job_id}", tags=["Jobs"])
+async def get_job(request: Request, job_id: int) -> Dict[str, Any]:
+    return asdict(await get_job_or_404(request, job_id))
+
+
+@app.post("/jobs/{job_id}/cancel", tags=["Jobs"])
+async def cancel_job(request: Request, job_id: int) -> Dict[str, Any]:
+    await get_job_or_404(request, job_id)
+    job = await get_job_store(request).cancel(job_id)
+    logger.info(f"Crawl job {job_id} cancelled")
+    return asdict(job)
+
+
+@app.get("/jobs/{job_id}/records", tags=["Jobs"])
+async def get_job_records(
+    request: Request,
+    job_id: int,
+    cursor: Optional[str] = Query(None, pattern=r"^\d+:\d+$"),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Dict[str, Any]:
+    """
+    Records collected so far, in page order.
+    Pass `next_cursor` back as `cursor` for the next batch.
+    """
+
+    await get_job_or_404(request, job_id)
+
+    after = tuple(int(part) for part in cursor.split(":")) if cursor else None
+    records = await get_job_store(request).records(job_id, after, limit)
+
+    next_cursor = (
+        f"{records[-1]['page']}:{records[-1]['position']}"
+        if len(records) == limit
+        else None
+    )
+    return {"job_id": job_id, "next_cursor": next_cursor, "data": records}
@@ -1,10 +1,24 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Computed, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from .database import Base
 
+# Title matches rank above content matches.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
 class Post(Base):
     __tablename__ = "posts"
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     url = Column(String, nullable=False, unique=True)
-    content = Column(Text)
\ No newline at end of file
+    content = Column(Text)
+    # Deferred: only /posts/search reads it, so ORM loads skip it.
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
+    __table_args__ = (
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
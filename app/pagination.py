@@ -0,0 +1,99 @@
+import base64
+import binascii
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from .models import Post
+
+
+# =========================================================
+# Opaque Cursors
+# =========================================================
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by `encode_cursor`.
+    Raises ValueError for malformed cursors.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded).decode().partition(":")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if prefix != "id" or not value.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(value)
+
+
+# =========================================================
+# Cached Row Count
+# =========================================================
+
+class PostCountCache:
+    """
+    Periodically refreshed row count for `posts`.
+
+    On PostgreSQL the planner estimate (`pg_class.reltuples`) is used,
+    which costs O(1) instead of a full `COUNT(*)` scan. Other databases,
+    or tables that were never analyzed, fall back to an exact count.
+
+    One caller refreshes an expired count at a time, without holding
+    the lock; meanwhile the others are served the previous value.
+    """
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        self.ttl = ttl
+        self._value: Optional[int] = None
+        self._refreshed_at = 0.0
+        self._loading = False
+        # Bumped by `invalidate`, so a count read before a write is dropped.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _load(self, db: Session) -> int:
+        if db.get_bind().dialect.name == "postgresql":
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+                {"table": Post.__tablename__},
+            ).scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        return db.query(func.count(Post.id)).scalar()
+
+    def get(self, db: Session) -> int:
+        with self._lock:
+            fresh = time.monotonic() - self._refreshed_at <= self.ttl
+            if self._value is not None and (fresh or self._loading):
+                return self._value
+            self._loading = True
+            generation = self._generation
+
+        try:
+            value = self._load(db)
+        finally:
+            with self._lock:
+                self._loading = False
+
+        with self._lock:
+            if self._generation == generation:
+                self._value = value
+                self._refreshed_at = time.monotonic()
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self._generation += 1
+
+
+post_count_cache = PostCountCache()
@@ -0,0 +1,297 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from math import floor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+from slowapi import Limiter
+
+
+def _window_ttls(now: float, expiry: int) -> Tuple[float, float]:
+    """
+    Seconds left of the previous and current windows at `now`; the
+    previous window's count is weighted by its share of the remainder.
+    """
+    previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+    current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+    return previous_ttl, current_ttl
+
+
+# =========================================================
+# Storages
+# =========================================================
+# Both register a `limits` storage scheme, so slowapi picks them up
+# from `storage_uri`. Each supports the fixed-window and the
+# sliding-window-counter strategies; the latter keeps two counters per
+# key, so a check is O(1) however many requests the window holds.
+
+class BoundedMemoryStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    In-process counters capped at `max_keys`. The least recently used
+    counter is evicted first, which is an expired or the most idle
+    client's; an evicted client simply starts a fresh window.
+
+    Like `memory://`, each worker process keeps its own budget.
+    """
+
+    STORAGE_SCHEME = ["bounded-memory"]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        max_keys: int = 100_000,
+        **options: Any,
+    ) -> None:
+        max_keys = int(max_keys)
+        if max_keys <= 0:
+            raise ValueError("max_keys must be greater than 0.")
+        self.max_keys = max_keys
+        # key -> [count, expires at]
+        self._counters: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    @property
+    def base_exceptions(self) -> type:
+        return ValueError
+
+    def _entry(self, key: str, now: float) -> Optional[List[float]]:
+        entry = self._counters.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._counters[key]
+            return None
+        self._counters.move_to_end(key)
+        return entry
+
+    def _incr(self, key: str, expiry: float, amount: int, now: float) -> int:
+        entry = self._entry(key, now)
+        if entry is None:
+            entry = self._counters[key] = [0, now + expiry]
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+        entry[0] += amount
+        return int(entry[0])
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        with self._lock:
+            return self._incr(key, expiry, amount, time.time())
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            entry = self._entry(key, time.time())
+            return int(entry[0]) if entry else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            entry = self._entry(key, now)
+            return entry[1] if entry else now
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            count = len(self._counters)
+            self._counters.clear()
+            return count
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_ttl, _ = _window_ttls(now, expiry)
+
+        # Check and increment under one lock: no over-admission.
+        with self._lock:
+            previous = self._entry(previous_key, now)
+            current = self._entry(current_key, now)
+            weighted = (previous[0] * previous_ttl / expiry if previous else 0) + (
+                current[0] if current else 0
+            )
+            if floor(weighted) + amount > limit:
+                return False
+            self._incr(current_key, 2 * expiry, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_ttl, current_ttl = _window_ttls(now, expiry)
+
+        with self._lock:
+            previous = self._entry(previous_key, now)
+            current = self._entry(current_key, now)
+
+        previous_count = int(previous[0]) if previous else 0
+        current_count = int(current[0]) if current else 0
+        return previous_count, previous_ttl if previous_count else 0.0, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        with self._lock:
+            self._counters.pop(previous_key, None)
+            self._counters.pop(current_key, None)
+
+
+class SharedCounterStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Counters in Redis, shared by every API worker and host.
+
+    Works with any client exposing the redis-py `get`, `mget`,
+    `set(nx=, px=)`, `incrby`, `decrby`, `pttl`, `delete` and
+    `pipeline` methods, without server-side scripts. An admitted hit
+    costs one round trip: the current window is incremented first and
+    only decremented again if that pushed it over the limit.
+
+    Window boundaries follow each host's clock, so hosts should be
+    NTP-synchronised.
+    """
+
+    STORAGE_SCHEME = ["shared-redis", "shared-rediss"]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        client: Any = None,
+        prefix: str = "ratelimit:",
+        **options: Any,
+    ) -> None:
+        if client is None:
+            client = self._connect(uri, **options)
+        self.client = client
+        self.prefix = prefix
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @staticmethod
+    def _connect(uri: Optional[str], **options: Any) -> Any:
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The shared rate limiter storage requires redis. Install with: pip install redis"
+            ) from e
+        if not uri:
+            raise ValueError("A shared-redis:// URI is required without a client.")
+        return redis.Redis.from_url(uri.replace("shared-", "", 1), **options)
+
+    @property
+    def base_exceptions(self) -> Any:
+        try:
+            import redis
+        except ImportError:
+            return OSError
+        return (redis.RedisError, OSError)
+
+    def _increment(self, pipe: Any, key: str, expiry: float, amount: int) -> None:
+        # NX keeps the expiry set by the first hit of the window.
+        pipe.set(key, 0, nx=True, px=max(1, int(expiry * 1000)))
+        pipe.incrby(key, amount)
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        pipe = self.client.pipeline()
+        self._increment(pipe, self.prefix + key, expiry, amount)
+        return int(pipe.execute()[-1])
+
+    def get(self, key: str) -> int:
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def get_expiry(self, key: str) -> float:
+        ttl = self.client.pttl(self.prefix + key)
+        return time.time() + max(0, ttl) / 1000
+
+    def check(self) -> bool:
+        try:
+            return bool(self.client.ping())
+        except Exception:
+            return False
+
+    def reset(self) -> Optional[int]:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+        return len(keys)
+
+    def clear(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+
+        now = time.time()
+        previous_key, current_key = (
+            self.prefix + name for name in self.sliding_window_keys(key, expiry, now)
+        )
+        previous_ttl, _ = _window_ttls(now, expiry)
+
+        pipe = self.client.pipeline()
+        pipe.get(previous_key)
+        self._increment(pipe, current_key, 2 * expiry, amount)
+        previous, _, current = pipe.execute()
+
+        weighted = int(previous or 0) * previous_ttl / expiry + int(current)
+        if floor(weighted) > limit:
+            # Concurrent hits may all see each other's increments and
+            # all back off: the limit errs towards rejecting.
+            self.client.decrby(current_key, amount)
+            return False
+        return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_ttl, current_ttl = _window_ttls(now, expiry)
+
+        previous, current = self.client.mget(self.prefix + previous_key, self.prefix + current_key)
+        previous_count, current_count = int(previous or 0), int(current or 0)
+        return previous_count, previous_ttl if previous_count else 0.0, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.client.delete(self.prefix + previous_key, self.prefix + current_key)
+
+
+# =========================================================
+# Limiter
+# =========================================================
+
+def build_limiter(key_func: Callable[..., str]) -> Limiter:
+    """
+    Limiter on RATE_LIMIT_STORAGE_URI (e.g. shared-redis://host:6379/0,
+    or any `limits` storage URI) when set, on a bounded in-process store
+    of RATE_LIMIT_MAX_KEYS counters otherwise.
+    """
+    uri = os.getenv("RATE_LIMIT_STORAGE_URI")
+    options: Dict[str, Any] = {}
+
+    if not uri:
+        uri = "bounded-memory://"
+        options["max_keys"] = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+
+    return Limiter(
+        key_func=key_func,
+        storage_uri=uri,
+        storage_options=options,
+        strategy=os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter"),
+    )
@@ -0,0 +1,267 @@
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+
+# =========================================================
+# Backends
+# =========================================================
+
+class CacheBackend(ABC):
+    """
+    Byte store behind the response cache. Implementations must be
+    safe to call from FastAPI's worker threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """
+        Store `value` only if `key` is absent; True if it was stored.
+        """
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU with per-entry TTL. Each worker process has its
+    own copy, so invalidations only reach the process that made them.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._set(key, value, ttl)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._get(key) is not None:
+                return False
+            self._set(key, value, ttl)
+            return True
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared backend for running several API workers or hosts.
+    Works with any client exposing the redis-py `get`, `set(px=, nx=)`
+    and `delete` methods.
+    """
+
+    def __init__(self, client: Any, prefix: str = "blog:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "blog:") -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The shared response cache requires redis. Install with: pip install redis"
+            ) from e
+        return cls(redis.Redis.from_url(url), prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(
+            self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)), nx=True)
+        )
+
+
+# =========================================================
+# Post Response Cache
+# =========================================================
+
+@dataclass
+class CachedBody:
+    body: bytes
+    etag: str
+
+
+class PostResponseCache:
+    """
+    Read-through cache of serialized GET /posts and GET /posts/{id}
+    responses, each stored with its ETag.
+
+    Keys embed a version token read before the database is queried:
+    the post's own for single posts, a generation replaced by every
+    write for list pages. A write replaces the tokens, which orphans
+    the old entries at once; the orphans age out through TTL / LRU
+    eviction. A response built from rows read before a concurrent write
+    is stored under the old token, so no reader ever sees it, and
+    storing needs no separate check.
+
+    Tokens are random, so they never repeat: they are cached like any
+    entry, for `version_ttl` seconds, and one that is evicted is simply
+    replaced by a fresh token on the next read.
+    """
+
+    GENERATION_KEY = "posts:generation"
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float = 30.0,
+        fields: Iterable[str] = ("title", "url", "content"),
+        version_ttl: Optional[float] = None,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+        self.backend = backend
+        self.ttl = ttl
+        # Outlive the entries keyed on a token, so they are not orphaned early.
+        self.version_ttl = version_ttl or 10 * ttl
+        self.fields = tuple(sorted(fields))
+
+    def _token(self, key: str) -> str:
+        token = self.backend.get(key)
+        while token is None:
+            fresh = secrets.token_hex(8).encode()
+            token = fresh if self.backend.add(key, fresh, self.version_ttl) else self.backend.get(key)
+        return token.decode()
+
+    def _bump(self, key: str) -> None:
+        self.backend.set(key, secrets.token_hex(8).encode(), self.version_ttl)
+
+    def generation(self) -> str:
+        return self._token(self.GENERATION_KEY)
+
+    def version(self, post_id: int) -> str:
+        return self._token(f"posts:version:{post_id}")
+
+    def fields_key(self, fields: Optional[str]) -> str:
+        """
+        Canonical form of a `fields=` value; "*" for all columns.
+        """
+        if not fields:
+            return "*"
+        names = {name.strip() for name in fields.split(",") if name.strip()} - {"id"}
+        if names >= set(self.fields):
+            return "*"
+        return ",".join(sorted(names))
+
+    def item_key(self, post_id: int, version: str, fields: Optional[str]) -> str:
+        return f"posts:item:{post_id}:{version}:{self.fields_key(fields)}"
+
+    def list_key(self, generation: str, **params: Any) -> str:
+        params["fields"] = self.fields_key(params.get("fields"))
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None))
+        return f"posts:list:{generation}:{query}"
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        etag, _, body = value.partition(b"\n")
+        return CachedBody(body, etag.decode())
+
+    def set(self, key: str, payload: Any) -> CachedBody:
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+        entry = CachedBody(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+        self.backend.set(key, entry.etag.encode() + b"\n" + body, self.ttl)
+        return entry
+
+    def invalidate_lists(self) -> None:
+        self._bump(self.GENERATION_KEY)
+
+    def invalidate_post(self, post_id: int) -> None:
+        self.invalidate_posts([post_id])
+
+    def invalidate_posts(self, post_ids: Iterable[int]) -> None:
+        for post_id in post_ids:
+            self._bump(f"posts:version:{post_id}")
+        self.invalidate_lists()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header value matches `etag`.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def build_post_response_cache() -> PostResponseCache:
+    """
+    Redis-backed when POSTS_CACHE_URL is set, in-process otherwise.
+    """
+    ttl = float(os.getenv("POSTS_CACHE_TTL", "30"))
+    url = os.getenv("POSTS_CACHE_URL")
+
+    if url:
+        backend: CacheBackend = RedisCacheBackend.from_url(url)
+    else:
+        backend = MemoryCacheBackend(int(os.getenv("POSTS_CACHE_MAX_ENTRIES", "10000")))
+
+    return PostResponseCache(backend, ttl=ttl)
+
+
+post_response_cache = build_post_response_cache()
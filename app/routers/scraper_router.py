@@ -1,11 +1,45 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..database import get_db
-from ..services.scraper_service import scrape_and_save
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from scraper.client import ScraperClient
+from ..database import get_async_db
+from ..schemas import BatchScrapeRequest, BatchScrapeResponse
+from ..services.scraper_service import scrape_and_save, scrape_and_save_many
 
 router = APIRouter(prefix="/scrape", tags=["Scraper"])
 
 
+def get_scraper_client(request: Request) -> ScraperClient:
+    """
+    Process-wide pooled client opened in the application lifespan.
+    """
+    return request.app.state.scraper_client
+
+
 @router.post("/")
-async def scrape(url: str, db: Session = Depends(get_db)):
-    return await scrape_and_save(url, db)
\ No newline at end of file
+async def scrape(
+    url: str,
+    db: AsyncSession = Depends(get_async_db),
+    client: ScraperClient = Depends(get_scraper_client),
+):
+    return await scrape_and_save(url, db, client)
+
+
+@router.post("/batch", response_model=BatchScrapeResponse)
+async def scrape_batch(
+    payload: BatchScrapeRequest,
+    db: AsyncSession = Depends(get_async_db),
+    client: ScraperClient = Depends(get_scraper_client),
+):
+    results = await scrape_and_save_many(payload.urls, db, client)
+
+    counts = {"created": 0, "exists": 0, "failed": 0}
+    for item in results:
+        counts[item["status"]] += 1
+
+    return {
+        "total": len(results),
+        "created": counts["created"],
+        "existing": counts["exists"],
+        "failed": counts["failed"],
+        "results": results,
+    }
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl, Field, ConfigDict
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Literal
 
 
 # =========================================================
@@ -48,12 +48,113 @@ class PostResponse(PostBase):
     id: int
 
 
+class PostSummary(BaseSchema):
+    """
+    Post restricted to the columns selected with `fields=`.
+    Unselected fields are omitted from the response.
+    """
+    id: int
+    title: Optional[str] = None
+    url: Optional[str] = None
+    content: Optional[str] = None
+
+
 # =========================================================
 # Pagination Schema
 # =========================================================
 
 class PaginationResponse(BaseSchema):
+    """
+    `total` is a cached estimate, left out with `include_total=false`.
+    `next_cursor` is set whenever the page is full, in offset mode too,
+    so a client can switch to keyset paging from any page.
+    """
+    total: Optional[int] = None
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = None
+    data: List[PostSummary]
+
+
+# =========================================================
+# Batch Scrape Schemas
+# =========================================================
+
+class BatchScrapeRequest(BaseSchema):
+    urls: List[str] = Field(..., min_length=1, max_length=10000)
+
+
+class BatchScrapeItem(BaseSchema):
+    """
+    Outcome for a single URL of a batch scrape.
+    """
+    url: str
+    status: Literal["created", "exists", "failed"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchScrapeResponse(BaseSchema):
     total: int
+    created: int
+    existing: int
+    failed: int
+    results: List[BatchScrapeItem]
+
+
+# =========================================================
+# Bulk Post Schemas
+# =========================================================
+
+MAX_BULK_POSTS = 5000
+
+
+class PostBulkCreate(BaseSchema):
+    """
+    Items are validated as `PostCreate` one by one, so an invalid
+    item is reported in the results instead of failing the batch.
+    `on_conflict` decides what happens to items whose URL exists.
+    """
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BULK_POSTS)
+    on_conflict: Literal["update", "ignore"] = "ignore"
+
+
+class PostBulkItem(BaseSchema):
+    """
+    Outcome for one item, in request order.
+    """
+    index: int
+    status: Literal["created", "updated", "exists", "duplicate", "invalid"]
+    id: Optional[int] = None
+    url: Optional[str] = None
+    errors: Optional[List[str]] = None
+
+
+class PostBulkResponse(BaseSchema):
+    total: int
+    created: int
+    updated: int
+    existing: int
+    duplicate: int
+    invalid: int
+    results: List[PostBulkItem]
+
+
+
+# =========================================================
+# Search Schemas
+# =========================================================
+
+class PostSearchHit(BaseSchema):
+    id: int
+    title: str
+    url: str
+    rank: float
+    headline: Optional[str] = None
+
+
+class PostSearchResponse(BaseSchema):
+    query: str
     skip: int
     limit: int
-    data: List[PostResponse]
\ No newline at end of file
+    data: List[PostSearchHit]
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import literal_column, null, select
+from sqlalchemy.orm import Session
+
+from scraper.metrics import metrics
+from ..models import Post
+from ..schemas import PostCreate
+from .scraper_service import INSERT_CHUNK_SIZE, upsert_insert
+
+
+def validation_errors(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'item'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+def bulk_upsert_posts(
+    db: Session,
+    items: List[Dict[str, Any]],
+    on_conflict: str = "ignore",
+) -> List[Dict[str, Any]]:
+    """
+    Validate and store many posts in one transaction.
+
+    Valid items are written with multi-row
+    `INSERT ... ON CONFLICT (url) DO UPDATE / DO NOTHING ... RETURNING`
+    statements of up to INSERT_CHUNK_SIZE rows. Returns one result per
+    item, in request order; a URL repeated within the batch is stored
+    once and its later occurrences are reported as duplicates.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    first_index: Dict[str, int] = {}
+    rows: List[Dict[str, Any]] = []
+
+    for index, item in enumerate(items):
+        try:
+            row = PostCreate.model_validate(item).model_dump(mode="json")
+        except ValidationError as e:
+            results[index] = {"index": index, "status": "invalid", "errors": validation_errors(e)}
+            continue
+
+        if row["url"] in first_index:
+            results[index] = {"index": index, "status": "duplicate", "url": row["url"]}
+            continue
+
+        first_index[row["url"]] = index
+        rows.append(row)
+
+    urls = list(first_index)
+    existing: Dict[str, int] = {}
+    for start in range(0, len(urls), INSERT_CHUNK_SIZE):
+        chunk = urls[start:start + INSERT_CHUNK_SIZE]
+        for post_id, url in db.execute(select(Post.id, Post.url).where(Post.url.in_(chunk))):
+            existing[url] = post_id
+
+    # On Postgres `xmax = 0` marks rows this statement inserted, which
+    # stays correct when a row appeared or vanished after the lookup.
+    insert = upsert_insert(db)
+    if db.get_bind().dialect.name == "postgresql":
+        inserted = literal_column("xmax = 0")
+    else:
+        inserted = null()
+
+    try:
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            stmt = insert(Post).values(rows[start:start + INSERT_CHUNK_SIZE])
+            if on_conflict == "update":
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Post.url],
+                    set_={"title": stmt.excluded.title, "content": stmt.excluded.content},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Post.url])
+
+            for post_id, url, created in db.execute(stmt.returning(Post.id, Post.url, inserted)):
+                index = first_index[url]
+                if created is None:
+                    created = url not in existing
+                status = "created" if created else "updated"
+                results[index] = {"index": index, "status": status, "id": post_id, "url": url}
+
+        with metrics.time("db_commit"):
+            db.commit()
+
+    except Exception:
+        db.rollback()
+        raise
+
+    # Rows skipped by DO NOTHING: known before, or inserted concurrently.
+    skipped = [url for url, index in first_index.items() if results[index] is None]
+    raced = [url for url in skipped if url not in existing]
+    if raced:
+        for post_id, url in db.execute(select(Post.id, Post.url).where(Post.url.in_(raced))):
+            existing[url] = post_id
+    for url in skipped:
+        index = first_index[url]
+        results[index] = {"index": index, "status": "exists", "id": existing.get(url), "url": url}
+
+    for result in results:
+        if result["status"] == "duplicate":
+            result["id"] = results[first_index[result["url"]]].get("id")
+
+    return results
@@ -1,20 +1,59 @@
+import asyncio
+from typing import Dict, List, Optional
+
 import httpx
-from bs4 import BeautifulSoup
-from sqlalchemy.orm import Session
+from bs4 import BeautifulSoup, SoupStrainer
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from scraper.client import ScraperClient
+from scraper.metrics import metrics
 from ..models import Post
+from ..pagination import post_count_cache
+from ..response_cache import post_response_cache
+
+# Postgres allows 65535 bind parameters per statement (3 per row).
+INSERT_CHUNK_SIZE = 5000
+
+BATCH_CONCURRENCY = 50
+
+# Only build a tree for <title>; the rest of the document is skipped.
+TITLE_ONLY = SoupStrainer("title")
+
+
+def is_absolute_http(url: str) -> bool:
+    try:
+        parsed = httpx.URL(url)
+    except httpx.InvalidURL:
+        return False
+    return parsed.scheme in {"http", "https"} and bool(parsed.host)
+
 
+def upsert_insert(db):
+    """
+    The dialect's `insert` construct, which supports ON CONFLICT:
+    PostgreSQL in production, SQLite for local runs and tests.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
 
-async def scrape_and_save(url: str, db: Session):
-    existing = db.query(Post).filter(Post.url == url).first()
+
+def extract_title(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser", parse_only=TITLE_ONLY)
+    title = soup.title.string if soup.title else None
+    return title.strip() if title and title.strip() else "No title found"
+
+
+async def scrape_and_save(url: str, db: AsyncSession, client: ScraperClient):
+    existing = await db.scalar(select(Post).where(Post.url == url))
     if existing:
         return existing
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, timeout=10)
-        response.raise_for_status()
+    response = await client.get(url)
+    response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    title = soup.title.string if soup.title else "No title found"
+    title = extract_title(response.text)
 
     post = Post(
         title=title,
@@ -23,7 +62,98 @@ async def scrape_and_save(url: str, db: Session):
     )
 
     db.add(post)
-    db.commit()
-    db.refresh(post)
+    with metrics.time("db_commit"):
+        await db.commit()
+    await db.refresh(post)
+    await asyncio.to_thread(post_response_cache.invalidate_lists)
+    post_count_cache.invalidate()
+
+    return post
+
+
+async def scrape_and_save_many(
+    urls: List[str],
+    db: AsyncSession,
+    client: ScraperClient,
+    concurrency: int = BATCH_CONCURRENCY,
+) -> List[Dict]:
+    """
+    Scrape many URLs at once.
+
+    Known URLs are found with one `WHERE url IN (...)` query, the rest
+    are fetched concurrently through the shared client and stored with
+    bulk `INSERT ... ON CONFLICT (url) DO NOTHING` statements in a
+    single transaction. Returns one status dict per unique URL.
+    """
+
+    unique = list(dict.fromkeys(urls))
+    results: Dict[str, Dict] = {}
+
+    rows = await db.execute(select(Post.id, Post.url).where(Post.url.in_(unique)))
+    for post_id, url in rows:
+        results[url] = {"url": url, "status": "exists", "id": post_id}
+
+    # Relative URLs would otherwise resolve against the client's base URL.
+    for url in unique:
+        if url not in results and not is_absolute_http(url):
+            results[url] = {
+                "url": url,
+                "status": "failed",
+                "error": "Invalid URL: expected an absolute http(s) URL",
+            }
+
+    misses = [url for url in unique if url not in results]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_title(url: str) -> str:
+        async with semaphore:
+            response = await client.get(url)
+        response.raise_for_status()
+        return extract_title(response.text)
+
+    titles = await asyncio.gather(
+        *(fetch_title(url) for url in misses),
+        return_exceptions=True,
+    )
+
+    new_rows = []
+    for url, title in zip(misses, titles):
+        if isinstance(title, Exception):
+            results[url] = {
+                "url": url,
+                "status": "failed",
+                "error": f"{type(title).__name__}: {title}",
+            }
+        else:
+            new_rows.append({"title": title, "url": url, "content": None})
+
+    try:
+        for start in range(0, len(new_rows), INSERT_CHUNK_SIZE):
+            chunk = new_rows[start:start + INSERT_CHUNK_SIZE]
+            stmt = (
+                upsert_insert(db)(Post)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=[Post.url])
+                .returning(Post.id, Post.url)
+            )
+            for post_id, url in await db.execute(stmt):
+                results[url] = {"url": url, "status": "created", "id": post_id}
+        with metrics.time("db_commit"):
+            await db.commit()
+
+    except Exception:
+        await db.rollback()
+        raise
+
+    if any(item["status"] == "created" for item in results.values()):
+        await asyncio.to_thread(post_response_cache.invalidate_lists)
+        post_count_cache.invalidate()
+
+    # Rows skipped by ON CONFLICT were inserted concurrently elsewhere.
+    raced = [row["url"] for row in new_rows if row["url"] not in results]
+    if raced:
+        rows = await db.execute(select(Post.id, Post.url).where(Post.url.in_(raced)))
+        for post_id, url in rows:
+            results[url] = {"url": url, "status": "exists", "id": post_id}
 
-    return post
\ No newline at end of file
+    return [results[url] for url in unique]
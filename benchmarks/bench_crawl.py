@@ -0,0 +1,89 @@
+"""
+Compare the legacy fixed-gather crawl with the adaptive crawl scheduler.
+
+Usage:
+    python -m benchmarks.bench_crawl
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List, Dict, Any
+
+import httpx
+
+from scraper.client import ScraperClient
+from scraper.service import ScraperService
+
+from .stub_site import StubQuoteSite
+
+
+BASE_URL = "http://stub.local"
+
+
+async def legacy_scrape(service: ScraperService, limit: int) -> List[Dict[str, Any]]:
+    """
+    The pre-scheduler strategy: guess the page count,
+    gather every page at once and truncate afterwards.
+    """
+
+    pages_needed = (limit // 10) + 2
+    collected: List[Dict[str, Any]] = []
+
+    async with service.client:
+        results = await asyncio.gather(
+            *(service._fetch_and_parse(page) for page in range(1, pages_needed + 1))
+        )
+
+    for parsed in results:
+        if parsed:
+            collected.extend(parsed.records)
+
+    return collected[:limit]
+
+
+async def run_case(strategy: str, limit: int, site: StubQuoteSite) -> Dict[str, Any]:
+    client = ScraperClient(BASE_URL, transport=httpx.ASGITransport(app=site))
+    service = ScraperService(client, delay=0.0)
+
+    start = time.perf_counter()
+    if strategy == "legacy":
+        records = await legacy_scrape(service, limit)
+    else:
+        records = await service.scrape(limit)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "limit": limit,
+        "records": len(records),
+        "requests": site.requests,
+        "seconds": round(elapsed, 4),
+    }
+
+
+async def main() -> None:
+    cases = [
+        # (limit, pages on site, quotes per page)
+        (20, 50, 10),
+        (95, 50, 10),
+        (200, 100, 10),
+        (200, 100, 7),
+        (500, 20, 10),
+    ]
+
+    print(f"{'strategy':<10}{'limit':>7}{'qpp':>5}{'records':>9}{'requests':>10}{'seconds':>10}")
+
+    for limit, pages, per_page in cases:
+        for strategy in ("legacy", "adaptive"):
+            site = StubQuoteSite(pages=pages, quotes_per_page=per_page, latency=0.02)
+            result = await run_case(strategy, limit, site)
+            print(
+                f"{result['strategy']:<10}{limit:>7}{per_page:>5}"
+                f"{result['records']:>9}{result['requests']:>10}{result['seconds']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
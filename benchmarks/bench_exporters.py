@@ -0,0 +1,111 @@
+"""
+Benchmark: write time, read time and on-disk size for every exporter.
+
+Usage:
+    python -m benchmarks.bench_exporters [records]
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from scraper.exporter import (
+    CSVExporter,
+    Exporter,
+    JSONExporter,
+    ParquetExporter,
+    SQLiteExporter,
+)
+
+
+def generate(count: int) -> Iterator[Dict[str, str]]:
+    for number in range(count):
+        yield {
+            "text": f"Quote number {number}: " + "words of wisdom " * 8,
+            "author": f"Author {number % 50}",
+            "tags": f"t{number % 7}, t{number % 3}",
+        }
+
+
+def size_of(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size
+
+
+def read_csv(path: Path) -> int:
+    with open(path, newline="", encoding="utf-8") as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+
+def read_json(path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+def read_ndjson(path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for line in f if json.loads(line))
+
+
+def read_sqlite(path: Path) -> int:
+    with sqlite3.connect(path) as conn:
+        return len(conn.execute("SELECT text, author, tags FROM quotes_view").fetchall())
+
+
+def read_parquet(path: Path) -> int:
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path).num_rows
+
+
+def cases(root: Path) -> List[Tuple[str, Callable[[], Exporter], Path, Callable[[Path], int]]]:
+    return [
+        ("csv", lambda: CSVExporter(str(root / "q.csv")), root / "q.csv", read_csv),
+        ("json", lambda: JSONExporter(str(root / "q.json")), root / "q.json", read_json),
+        ("ndjson", lambda: JSONExporter(str(root / "q.ndjson"), lines=True), root / "q.ndjson", read_ndjson),
+        ("sqlite", lambda: SQLiteExporter(str(root / "q.db"), chunk_size=1000), root / "q.db", read_sqlite),
+        ("sqlite-bulk", lambda: SQLiteExporter(str(root / "b.db"), chunk_size=5000, bulk=True), root / "b.db", read_sqlite),
+        ("parquet-zstd", lambda: ParquetExporter(str(root / "z.parquet")), root / "z.parquet", read_parquet),
+        ("parquet-snappy", lambda: ParquetExporter(str(root / "s.parquet"), compression="snappy"), root / "s.parquet", read_parquet),
+        ("parquet-hive", lambda: ParquetExporter(str(root / "h.parquet"), partition_by="author_initial"), root / "h.parquet", read_parquet),
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{count} records")
+    print(f"{'exporter':<16}{'size (KiB)':>12}{'write (s)':>12}{'read (s)':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, factory, path, reader in cases(Path(tmp)):
+            try:
+                exporter = factory()
+            except ImportError as e:
+                print(f"{name:<16}{'skipped':>12}  ({e})")
+                continue
+
+            start = time.perf_counter()
+            exporter.export(generate(count))
+            if isinstance(exporter, SQLiteExporter):
+                exporter.close()
+            write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            rows = reader(path)
+            read = time.perf_counter() - start
+
+            assert rows == count, f"{name} read back {rows} rows"
+            print(f"{name:<16}{size_of(path) / 1024:>12.0f}{write:>12.2f}{read:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Parsing throughput with the event loop, a thread pool and a process pool.
+
+Usage:
+    python -m benchmarks.bench_parse_executor [engine]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+
+from scraper.executor import ParseExecutor
+
+from .stub_site import StubQuoteSite
+
+
+async def run(kind: str, engine: str, pages: list[str]) -> float:
+    executor = ParseExecutor(kind=kind, batch_size=8)
+    try:
+        # Warm up pool workers so start-up cost is not measured.
+        await asyncio.gather(*(executor.parse(html, engine) for html in pages[:16]))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(executor.parse(html, engine) for html in pages))
+        return len(pages) / (time.perf_counter() - start)
+    finally:
+        executor.close()
+
+
+def main() -> None:
+    engine = sys.argv[1] if len(sys.argv) > 1 else "bs4"
+    site = StubQuoteSite(pages=400, quotes_per_page=10)
+    pages = [site.render_page(n) for n in range(1, site.pages + 1)]
+
+    print(f"engine={engine} pages={len(pages)} cpus={os.cpu_count()}")
+    print(f"{'executor':<10}{'pages/sec':>12}")
+
+    for kind in ("inline", "thread", "process"):
+        rate = asyncio.run(run(kind, engine, pages))
+        print(f"{kind:<10}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Micro-benchmark: pages/sec for every available parser engine.
+
+Usage:
+    python -m benchmarks.bench_parser
+"""
+
+from __future__ import annotations
+
+import time
+
+from scraper.parser import ENGINES, get_engine
+
+from .stub_site import StubQuoteSite
+
+
+def bench_engine(name: str, pages: list[str], rounds: int = 3) -> float:
+    engine = get_engine(name)
+    best = float("inf")
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for html in pages:
+            engine.parse_page(html)
+        best = min(best, time.perf_counter() - start)
+
+    return len(pages) / best
+
+
+def main() -> None:
+    site = StubQuoteSite(pages=200, quotes_per_page=10)
+    pages = [site.render_page(n) for n in range(1, site.pages + 1)]
+    baseline = None
+
+    print(f"{'engine':<12}{'pages/sec':>12}{'speedup':>10}")
+
+    for name in ENGINES:
+        try:
+            rate = bench_engine(name, pages)
+        except Exception as e:
+            print(f"{name:<12}{'skipped':>12}  ({e})")
+            continue
+
+        baseline = baseline or rate
+        print(f"{name:<12}{rate:>12.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
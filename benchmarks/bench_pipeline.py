@@ -0,0 +1,350 @@
+"""
+End-to-end benchmark: stub site → ScraperClient → ScraperService →
+QuoteParser → each exporter.
+
+Every exporter gets a fresh crawl of the same synthetic site. Reported
+per case: pages/sec, records/sec, p50/p95/p99 request latency as seen
+by the client (retries included), and peak RSS. Results can be saved
+as JSON and compared against an earlier run to catch regressions.
+
+Usage:
+    python -m benchmarks.bench_pipeline --pages 200 --latency 0.02 --jitter 0.01
+    python -m benchmarks.bench_pipeline --output base.json
+    python -m benchmarks.bench_pipeline --compare base.json --threshold 0.15
+    python -m benchmarks.bench_pipeline --http --exporters csv,sqlite-bulk
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from scraper.client import ScraperClient
+from scraper.exporter import (
+    CSVExporter,
+    Exporter,
+    JSONExporter,
+    ParquetExporter,
+    SQLiteExporter,
+)
+from scraper.metrics import metrics
+from scraper.ratelimit import HostRateLimiter
+from scraper.retry import RetryPolicy
+from scraper.service import ScraperService
+
+from .stub_site import StubQuoteSite
+
+
+BASE_URL = "http://stub.local"
+
+EXPORTERS: Dict[str, Callable[[Path], Exporter]] = {
+    "csv": lambda root: CSVExporter(str(root / "q.csv")),
+    "json": lambda root: JSONExporter(str(root / "q.json")),
+    "ndjson": lambda root: JSONExporter(str(root / "q.ndjson"), lines=True),
+    "sqlite": lambda root: SQLiteExporter(str(root / "q.db")),
+    "sqlite-bulk": lambda root: SQLiteExporter(str(root / "b.db"), chunk_size=5000, bulk=True),
+    "parquet": lambda root: ParquetExporter(str(root / "q.parquet")),
+}
+
+# Metrics compared between runs, and whether higher is better.
+COMPARED = {
+    "pages_per_sec": True,
+    "records_per_sec": True,
+    "latency_p50_ms": False,
+    "latency_p95_ms": False,
+    "latency_p99_ms": False,
+    "peak_rss_mib": False,
+}
+
+
+# ==============================
+# Measurement
+# ==============================
+
+class TimedTransport(httpx.AsyncBaseTransport):
+    """
+    Records the duration of every request sent through `inner`.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self.inner = inner
+        self.latencies: List[float] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        await response.aread()
+        self.latencies.append(time.perf_counter() - start)
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile; 0.0 for no values.
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(fraction * len(ordered) + 0.5))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def reset_peak_rss() -> None:
+    # Linux only: resets VmHWM so each case reports its own peak.
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mib() -> float:
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # Lifetime peak; KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+# ==============================
+# Stub Server
+# ==============================
+
+def serve_http(site: StubQuoteSite) -> Tuple[Any, threading.Thread, str]:
+    """
+    Serve `site` over real HTTP on a free local port.
+    """
+
+    import uvicorn
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(site, port=port, lifespan="off", log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+# ==============================
+# Cases
+# ==============================
+
+async def run_case(name: str, args: argparse.Namespace, root: Path) -> Dict[str, Any]:
+    exporter = EXPORTERS[name](root)
+    site = StubQuoteSite(
+        pages=args.pages,
+        quotes_per_page=args.quotes_per_page,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        text_words=args.text_words,
+        seed=args.seed,
+    )
+
+    server = None
+    if args.http:
+        server, thread, base_url = serve_http(site)
+        inner: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=args.concurrency)
+        )
+    else:
+        base_url, inner = BASE_URL, httpx.ASGITransport(app=site)
+
+    transport = TimedTransport(inner)
+    client = ScraperClient(
+        base_url,
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=4, base_delay=0.01, max_delay=0.2),
+    )
+    # Unthrottled until the first 503, then adaptive as in production.
+    limiter = HostRateLimiter(None, max_concurrency=args.concurrency, max_rate=args.max_rate)
+    service = ScraperService(
+        client, delay=0.0, max_concurrency=args.concurrency, rate_limiter=limiter
+    )
+    limit = args.pages * args.quotes_per_page
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    try:
+        records = await exporter.aexport(service.iter_records(limit))
+    finally:
+        if isinstance(exporter, SQLiteExporter):
+            exporter.close()
+        if server is not None:
+            server.should_exit = True
+            thread.join()
+    elapsed = time.perf_counter() - start
+
+    pages = args.pages - len(service.failures)
+    latencies = transport.latencies
+    return {
+        "exporter": name,
+        "seconds": round(elapsed, 4),
+        "pages": pages,
+        "records": records,
+        "requests": len(latencies),
+        "errors": site.errors,
+        "failed_pages": len(service.failures),
+        "mib_served": round(site.bytes_sent / (1024 * 1024), 2),
+        "pages_per_sec": round(pages / elapsed, 1),
+        "records_per_sec": round(records / elapsed, 1),
+        "latency_p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ==============================
+# Comparison
+# ==============================
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print each metric next to the baseline and return the regressions
+    worse than `threshold` (a fraction of the baseline value).
+    """
+
+    previous = {case["exporter"]: case for case in baseline["cases"]}
+    regressions = []
+
+    print(f"\nvs baseline {baseline.get('revision') or ''} ({baseline.get('timestamp', '?')})")
+    if baseline.get("params") != results["params"]:
+        print("warning: baseline was run with different parameters")
+    for case in results["cases"]:
+        before = previous.get(case["exporter"])
+        if before is None:
+            continue
+
+        for metric, higher_is_better in COMPARED.items():
+            old, new = before.get(metric), case.get(metric)
+            if not old or new is None:
+                continue
+
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = "  REGRESSION" if worse > threshold else ""
+            print(f"{case['exporter']:<14}{metric:<18}{old:>10}{new:>10}{change:>+9.1%}{flag}")
+            if flag:
+                regressions.append(f"{case['exporter']} {metric}")
+
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_pipeline")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--quotes-per-page", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.005, help="extra random seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--text-words", type=int, default=0, help="padding words per quote")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--max-rate", type=float, default=20.0, help="req/s ceiling once throttled")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--exporters", default=",".join(EXPORTERS), help="comma-separated")
+    parser.add_argument("--http", action="store_true", help="serve the stub over real HTTP")
+    parser.add_argument("--metrics", action="store_true", help="collect per-stage metrics while running")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed regression fraction")
+    return parser
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    names = [name.strip() for name in args.exporters.split(",") if name.strip()]
+    unknown = set(names) - set(EXPORTERS)
+    if unknown:
+        raise SystemExit(f"Unknown exporters: {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            key: value for key, value in vars(args).items()
+            if key not in {"output", "compare", "threshold", "exporters"}
+        },
+        "cases": [],
+    }
+
+    print(
+        f"{'exporter':<14}{'pages/s':>10}{'records/s':>12}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'RSS MiB':>9}{'failed':>8}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            try:
+                case = await run_case(name, args, Path(tmp))
+            except ImportError as e:
+                print(f"{name:<14}{'skipped':>10}  ({e})")
+                continue
+
+            results["cases"].append(case)
+            print(
+                f"{name:<14}{case['pages_per_sec']:>10}{case['records_per_sec']:>12}"
+                f"{case['latency_p50_ms']:>9}{case['latency_p95_ms']:>9}"
+                f"{case['latency_p99_ms']:>9}{case['peak_rss_mib']:>9}{case['failed_pages']:>8}"
+            )
+
+    return results
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    metrics.enabled = args.metrics
+    results = asyncio.run(run(args))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=4))
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
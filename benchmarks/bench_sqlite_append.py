@@ -0,0 +1,88 @@
+"""
+Benchmark: appending to a large SQLite export, old layout vs bulk mode.
+
+The old layout is the original `UNIQUE(text, author)` table with
+trigger-maintained FTS and default journaling; it is reproduced here
+only for comparison.
+
+Usage:
+    python -m benchmarks.bench_sqlite_append [existing_rows] [appended_rows]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from scraper.exporter import SQLiteExporter
+
+from .bench_exporters import generate
+
+
+def shifted(start: int, count: int) -> Iterator[Dict[str, str]]:
+    for number, record in enumerate(generate(start + count)):
+        if number >= start:
+            yield record
+
+
+def legacy_export(path: Path, records: List[Dict[str, str]]) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS quotes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                author TEXT NOT NULL,
+                tags TEXT,
+                UNIQUE(text, author)
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS quotes_fts USING fts5(
+                text, author, tags, content='quotes', content_rowid='id'
+            );
+            CREATE TRIGGER IF NOT EXISTS quotes_ai AFTER INSERT ON quotes BEGIN
+                INSERT INTO quotes_fts (rowid, text, author, tags)
+                VALUES (new.id, new.text, new.author, new.tags);
+            END;
+        """)
+        conn.executemany(
+            "INSERT OR IGNORE INTO quotes (text, author, tags) VALUES (:text, :author, :tags)",
+            records,
+        )
+
+
+def main() -> None:
+    existing = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    appended = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    print(f"{existing} existing rows, appending {appended} (half of them duplicates)")
+    print(f"{'layout':<10}{'append (s)':>12}{'size (MiB)':>12}")
+
+    # Half of the appended batch repeats rows that are already stored.
+    batch = list(shifted(existing - appended // 2, appended))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "legacy.db"
+        for start in range(0, existing, 50_000):
+            legacy_export(legacy, list(shifted(start, min(50_000, existing - start))))
+
+        begin = time.perf_counter()
+        legacy_export(legacy, batch)
+        elapsed = time.perf_counter() - begin
+        print(f"{'legacy':<10}{elapsed:>12.2f}{legacy.stat().st_size / 2**20:>12.1f}")
+
+        bulk = Path(tmp) / "bulk.db"
+        with SQLiteExporter(str(bulk), chunk_size=5000, bulk=True) as exporter:
+            exporter.export(generate(existing))
+
+            begin = time.perf_counter()
+            exporter.export(batch)
+            elapsed = time.perf_counter() - begin
+
+        print(f"{'bulk':<10}{elapsed:>12.2f}{bulk.stat().st_size / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from typing import Dict, Any
+
+
+PAGE_PATTERN = re.compile(r"^/page/(\d+)/?$")
+
+
+class StubQuoteSite:
+    """
+    Minimal ASGI app serving quotes.toscrape-style listing pages.
+    Used by benchmarks and tests through `httpx.ASGITransport`,
+    so no network access is required.
+
+    Each response is delayed by `latency` plus up to `jitter` seconds,
+    a fraction `error_rate` of requests fails with 503, and
+    `text_words` pads every quote to grow the page. Random choices
+    come from `seed`, so runs are repeatable.
+    """
+
+    def __init__(
+        self,
+        pages: int = 10,
+        quotes_per_page: int = 10,
+        latency: float = 0.0,
+        etags: bool = False,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        text_words: int = 0,
+        seed: int = 0,
+    ) -> None:
+        self.pages = pages
+        self.quotes_per_page = quotes_per_page
+        self.latency = latency
+        self.etags = etags
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.padding = " word" * text_words
+        self.random = random.Random(seed)
+        self.version = 1
+        self.requests = 0
+        self.completed = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.bytes_sent = 0
+
+    def render_page(self, page: int) -> str:
+        if page < 1 or page > self.pages:
+            return "<html><body><div class=\"col-md-8\">No quotes found!</div></body></html>"
+
+        quotes = []
+        for index in range(self.quotes_per_page):
+            number = (page - 1) * self.quotes_per_page + index
+            quotes.append(
+                f"""
+                <div class="quote">
+                    <span class="text">Quote number {number}{self.padding}</span>
+                    <span>by <small class="author">Author {number % 50}</small></span>
+                    <div class="tags">
+                        <a class="tag" href="/tag/t{number % 7}/">t{number % 7}</a>
+                        <a class="tag" href="/tag/t{number % 3}/">t{number % 3}</a>
+                    </div>
+                </div>
+                """
+            )
+
+        next_link = (
+            f'<li class="next"><a href="/page/{page + 1}/">Next</a></li>'
+            if page < self.pages
+            else ""
+        )
+
+        return (
+            "<html><body><div class=\"col-md-8\">"
+            + "".join(quotes)
+            + f"<nav><ul class=\"pager\">{next_link}</ul></nav>"
+            + "</div></body></html>"
+        )
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope["type"] != "http":
+            return
+
+        self.requests += 1
+
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers = [(b"content-type", b"text/html; charset=utf-8")]
+        request_headers = dict(scope.get("headers", []))
+
+        match = PAGE_PATTERN.match(scope["path"])
+        if self.error_rate and self.random.random() < self.error_rate:
+            status, body = 503, b"Service Unavailable"
+            self.errors += 1
+        elif match:
+            status, body = 200, self.render_page(int(match.group(1))).encode()
+            if self.etags:
+                etag = f'"{match.group(1)}-{self.version}"'.encode()
+                headers.append((b"etag", etag))
+                if request_headers.get(b"if-none-match") == etag:
+                    status, body = 304, b""
+                    self.not_modified += 1
+        else:
+            status, body = 404, b"Not Found"
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": body})
+        self.completed += 1
+        self.bytes_sent += len(body)
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+from .config import ScraperConfig
+from .parser import ParsedPage
+
+
+# ==============================
+# Cached Response
+# ==============================
+
+@dataclass(slots=True)
+class CachedResponse:
+    """
+    Response body plus the validators needed for a conditional GET.
+    """
+
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# ==============================
+# Base Cache Interface
+# ==============================
+
+class ResponseCache(ABC):
+    """
+    Abstract response cache keyed by absolute URL.
+    Entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl = ttl
+
+    def _expired(self, entry: CachedResponse) -> bool:
+        return self.ttl is not None and time.time() - entry.stored_at > self.ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+# ==============================
+# In-Memory LRU Cache
+# ==============================
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-process LRU cache with optional TTL.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        super().__init__(ttl)
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self._expired(entry):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# ==============================
+# SQLite Disk Cache
+# ==============================
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Disk-backed cache stored in a SQLite file.
+    Least recently used entries are evicted once the stored
+    bodies exceed `max_bytes`. Queries run in a worker thread
+    so the event loop is not blocked on disk I/O.
+    """
+
+    TABLE_NAME = "http_cache"
+
+    def __init__(
+        self,
+        db_name: str = "http_cache.db",
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(ttl)
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0.")
+        self.db_path = Path(db_name)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_table()
+        self._total_bytes = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE_NAME}"
+        ).fetchone()[0]
+
+    def _create_table(self) -> None:
+        with self._conn:
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    key TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_accessed
+                ON {self.TABLE_NAME} (accessed_at)
+            """)
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT body, etag, last_modified, stored_at FROM {self.TABLE_NAME} WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            entry = CachedResponse(*row)
+            with self._conn:
+                if self._expired(entry):
+                    self._delete(key)
+                    return None
+                self._conn.execute(
+                    f"UPDATE {self.TABLE_NAME} SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return entry
+
+    def _set(self, key: str, entry: CachedResponse) -> None:
+        size = len(entry.body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock, self._conn:
+            self._delete(key)
+            self._conn.execute(
+                f"""
+                INSERT INTO {self.TABLE_NAME}
+                    (key, body, etag, last_modified, stored_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, entry.body, entry.etag, entry.last_modified,
+                 entry.stored_at, time.time(), size),
+            )
+            self._total_bytes += size
+            self._evict()
+
+    def _delete(self, key: str) -> None:
+        row = self._conn.execute(
+            f"SELECT size FROM {self.TABLE_NAME} WHERE key = ?", (key,)
+        ).fetchone()
+        if row:
+            self._conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            f"SELECT key, size FROM {self.TABLE_NAME} ORDER BY accessed_at"
+        )
+        victims = []
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            victims.append((key,))
+            self._total_bytes -= size
+
+        self._conn.executemany(f"DELETE FROM {self.TABLE_NAME} WHERE key = ?", victims)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        await asyncio.to_thread(self._set, key, entry)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ==============================
+# Parsed Page Memo
+# ==============================
+
+class ParsedPageMemo:
+    """
+    LRU memo of parse results keyed by parser engine and a digest of
+    the HTML body, so unchanged (e.g. 304 Not Modified) pages are not
+    re-parsed, and engines sharing one memo never see each other's output.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Tuple[str, bytes], ParsedPage] = OrderedDict()
+
+    @staticmethod
+    def _key(body: str, engine: str) -> Tuple[str, bytes]:
+        return engine, hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, body: str, engine: str = "bs4") -> Optional[ParsedPage]:
+        key = self._key(body, engine)
+        parsed = self._entries.get(key)
+        if parsed is None:
+            return None
+
+        self._entries.move_to_end(key)
+        # Hand out copies so callers cannot mutate the memoized records.
+        return ParsedPage(
+            records=[dict(record) for record in parsed.records],
+            is_last=parsed.is_last,
+        )
+
+    def set(self, body: str, parsed: ParsedPage, engine: str = "bs4") -> None:
+        key = self._key(body, engine)
+        self._entries[key] = ParsedPage(
+            records=[dict(record) for record in parsed.records],
+            is_last=parsed.is_last,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# ==============================
+# Factory
+# ==============================
+
+def build_response_cache(config: ScraperConfig) -> Optional[ResponseCache]:
+    """
+    Create the response cache selected by `config.cache_backend`.
+    """
+
+    backend = config.cache_backend.lower()
+
+    if backend == "none":
+        return None
+
+    if backend == "memory":
+        return MemoryResponseCache(
+            max_entries=config.cache_max_entries,
+            ttl=config.cache_ttl,
+        )
+
+    if backend == "sqlite":
+        return SQLiteResponseCache(
+            db_name=config.cache_path,
+            max_bytes=config.cache_max_bytes,
+            ttl=config.cache_ttl,
+        )
+
+    raise ValueError(f"Unknown cache backend: {config.cache_backend}")
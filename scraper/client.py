@@ -1,34 +1,373 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
+from typing import Optional, Dict, Any, Callable
+
 import httpx
-from typing import Optional
+
+from .cache import ResponseCache, CachedResponse
+from .config import ScraperConfig
+from .metrics import metrics
+from .ratelimit import parse_retry_after
+from .retry import RetryPolicy, CircuitBreaker
+
+
+ResponseObserver = Callable[[httpx.Response, float], None]
+
+# httpcore trace events timed as stages of a request.
+TRACED_STAGES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "http11.receive_response_headers": "wait",
+    "http2.receive_response_headers": "wait",
+    "http11.receive_response_body": "transfer",
+    "http2.receive_response_body": "transfer",
+}
+
+
+def _connection_trace() -> Callable[[str, Dict[str, Any]], Any]:
+    """
+    httpcore `trace` extension recording connect, TLS, time to first
+    byte and body transfer of one request. Only installed while
+    metrics are enabled.
+    """
+
+    started: Dict[str, float] = {}
+
+    async def trace(event: str, info: Dict[str, Any]) -> None:
+        name, _, phase = event.rpartition(".")
+        stage = TRACED_STAGES.get(name)
+        if stage is None:
+            return
+        if phase == "started":
+            started[name] = time.perf_counter()
+        elif phase == "complete" and name in started:
+            metrics.stage_seconds.observe(time.perf_counter() - started.pop(name), stage)
+
+    return trace
 
 
 class ScraperClient:
     """
     Async HTTP client for fetching pages.
     Uses connection pooling for performance.
+
+    The client can be used per scrape (`async with client:`) or opened
+    once and shared for the lifetime of the process (`await client.open()`
+    / `await client.aclose()`). Entering a client that is already open
+    is a no-op, so shared clients are never closed by a single scrape.
+
+    With a `cache`, page fetches are conditional GETs: stored ETag /
+    Last-Modified validators are sent and a 304 returns the cached body.
+
+    With a `retry_policy`, retryable statuses and transport errors are
+    retried with jittered exponential backoff; a `circuit_breaker`
+    makes requests to a failing host fail fast with CircuitOpenError.
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: float = 10.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        max_connections_per_host: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         self.base_url = base_url
+        self.transport = transport
+        self.timeout = timeout
+        self.limits = limits or httpx.Limits()
+        self.http2 = http2
+        self.max_connections_per_host = max_connections_per_host
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_client = False
+        self._context_depth = 0
 
-    async def __aenter__(self) -> "ScraperClient":
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=10.0,
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._requests_total = 0
+        self._cache_hits = 0
+        self._retries = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ScraperConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> "ScraperClient":
+        return cls(
+            config.base_url,
+            transport=transport,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2,
+            max_connections_per_host=config.max_connections_per_host,
+            cache=cache,
+            retry_policy=RetryPolicy.from_config(config),
+            circuit_breaker=CircuitBreaker.from_config(config),
         )
+
+    # ==============================
+    # Lifecycle
+    # ==============================
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    async def open(self) -> "ScraperClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
         return self
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:
+    async def aclose(self) -> None:
         if self._client:
             await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "ScraperClient":
+        if self._context_depth == 0 and self._client is None:
+            await self.open()
+            self._owns_client = True
+        self._context_depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._context_depth -= 1
+        if self._context_depth == 0 and self._owns_client:
+            self._owns_client = False
+            await self.aclose()
+
+    # ==============================
+    # Requests
+    # ==============================
+
+    def _host_slot(self, host: str) -> Optional[asyncio.Semaphore]:
+        if not self.max_connections_per_host:
+            return None
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(
+                self.max_connections_per_host
+            )
+        return slot
+
+    async def _send(
+        self,
+        url: str,
+        host: str,
+        headers: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        slot = self._host_slot(host)
+
+        if slot:
+            await slot.acquire()
+        self._in_flight[host] += 1
+        self._requests_total += 1
+        try:
+            if metrics.enabled:
+                response = await self._client.get(
+                    url, headers=headers, extensions={"trace": _connection_trace()}
+                )
+            else:
+                response = await self._client.get(url, headers=headers)
+            if metrics.enabled:
+                metrics.http_requests.inc(1, str(response.status_code))
+                metrics.http_bytes.inc(len(response.content))
+            return response
+        finally:
+            self._in_flight[host] -= 1
+            if slot:
+                slot.release()
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        on_response: Optional[ResponseObserver] = None,
+    ) -> httpx.Response:
+        """
+        GET an absolute URL or a path relative to `base_url`,
+        respecting the per-host connection cap, retry policy and
+        circuit breaker. `on_response` sees every attempt's response
+        and latency. The final response is returned unchecked.
+        """
 
-    async def fetch_page(self, page: int) -> str:
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/page/{page}/")
+        host = self._client.base_url.join(url).host
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if breaker:
+                breaker.before_request(host)
+
+            sent = time.monotonic()
+            try:
+                response = await self._send(url, host, headers)
+
+            except httpx.TransportError as e:
+                if breaker:
+                    breaker.record_failure(host)
+                if policy and isinstance(e, policy.retry_exceptions):
+                    delay = policy.backoff(attempt)
+                    if policy.allows(attempt, started, delay):
+                        self._retries += 1
+                        if metrics.enabled:
+                            metrics.http_retries.inc()
+                        await asyncio.sleep(delay)
+                        continue
+                raise
+
+            except Exception:
+                if breaker:
+                    breaker.record_failure(host)
+                raise
+
+            except BaseException:
+                # Cancelled: no verdict on the host, but free the probe.
+                if breaker:
+                    breaker.release_probe(host)
+                raise
+
+            if on_response:
+                on_response(response, time.monotonic() - sent)
+
+            if breaker:
+                if response.status_code >= 500:
+                    breaker.record_failure(host)
+                else:
+                    breaker.record_success(host)
+
+            if policy and response.status_code in policy.retry_statuses:
+                delay = policy.backoff(
+                    attempt,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
+                if policy.allows(attempt, started, delay):
+                    self._retries += 1
+                    if metrics.enabled:
+                        metrics.http_retries.inc()
+                    await asyncio.sleep(delay)
+                    continue
+
+            return response
+
+    def page_url(self, page: int) -> str:
+        return str(httpx.URL(self.base_url).join(f"/page/{page}/"))
+
+    async def fetch_page(
+        self,
+        page: int,
+        on_response: Optional[ResponseObserver] = None,
+    ) -> str:
+        with metrics.time("fetch"):
+            return await self._fetch_page(page, on_response)
+
+    async def _fetch_page(
+        self,
+        page: int,
+        on_response: Optional[ResponseObserver],
+    ) -> str:
+        path = f"/page/{page}/"
+
+        if self.cache is None:
+            response = await self.get(path, on_response=on_response)
+            response.raise_for_status()
+            return response.text
+
+        key = str(self._client.base_url.join(path)) if self._client else path
+        cached = await self.cache.get(key)
+
+        response = await self.get(
+            path,
+            headers=cached.conditional_headers() if cached else None,
+            on_response=on_response,
+        )
+
+        if response.status_code == 304 and cached:
+            self._cache_hits += 1
+            if metrics.enabled:
+                metrics.cache_hits.inc()
+            return cached.body
+
         response.raise_for_status()
-        return response.text
\ No newline at end of file
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            await self.cache.set(
+                key,
+                CachedResponse(
+                    body=response.text,
+                    etag=etag,
+                    last_modified=last_modified,
+                ),
+            )
+
+        return response.text
+
+    # ==============================
+    # Stats
+    # ==============================
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of connection-pool usage for monitoring.
+        """
+
+        stats: Dict[str, Any] = {
+            "open": self.is_open,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "requests_total": self._requests_total,
+            "cache_hits": self._cache_hits,
+            "retries": self._retries,
+            "in_flight": sum(self._in_flight.values()),
+            "in_flight_per_host": {
+                host: count for host, count in self._in_flight.items() if count
+            },
+        }
+
+        # httpcore does not expose pool stats publicly; best effort only.
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+
+        if self.circuit_breaker:
+            stats["circuits"] = {
+                host: self.circuit_breaker.state(host)
+                for host in self._in_flight
+            }
+
+        return stats
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass(slots=True)
@@ -25,12 +26,246 @@ class ScraperConfig:
         )
     )
 
+    # Adaptive per-host rate limiting (initial rate comes from `delay`)
+    rate_limit_burst: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_RATE_BURST", "1")
+        )
+    )
+
+    rate_limit_min_rate: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RATE_MIN", "0.1")
+        )
+    )
+
+    rate_limit_max_rate: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RATE_MAX", "20.0")
+        )
+    )
+
+    rate_limit_latency_target: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RATE_LATENCY_TARGET", "2.0")
+        )
+    )
+
     default_limit: int = field(
         default_factory=lambda: int(
             os.getenv("SCRAPER_DEFAULT_LIMIT", "20")
         )
     )
 
+    # Parsing backend: "bs4", "bs4-lxml", "lxml" or "selectolax"
+    parser_engine: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_PARSER_ENGINE",
+            "bs4"
+        )
+    )
+
+    # Where parsing runs: "inline", "thread" or "process"
+    parse_executor: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_PARSE_EXECUTOR",
+            "inline"
+        )
+    )
+
+    # 0 means one worker per CPU core
+    parse_workers: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_PARSE_WORKERS", "0")
+        )
+    )
+
+    parse_batch_size: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_PARSE_BATCH_SIZE", "8")
+        )
+    )
+
+    # HTTP connection pool settings
+    timeout: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_TIMEOUT", "10.0")
+        )
+    )
+
+    max_connections: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_MAX_CONNECTIONS", "100")
+        )
+    )
+
+    max_keepalive_connections: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_MAX_KEEPALIVE", "20")
+        )
+    )
+
+    keepalive_expiry: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_KEEPALIVE_EXPIRY", "5.0")
+        )
+    )
+
+    max_connections_per_host: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_MAX_CONNECTIONS_PER_HOST", "10")
+        )
+    )
+
+    # Requires the optional `h2` package (pip install "httpx[http2]")
+    http2: bool = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_HTTP2", "false"
+        ).lower() in {"1", "true", "yes"}
+    )
+
+    # Retries and circuit breaker
+    retry_max_attempts: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_RETRY_ATTEMPTS", "3")
+        )
+    )
+
+    retry_base_delay: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RETRY_BASE_DELAY", "0.2")
+        )
+    )
+
+    retry_max_delay: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RETRY_MAX_DELAY", "5.0")
+        )
+    )
+
+    retry_deadline: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_RETRY_DEADLINE", "30.0")
+        )
+    )
+
+    breaker_failure_threshold: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_BREAKER_THRESHOLD", "5")
+        )
+    )
+
+    breaker_reset_timeout: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_BREAKER_RESET", "30.0")
+        )
+    )
+
+    # Conditional-GET response cache: "none", "memory" or "sqlite"
+    cache_backend: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_CACHE_BACKEND",
+            "none"
+        )
+    )
+
+    cache_ttl: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_CACHE_TTL", "86400")
+        )
+    )
+
+    cache_max_entries: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_CACHE_MAX_ENTRIES", "1024")
+        )
+    )
+
+    cache_path: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_CACHE_FILE",
+            "http_cache.db"
+        )
+    )
+
+    cache_max_bytes: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+        )
+    )
+
+    # Incremental re-scrape fingerprints: "none", "memory" or "sqlite"
+    fingerprint_backend: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_FINGERPRINT_BACKEND",
+            "none"
+        )
+    )
+
+    fingerprint_path: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_FINGERPRINT_FILE",
+            "fingerprints.db"
+        )
+    )
+
+    # Per-stage metrics on /metrics
+    metrics_enabled: bool = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_METRICS_ENABLED",
+            "false"
+        ).lower() in {"1", "true", "yes"}
+    )
+
+    # OpenTelemetry spans per scrape (needs opentelemetry-api)
+    tracing_enabled: bool = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_TRACING_ENABLED",
+            "false"
+        ).lower() in {"1", "true", "yes"}
+    )
+
+    # Durable crawl jobs
+    jobs_path: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_JOBS_FILE",
+            "jobs.db"
+        )
+    )
+
+    # Postgres URL for a job queue shared across hosts; SQLite if unset
+    jobs_database_url: Optional[str] = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_JOBS_DATABASE_URL"
+        ) or None
+    )
+
+    job_lease_timeout: float = field(
+        default_factory=lambda: float(
+            os.getenv("SCRAPER_JOB_LEASE_TIMEOUT", "60")
+        )
+    )
+
+    job_max_attempts: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_JOB_MAX_ATTEMPTS", "3")
+        )
+    )
+
+    # Pages a job worker keeps in flight
+    job_worker_concurrency: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_JOB_WORKER_CONCURRENCY", "5")
+        )
+    )
+
+    # Run a job worker inside the API process
+    job_embedded_worker: bool = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_JOB_EMBEDDED_WORKER", "false"
+        ).lower() in {"1", "true", "yes"}
+    )
+
     # Export settings
     csv_filename: str = field(
         default_factory=lambda: os.getenv(
@@ -53,6 +288,54 @@ class ScraperConfig:
         )
     )
 
+    # SQLite export: rows per transaction, WAL bulk mode, page cache size
+    db_chunk_size: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_DB_CHUNK_SIZE", "500")
+        )
+    )
+
+    db_bulk_mode: bool = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_DB_BULK", "false"
+        ).lower() in {"1", "true", "yes"}
+    )
+
+    db_cache_size_kib: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_DB_CACHE_SIZE_KIB", "65536")
+        )
+    )
+
+    parquet_path: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_PARQUET_PATH",
+            "posts.parquet"
+        )
+    )
+
+    # "zstd", "snappy", "gzip", "brotli", "lz4" or "none"
+    parquet_compression: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_PARQUET_COMPRESSION",
+            "zstd"
+        )
+    )
+
+    parquet_row_group_size: int = field(
+        default_factory=lambda: int(
+            os.getenv("SCRAPER_PARQUET_ROW_GROUP_SIZE", "65536")
+        )
+    )
+
+    # Hive partition column: "", "scrape_date" or "author_initial"
+    parquet_partition_by: str = field(
+        default_factory=lambda: os.getenv(
+            "SCRAPER_PARQUET_PARTITION_BY",
+            ""
+        )
+    )
+
     # Logging level
     log_level: str = field(
         default_factory=lambda: os.getenv(
@@ -75,9 +358,71 @@ class ScraperConfig:
         if self.delay < 0:
             raise ValueError("Delay must be non-negative.")
 
+        if self.rate_limit_burst <= 0:
+            raise ValueError("rate_limit_burst must be greater than 0.")
+
+        if not 0 < self.rate_limit_min_rate <= self.rate_limit_max_rate:
+            raise ValueError("rate_limit_min_rate must be between 0 and rate_limit_max_rate.")
+
         if self.default_limit <= 0:
             raise ValueError("default_limit must be greater than 0.")
 
+        if self.parser_engine not in {"bs4", "bs4-lxml", "lxml", "selectolax"}:
+            raise ValueError("Invalid parser_engine provided.")
+
+        if self.parse_executor not in {"inline", "thread", "process"}:
+            raise ValueError("Invalid parse_executor provided.")
+
+        if self.parse_workers < 0 or self.parse_batch_size <= 0:
+            raise ValueError("Invalid parse worker settings.")
+
+        if self.timeout <= 0:
+            raise ValueError("timeout must be greater than 0.")
+
+        if self.max_connections <= 0 or self.max_connections_per_host <= 0:
+            raise ValueError("Connection limits must be greater than 0.")
+
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ValueError(
+                "max_keepalive_connections must be between 0 and max_connections."
+            )
+
+        if self.retry_max_attempts <= 0 or self.breaker_failure_threshold <= 0:
+            raise ValueError("Retry attempts and breaker threshold must be greater than 0.")
+
+        if self.retry_deadline <= 0 or self.breaker_reset_timeout <= 0:
+            raise ValueError("Retry deadline and breaker reset must be greater than 0.")
+
+        if self.cache_backend.lower() not in {"none", "memory", "sqlite"}:
+            raise ValueError("cache_backend must be one of: none, memory, sqlite.")
+
+        if self.cache_ttl <= 0 or self.cache_max_entries <= 0 or self.cache_max_bytes <= 0:
+            raise ValueError("Cache limits must be greater than 0.")
+
+        if self.fingerprint_backend.lower() not in {"none", "memory", "sqlite"}:
+            raise ValueError("fingerprint_backend must be one of: none, memory, sqlite.")
+
+        if (
+            self.job_lease_timeout <= 0
+            or self.job_max_attempts <= 0
+            or self.job_worker_concurrency <= 0
+        ):
+            raise ValueError("Job lease, attempts and worker concurrency must be greater than 0.")
+
+        if self.db_chunk_size <= 0 or self.db_cache_size_kib <= 0:
+            raise ValueError("SQLite export settings must be greater than 0.")
+
+        if self.parquet_compression.lower() not in {
+            "zstd", "snappy", "gzip", "brotli", "lz4", "none"
+        }:
+            raise ValueError("Invalid parquet_compression provided.")
+
+        if self.parquet_row_group_size <= 0:
+            raise ValueError("parquet_row_group_size must be greater than 0.")
+
+        if self.parquet_partition_by not in {"", "scrape_date", "author_initial"}:
+            raise ValueError("parquet_partition_by must be scrape_date or author_initial.")
+
         if self.log_level.upper() not in {
             "DEBUG",
             "INFO",
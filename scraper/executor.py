@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from .config import ScraperConfig
+from .parser import ParsedPage, QuoteParser
+
+
+def parse_batch(items: List[Tuple[str, str]]) -> List[Union[ParsedPage, Exception]]:
+    """
+    Parse several (html, engine) pairs in one call.
+    Runs inside pool workers, so it must stay a picklable top-level function.
+    Failures are returned per page instead of failing the whole batch.
+    """
+
+    results: List[Union[ParsedPage, Exception]] = []
+    for html, engine in items:
+        try:
+            results.append(QuoteParser.parse_page(html, engine))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class ParseExecutor:
+    """
+    Runs HTML parsing off the event loop.
+
+    kind:
+    - "inline":  parse on the event loop (no pool)
+    - "thread":  thread pool, suited to engines that release the GIL
+    - "process": process pool for CPU-bound engines; pages are
+                 batched (up to `batch_size`, or whatever arrived within
+                 `batch_delay` seconds) to keep IPC overhead low
+    """
+
+    KINDS = {"inline", "thread", "process"}
+
+    def __init__(
+        self,
+        kind: str = "inline",
+        workers: Optional[int] = None,
+        batch_size: int = 8,
+        batch_delay: float = 0.002,
+    ) -> None:
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown parse executor: {kind}")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0.")
+
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size if kind == "process" else 1
+        self.batch_delay = batch_delay
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._pool: Optional[Executor] = None
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="parser",
+            )
+        elif kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> "ParseExecutor":
+        return cls(
+            kind=config.parse_executor,
+            workers=config.parse_workers or None,
+            batch_size=config.parse_batch_size,
+        )
+
+    async def parse(self, html: str, engine: str = "bs4") -> ParsedPage:
+        if self._pool is None:
+            return QuoteParser.parse_page(html, engine)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((html, engine, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(
+            self._pool,
+            parse_batch,
+            [(html, engine) for html, engine, _ in batch],
+        )
+        job.add_done_callback(lambda done: self._deliver(batch, done))
+
+    @staticmethod
+    def _deliver(batch, job: asyncio.Future) -> None:
+        futures = [future for _, _, future in batch]
+
+        if job.cancelled() or job.exception():
+            error = job.exception() if not job.cancelled() else asyncio.CancelledError()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for future, result in zip(futures, job.result()):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -1,27 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Iterable
+from collections.abc import AsyncIterable, Iterable
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 import logging
 import json
+import os
+import re
 import sqlite3
 import csv
+import hashlib
+import uuid
 
+from .config import ScraperConfig
+from .metrics import metrics
 
-# ==============================
-# Base Exporter Interface
-# ==============================
 
-class Exporter(ABC):
-    """
-    Abstract base exporter.
-    Every exporter must implement `export`.
-    """
-
-    @abstractmethod
-    def export(self, data: List[Dict[str, Any]]) -> None:
-        pass
+Record = Dict[str, Any]
+Records = Union[Iterable[Record], AsyncIterable[Record]]
 
 
 # ==============================
@@ -35,6 +33,15 @@ class DataValidationMixin:
 
     REQUIRED_KEYS = {"text", "author", "tags"}
 
+    @classmethod
+    def validate_record(cls, item: Any) -> None:
+        if not isinstance(item, dict):
+            raise TypeError("Each item must be a dictionary.")
+
+        missing = cls.REQUIRED_KEYS - item.keys()
+        if missing:
+            raise ValueError(f"Missing required keys: {missing}")
+
     @classmethod
     def validate(cls, data: List[Dict[str, Any]]) -> None:
         if not isinstance(data, list):
@@ -44,119 +51,785 @@ class DataValidationMixin:
             raise ValueError("Cannot export empty dataset.")
 
         for item in data:
-            if not isinstance(item, dict):
-                raise TypeError("Each item must be a dictionary.")
+            cls.validate_record(item)
+
+
+# ==============================
+# Base Exporter Interface
+# ==============================
+
+class Exporter(ABC, DataValidationMixin):
+    """
+    Abstract base exporter.
+
+    Records are consumed one at a time from any iterable (or async
+    iterable via `aexport`), validated inline and handed to the
+    subclass, so memory stays flat however many records are exported.
+    Subclasses implement `_open`, `_write` and `_close`.
+    """
+
+    label = "Export"
+    _active = False
+
+    @property
+    @abstractmethod
+    def target(self) -> Path:
+        pass
+
+    @abstractmethod
+    def _open(self, first: Record) -> None:
+        pass
+
+    @abstractmethod
+    def _write(self, record: Record) -> None:
+        pass
+
+    @abstractmethod
+    def _close(self, success: bool) -> None:
+        pass
+
+    def _guarded(self, step, *args) -> None:
+        try:
+            step(*args)
+        except Exception as e:
+            logging.exception(f"{self.label} export failed.")
+            raise RuntimeError(f"{self.label} export failed.") from e
+
+    def _accept(self, record: Record, count: int) -> None:
+        self.validate_record(record)
+        if not count:
+            self._guarded(self._open, record)
+            self._active = True
+        started = metrics.clock()
+        self._guarded(self._write, record)
+        metrics.observe_since("export_write", started)
+
+    def _finish(self, count: int, error: Optional[BaseException]) -> int:
+        if self._active:
+            self._active = False
+            if error is None:
+                with metrics.time("export_close"):
+                    self._guarded(self._close, True)
+            else:
+                try:
+                    self._close(False)
+                except Exception:
+                    logging.exception(f"{self.label} cleanup failed.")
+
+        if error is not None:
+            raise error
+        if not count:
+            raise ValueError("Cannot export empty dataset.")
+
+        if metrics.enabled:
+            metrics.records_exported.inc(count, self.label)
+        logging.info(f"[{self.label}] Exported {count} records → {self.target.resolve()}")
+        return count
+
+    def export(self, data: Iterable[Record]) -> int:
+        """
+        Export every record from `data` and return how many were written.
+        """
+
+        if isinstance(data, (dict, str, bytes)) or not isinstance(data, Iterable):
+            raise TypeError("Data must be an iterable of dictionaries.")
+
+        count = 0
+        try:
+            for record in data:
+                self._accept(record, count)
+                count += 1
+        except BaseException as e:
+            return self._finish(count, e)
+        return self._finish(count, None)
+
+    async def aexport(self, data: Records) -> int:
+        """
+        Like `export`, but also drains async iterables, e.g.
+        `ScraperService.iter_records`, so writing overlaps with scraping.
+        """
+
+        if not isinstance(data, AsyncIterable):
+            return self.export(data)
+
+        count = 0
+        try:
+            async for record in data:
+                self._accept(record, count)
+                count += 1
+        except BaseException as e:
+            return self._finish(count, e)
+        return self._finish(count, None)
+
+
+class FileExporter(Exporter):
+    """
+    Writes to `<filename>.part` and renames it over `filename` only
+    once every record has been written, so a failed export never
+    leaves a truncated file behind.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.path = Path(filename)
+        self._file = None
 
-            missing = cls.REQUIRED_KEYS - item.keys()
-            if missing:
-                raise ValueError(f"Missing required keys: {missing}")
+    @property
+    def target(self) -> Path:
+        return self.path
+
+    @property
+    def _partial_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".part")
+
+    def _open_file(self, **kwargs):
+        self._file = open(self._partial_path, "w", encoding="utf-8", **kwargs)
+        return self._file
+
+    def _close(self, success: bool) -> None:
+        self._file.close()
+        self._file = None
+
+        if success:
+            os.replace(self._partial_path, self.path)
+        else:
+            self._partial_path.unlink(missing_ok=True)
 
 
 # ==============================
 # CSV Exporter
 # ==============================
 
-class CSVExporter(Exporter, DataValidationMixin):
+class CSVExporter(FileExporter):
     """
     Exports structured data into CSV format.
+    The header is taken from the first record.
     """
 
+    label = "CSV"
+
     def __init__(self, filename: str = "posts.csv"):
-        self.path = Path(filename)
+        super().__init__(filename)
+        self._writer: Optional[csv.DictWriter] = None
 
-    def export(self, data: List[Dict[str, Any]]) -> None:
-        self.validate(data)
+    def _open(self, first: Record) -> None:
+        f = self._open_file(newline="")
+        self._writer = csv.DictWriter(f, fieldnames=list(first.keys()))
+        self._writer.writeheader()
 
-        try:
-            keys = data[0].keys()
-            with open(self.path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(data)
+    def _write(self, record: Record) -> None:
+        self._writer.writerow(record)
 
-            logging.info(f"[CSV] Export successful → {self.path.resolve()}")
-
-        except Exception as e:
-            logging.exception("CSV export failed.")
-            raise RuntimeError("CSV export failed.") from e
+    def _close(self, success: bool) -> None:
+        self._writer = None
+        super()._close(success)
 
 
 # ==============================
 # JSON Exporter
 # ==============================
 
-class JSONExporter(Exporter, DataValidationMixin):
+class JSONExporter(FileExporter):
     """
     Exports structured data into JSON format.
+
+    With `lines=False` the output is a single indented JSON array;
+    with `lines=True` it is NDJSON, one compact record per line.
+    Either way records are serialized one at a time.
     """
 
-    def __init__(self, filename: str = "posts.json"):
-        self.path = Path(filename)
+    label = "JSON"
 
-    def export(self, data: List[Dict[str, Any]]) -> None:
-        self.validate(data)
+    def __init__(self, filename: str = "posts.json", lines: bool = False, indent: int = 4):
+        super().__init__(filename)
+        self.lines = lines
+        self.indent = indent
+        self._first = True
 
-        try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+    def _open(self, first: Record) -> None:
+        f = self._open_file()
+        self._first = True
+        if not self.lines:
+            f.write("[")
 
-            logging.info(f"[JSON] Export successful → {self.path.resolve()}")
+    def _write(self, record: Record) -> None:
+        if self.lines:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
 
-        except Exception as e:
-            logging.exception("JSON export failed.")
-            raise RuntimeError("JSON export failed.") from e
+        pad = " " * self.indent
+        body = json.dumps(record, indent=self.indent, ensure_ascii=False)
+        self._file.write(("\n" if self._first else ",\n") + pad + body.replace("\n", "\n" + pad))
+        self._first = False
+
+    def _close(self, success: bool) -> None:
+        if success and not self.lines:
+            self._file.write("\n]")
+        super()._close(success)
 
 
 # ==============================
 # SQLite Exporter
 # ==============================
 
-class SQLiteExporter(Exporter, DataValidationMixin):
+class SQLiteExporter(Exporter):
     """
     Exports data into SQLite database.
-    Automatically creates table and prevents duplicates.
+    Automatically creates the schema and prevents duplicates.
+    An FTS5 index mirrors the quotes for ranked search.
+
+    - quotes are deduplicated on an 8-byte hash of (text, author)
+      instead of a unique index over the full quote text
+    - tags are normalized into `tags` / `quote_tags`; `quotes_view`
+      joins them back into the comma-separated form
+    - records are inserted `chunk_size` at a time, one transaction per
+      chunk, over a connection that is reused across exports (call
+      `close()` or use the exporter as a context manager when done)
+
+    `bulk=True` switches the database to WAL with synchronous=NORMAL
+    and a `cache_size_kib` page cache for fast appends. Databases
+    written with the old `UNIQUE(text, author)` layout are migrated
+    on first use.
     """
 
     TABLE_NAME = "quotes"
+    TAGS_TABLE = "tags"
+    LINK_TABLE = "quote_tags"
+    VIEW_NAME = "quotes_view"
+    FTS_TABLE = "quotes_fts"
+    label = "SQLite"
 
-    def __init__(self, db_name: str = "posts.db"):
-        self.db_path = Path(db_name)
+    # Stay well under SQLITE_MAX_VARIABLE_NUMBER on old builds.
+    MAX_PARAMS = 500
 
-    def export(self, data: List[Dict[str, Any]]) -> None:
-        self.validate(data)
+    def __init__(
+        self,
+        db_name: str = "posts.db",
+        chunk_size: int = 500,
+        bulk: bool = False,
+        cache_size_kib: int = 65536,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0.")
+        if cache_size_kib <= 0:
+            raise ValueError("cache_size_kib must be greater than 0.")
+        self.db_path = Path(db_name)
+        self.chunk_size = chunk_size
+        self.bulk = bulk
+        self.cache_size_kib = cache_size_kib
+        self.inserted = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._chunk: List[Record] = []
+        self._tag_ids: Dict[str, int] = {}
 
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> "SQLiteExporter":
+        return cls(
+            db_name=config.db_filename,
+            chunk_size=config.db_chunk_size,
+            bulk=config.db_bulk_mode,
+            cache_size_kib=config.db_cache_size_kib,
+        )
+
+    @property
+    def target(self) -> Path:
+        return self.db_path
+
+    @staticmethod
+    def content_hash(text: str, author: str) -> int:
+        digest = hashlib.blake2b(
+            f"{text}\x1f{author}".encode("utf-8"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    @staticmethod
+    def split_tags(tags: Any) -> List[str]:
+        if not isinstance(tags, (list, tuple)):
+            tags = str(tags or "").split(",")
+        return [name for name in (str(tag).strip() for tag in tags) if name]
+
+    # ==============================
+    # Connection Lifecycle
+    # ==============================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        conn = sqlite3.connect(self.db_path)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                self._create_table(cursor)
-                self._insert_batch(cursor, data)
-
-                conn.commit()
-
-            logging.info(f"[SQLite] Export successful → {self.db_path.resolve()}")
+            if self.bulk:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+                conn.execute("PRAGMA temp_store=MEMORY")
+            self._ensure_schema(conn)
+        except Exception:
+            conn.close()
+            raise
+
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._tag_ids = {}
+
+    def __enter__(self) -> "SQLiteExporter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _open(self, first: Record) -> None:
+        self._connect()
+        self._chunk = []
+
+    def _write(self, record: Record) -> None:
+        self._chunk.append(record)
+        if len(self._chunk) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._chunk:
+            return
+        try:
+            with self._conn:
+                self.inserted += self._insert_batch(self._conn.cursor(), self._chunk)
+        except Exception:
+            # Tag ids handed out inside the rolled-back transaction are gone.
+            self._tag_ids = {}
+            raise
+        finally:
+            self._chunk = []
+
+    def _close(self, success: bool) -> None:
+        if success:
+            self._flush()
+        self._chunk = []
+
+    # ==============================
+    # Schema
+    # ==============================
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({self.TABLE_NAME})")}
+            if columns and "content_hash" not in columns:
+                self._migrate_legacy_table(cursor)
 
-        except Exception as e:
-            logging.exception("SQLite export failed.")
-            raise RuntimeError("SQLite export failed.") from e
+            self._create_table(cursor)
+            self._create_search_index(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
     def _create_table(self, cursor: sqlite3.Cursor) -> None:
-        cursor.execute(f"""
+        for statement in (
+            f"""
             CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
+                content_hash INTEGER NOT NULL,
                 text TEXT NOT NULL,
-                author TEXT NOT NULL,
-                tags TEXT,
-                UNIQUE(text, author)
+                author TEXT NOT NULL
+            )
+            """,
+            f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS {self.TABLE_NAME}_content_hash
+            ON {self.TABLE_NAME} (content_hash)
+            """,
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TAGS_TABLE} (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            """,
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.LINK_TABLE} (
+                quote_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                tag_id INTEGER NOT NULL,
+                PRIMARY KEY (quote_id, position)
+            ) WITHOUT ROWID
+            """,
+            f"""
+            CREATE INDEX IF NOT EXISTS {self.LINK_TABLE}_tag
+            ON {self.LINK_TABLE} (tag_id)
+            """,
+            f"""
+            CREATE VIEW IF NOT EXISTS {self.VIEW_NAME} AS
+            SELECT q.id, q.text, q.author, COALESCE((
+                SELECT group_concat(name, ', ') FROM (
+                    SELECT t.name FROM {self.LINK_TABLE} AS qt
+                    JOIN {self.TAGS_TABLE} AS t ON t.id = qt.tag_id
+                    WHERE qt.quote_id = q.id
+                    ORDER BY qt.position
+                )
+            ), '') AS tags
+            FROM {self.TABLE_NAME} AS q
+            """,
+        ):
+            cursor.execute(statement)
+
+    def _create_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """
+        External-content FTS5 table over `quotes_view`.
+        New quotes are indexed by `_insert_batch` once their tags are
+        linked; triggers keep the index in sync on update and delete.
+        Rows that predate the index are indexed once on creation.
+        """
+
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (self.FTS_TABLE,),
+        ).fetchone()
+
+        remove_old = f"""
+            INSERT INTO {self.FTS_TABLE} ({self.FTS_TABLE}, rowid, text, author, tags)
+            SELECT 'delete', id, text, author, tags FROM {self.VIEW_NAME} WHERE id = old.id;
+        """
+
+        for statement in (
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {self.FTS_TABLE} USING fts5(
+                text, author, tags,
+                content='{self.VIEW_NAME}', content_rowid='id'
             )
-        """)
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.TABLE_NAME}_bd
+            BEFORE DELETE ON {self.TABLE_NAME} BEGIN {remove_old} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.TABLE_NAME}_ad
+            AFTER DELETE ON {self.TABLE_NAME} BEGIN
+                DELETE FROM {self.LINK_TABLE} WHERE quote_id = old.id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.TABLE_NAME}_bu
+            BEFORE UPDATE OF text, author ON {self.TABLE_NAME} BEGIN {remove_old} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.TABLE_NAME}_au
+            AFTER UPDATE OF text, author ON {self.TABLE_NAME} BEGIN
+                INSERT INTO {self.FTS_TABLE} (rowid, text, author, tags)
+                SELECT id, text, author, tags FROM {self.VIEW_NAME} WHERE id = new.id;
+            END
+            """,
+        ):
+            cursor.execute(statement)
+
+        if not exists:
+            cursor.execute(
+                f"INSERT INTO {self.FTS_TABLE} ({self.FTS_TABLE}) VALUES ('rebuild')"
+            )
+
+    def _migrate_legacy_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Rebuild a `UNIQUE(text, author)` quotes table into the hashed,
+        tag-normalized layout, keeping quote ids.
+        """
+
+        logging.info(f"[SQLite] Migrating {self.db_path} to the content-hash layout")
+
+        for trigger in ("ai", "ad", "au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {self.TABLE_NAME}_{trigger}")
+        cursor.execute(f"DROP TABLE IF EXISTS {self.FTS_TABLE}")
+        cursor.execute(f"ALTER TABLE {self.TABLE_NAME} RENAME TO {self.TABLE_NAME}_legacy")
+        self._create_table(cursor)
+
+        rows = cursor.connection.execute(
+            f"SELECT id, text, author, tags FROM {self.TABLE_NAME}_legacy"
+        )
+        while batch := rows.fetchmany(self.chunk_size):
+            cursor.executemany(
+                f"INSERT INTO {self.TABLE_NAME} (id, content_hash, text, author) VALUES (?, ?, ?, ?)",
+                [(id_, self.content_hash(text, author), text, author) for id_, text, author, _ in batch],
+            )
+            self._link_tags(cursor, [(id_, self.split_tags(tags)) for id_, _, _, tags in batch])
+
+        cursor.execute(f"DROP TABLE {self.TABLE_NAME}_legacy")
+
+    # ==============================
+    # Search
+    # ==============================
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        # Quote every term so user input cannot break FTS5 query syntax.
+        terms = re.findall(r"\w+", query)
+        return " ".join(f'"{term}"' for term in terms)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, int]]]:
+        """
+        BM25-ranked search over exported quotes.
+
+        Returns the hits (with `highlight` markup around matched terms
+        in the quote text) and a (rank, id) cursor for the next page,
+        which is passed back as `after`.
+        """
+
+        expression = self._match_expression(query)
+        if not expression:
+            return [], None
+
+        rank, last_id = after if after else (float("-inf"), 0)
+
+        cursor = self._connect().cursor()
+        cursor.row_factory = sqlite3.Row
+        rows = cursor.execute(f"""
+            SELECT q.id, q.text, q.author, q.tags, f.rank AS rank,
+                   highlight({self.FTS_TABLE}, 0, '<b>', '</b>') AS highlight
+            FROM {self.FTS_TABLE} AS f
+            JOIN {self.VIEW_NAME} AS q ON q.id = f.rowid
+            WHERE {self.FTS_TABLE} MATCH ?
+              AND (f.rank > ? OR (f.rank = ? AND f.rowid > ?))
+            ORDER BY f.rank, f.rowid
+            LIMIT ?
+        """, (expression, rank, rank, last_id, limit)).fetchall()
+
+        hits = [dict(row) for row in rows]
+        next_cursor = (hits[-1]["rank"], hits[-1]["id"]) if len(hits) == limit else None
+        return hits, next_cursor
+
+    # ==============================
+    # Inserts
+    # ==============================
+
+    def _execute_in(self, cursor: sqlite3.Cursor, sql: str, values: List[Any]) -> List[Tuple]:
+        """
+        Run `sql` (containing one `IN ({})`) over `values` in slices
+        and collect any rows it returns.
+        """
+
+        rows: List[Tuple] = []
+        for start in range(0, len(values), self.MAX_PARAMS):
+            part = values[start:start + self.MAX_PARAMS]
+            rows.extend(cursor.execute(sql.format(", ".join("?" * len(part))), part))
+        return rows
+
+    def _link_tags(self, cursor: sqlite3.Cursor, links: List[Tuple[int, List[str]]]) -> None:
+        unknown = list({name for _, names in links for name in names} - self._tag_ids.keys())
+        if unknown:
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {self.TAGS_TABLE} (name) VALUES (?)",
+                [(name,) for name in unknown],
+            )
+            self._tag_ids.update(self._execute_in(
+                cursor, f"SELECT name, id FROM {self.TAGS_TABLE} WHERE name IN ({{}})", unknown
+            ))
+
+        cursor.executemany(
+            f"INSERT INTO {self.LINK_TABLE} (quote_id, position, tag_id) VALUES (?, ?, ?)",
+            [
+                (quote_id, position, self._tag_ids[name])
+                for quote_id, names in links
+                for position, name in enumerate(names)
+            ],
+        )
 
     def _insert_batch(
         self,
         cursor: sqlite3.Cursor,
         data: Iterable[Dict[str, Any]]
-    ) -> None:
-        cursor.executemany(f"""
-            INSERT OR IGNORE INTO {self.TABLE_NAME} (text, author, tags)
-            VALUES (:text, :author, :tags)
-        """, data)
\ No newline at end of file
+    ) -> int:
+        """
+        Insert quotes whose content hash is not stored yet, link their
+        tags and index them. Returns the number of new quotes.
+        """
+
+        pending: Dict[int, Dict[str, Any]] = {}
+        for record in data:
+            pending.setdefault(self.content_hash(record["text"], record["author"]), record)
+
+        for (known,) in self._execute_in(
+            cursor,
+            f"SELECT content_hash FROM {self.TABLE_NAME} WHERE content_hash IN ({{}})",
+            list(pending),
+        ):
+            del pending[known]
+
+        if not pending:
+            return 0
+
+        cursor.executemany(
+            f"INSERT INTO {self.TABLE_NAME} (content_hash, text, author) VALUES (?, ?, ?)",
+            [(key, record["text"], record["author"]) for key, record in pending.items()],
+        )
+        ids = dict(self._execute_in(
+            cursor,
+            f"SELECT content_hash, id FROM {self.TABLE_NAME} WHERE content_hash IN ({{}})",
+            list(pending),
+        ))
+
+        self._link_tags(cursor, [
+            (ids[key], self.split_tags(record["tags"])) for key, record in pending.items()
+        ])
+        self._execute_in(
+            cursor,
+            f"""
+            INSERT INTO {self.FTS_TABLE} (rowid, text, author, tags)
+            SELECT id, text, author, tags FROM {self.VIEW_NAME} WHERE id IN ({{}})
+            """,
+            list(ids.values()),
+        )
+        return len(pending)
+
+
+# ==============================
+# Parquet Exporter
+# ==============================
+
+class ParquetExporter(Exporter):
+    """
+    Exports data into Apache Parquet (requires the optional `pyarrow`).
+
+    Rows are buffered per partition and written as row groups of
+    `row_group_size` rows, so memory is bounded by one row group per
+    open partition rather than by the dataset. `author` and `tags`
+    are dictionary-encoded.
+
+    With `partition_by` set, `path` is a Hive-style dataset directory,
+    e.g. `posts.parquet/author_initial=A/part-<id>.parquet`; every
+    export adds its own part files next to existing ones.
+    """
+
+    label = "Parquet"
+    COMPRESSIONS = {"zstd", "snappy", "gzip", "brotli", "lz4", "none"}
+    PARTITIONS = {"scrape_date", "author_initial"}
+    DICTIONARY_COLUMNS = ["author", "tags"]
+
+    def __init__(
+        self,
+        path: str = "posts.parquet",
+        compression: str = "zstd",
+        row_group_size: int = 65536,
+        partition_by: Optional[str] = None,
+        scrape_date: Optional[date] = None,
+    ):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("ParquetExporter requires `pip install pyarrow`.") from e
+
+        if compression.lower() not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown parquet compression: {compression}")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be greater than 0.")
+        if partition_by and partition_by not in self.PARTITIONS:
+            raise ValueError(f"Unknown partition column: {partition_by}")
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = Path(path)
+        self.compression = compression.lower()
+        self.row_group_size = row_group_size
+        self.partition_by = partition_by or None
+        self.scrape_date = scrape_date
+
+        self._schema = None
+        self._date = ""
+        self._token = ""
+        self._writers: Dict[str, Any] = {}
+        self._buffers: Dict[str, List[Record]] = {}
+        self._files: Dict[str, Tuple[Path, Path]] = {}
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> "ParquetExporter":
+        return cls(
+            path=config.parquet_path,
+            compression=config.parquet_compression,
+            row_group_size=config.parquet_row_group_size,
+            partition_by=config.parquet_partition_by,
+        )
+
+    @property
+    def target(self) -> Path:
+        return self.path
+
+    def _partition(self, record: Record) -> str:
+        if self.partition_by == "scrape_date":
+            return f"scrape_date={self._date}"
+        if self.partition_by == "author_initial":
+            initial = str(record["author"]).strip()[:1].upper()
+            return f"author_initial={initial if initial.isalnum() else '_'}"
+        return ""
+
+    def _open(self, first: Record) -> None:
+        pa = self._pa
+
+        schema = pa.Table.from_pylist([first]).schema
+        self._schema = pa.schema([
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in schema
+        ])
+        self._date = (self.scrape_date or date.today()).isoformat()
+        self._token = uuid.uuid4().hex
+        self._writers, self._buffers, self._files = {}, {}, {}
+
+    def _write(self, record: Record) -> None:
+        key = self._partition(record)
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(record)
+        if len(buffer) >= self.row_group_size:
+            self._flush(key)
+
+    def _writer(self, key: str):
+        writer = self._writers.get(key)
+        if writer is not None:
+            return writer
+
+        if self.partition_by:
+            final = self.path / key / f"part-{self._token}.parquet"
+        else:
+            final = self.path
+        final.parent.mkdir(parents=True, exist_ok=True)
+
+        # Dot-prefixed files are ignored by dataset readers until renamed.
+        partial = final.with_name(f".{final.name}.part")
+        self._files[key] = (partial, final)
+
+        writer = self._writers[key] = self._pq.ParquetWriter(
+            partial,
+            self._schema,
+            compression=self.compression,
+            use_dictionary=[c for c in self.DICTIONARY_COLUMNS if c in self._schema.names],
+        )
+        return writer
+
+    def _flush(self, key: str) -> None:
+        rows = self._buffers.pop(key, None)
+        if not rows:
+            return
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer(key).write_table(table, row_group_size=self.row_group_size)
+
+    def _close(self, success: bool) -> None:
+        flushed = False
+        try:
+            if success:
+                for key in list(self._buffers):
+                    self._flush(key)
+                flushed = True
+        finally:
+            for writer in self._writers.values():
+                writer.close()
+
+            for partial, final in self._files.values():
+                if flushed:
+                    os.replace(partial, final)
+                else:
+                    partial.unlink(missing_ok=True)
+
+            self._writers, self._buffers, self._files = {}, {}, {}
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import ScraperConfig
+from .parser import ParsedPage
+
+
+RECORD_HASH_SIZE = 8
+
+
+def body_digest(body: str) -> bytes:
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest()
+
+
+def record_digests(record: Dict[str, Any]) -> Tuple[bytes, bytes]:
+    """
+    (identity, content) digests of a record. The identity covers the
+    quote and its author; the content digest also covers the tags, so
+    a retagged quote counts as changed rather than new.
+    """
+
+    identity = f"{record.get('text')}\x1f{record.get('author')}"
+    content = f"{identity}\x1f{record.get('tags')}"
+    return (
+        hashlib.blake2b(identity.encode("utf-8"), digest_size=RECORD_HASH_SIZE).digest(),
+        hashlib.blake2b(content.encode("utf-8"), digest_size=RECORD_HASH_SIZE).digest(),
+    )
+
+
+# ==============================
+# Page Fingerprint
+# ==============================
+
+@dataclass(slots=True)
+class PageFingerprint:
+    """
+    What a page looked like when it was last scraped: a digest of the
+    body and (identity, content) digests of each record, in page order.
+    """
+
+    body_hash: bytes
+    records: List[Tuple[bytes, bytes]] = field(default_factory=list)
+    is_last: bool = False
+    stored_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def of(cls, body: str, parsed: ParsedPage) -> "PageFingerprint":
+        return cls(
+            body_hash=body_digest(body),
+            records=[record_digests(record) for record in parsed.records],
+            is_last=parsed.is_last,
+        )
+
+    def pack_records(self) -> bytes:
+        return b"".join(identity + content for identity, content in self.records)
+
+    @staticmethod
+    def unpack_records(blob: bytes) -> List[Tuple[bytes, bytes]]:
+        step = RECORD_HASH_SIZE * 2
+        return [
+            (blob[i:i + RECORD_HASH_SIZE], blob[i + RECORD_HASH_SIZE:i + step])
+            for i in range(0, len(blob), step)
+        ]
+
+
+# ==============================
+# Base Store Interface
+# ==============================
+
+class FingerprintStore(ABC):
+    """
+    Persistent per-URL page fingerprints used for incremental
+    re-scrapes.
+    """
+
+    @abstractmethod
+    async def get(self, url: str) -> Optional[PageFingerprint]:
+        pass
+
+    @abstractmethod
+    async def set(self, url: str, fingerprint: PageFingerprint) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryFingerprintStore(FingerprintStore):
+    """
+    In-process store; fingerprints live as long as the process.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, PageFingerprint] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, url: str) -> Optional[PageFingerprint]:
+        return self._entries.get(url)
+
+    async def set(self, url: str, fingerprint: PageFingerprint) -> None:
+        self._entries[url] = fingerprint
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """
+    Fingerprints stored in a SQLite file, 16 bytes per record.
+    Queries run in a worker thread so the event loop is not blocked.
+    """
+
+    TABLE_NAME = "page_fingerprints"
+
+    def __init__(self, db_name: str = "fingerprints.db") -> None:
+        self.db_path = Path(db_name)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    url TEXT PRIMARY KEY,
+                    body_hash BLOB NOT NULL,
+                    records BLOB NOT NULL,
+                    is_last INTEGER NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+            """)
+
+    def _get(self, url: str) -> Optional[PageFingerprint]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT body_hash, records, is_last, stored_at FROM {self.TABLE_NAME} WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body_hash, records, is_last, stored_at = row
+        return PageFingerprint(
+            body_hash=body_hash,
+            records=PageFingerprint.unpack_records(records),
+            is_last=bool(is_last),
+            stored_at=stored_at,
+        )
+
+    def _set(self, url: str, fingerprint: PageFingerprint) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"""
+                INSERT OR REPLACE INTO {self.TABLE_NAME}
+                    (url, body_hash, records, is_last, stored_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, fingerprint.body_hash, fingerprint.pack_records(),
+                 int(fingerprint.is_last), fingerprint.stored_at),
+            )
+
+    async def get(self, url: str) -> Optional[PageFingerprint]:
+        return await asyncio.to_thread(self._get, url)
+
+    async def set(self, url: str, fingerprint: PageFingerprint) -> None:
+        await asyncio.to_thread(self._set, url, fingerprint)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ==============================
+# Factory
+# ==============================
+
+def build_fingerprint_store(config: ScraperConfig) -> Optional[FingerprintStore]:
+    """
+    Create the fingerprint store selected by `config.fingerprint_backend`.
+    """
+
+    backend = config.fingerprint_backend.lower()
+
+    if backend == "none":
+        return None
+
+    if backend == "memory":
+        return MemoryFingerprintStore()
+
+    if backend == "sqlite":
+        return SQLiteFingerprintStore(config.fingerprint_path)
+
+    raise ValueError(f"Unknown fingerprint backend: {config.fingerprint_backend}")
@@ -0,0 +1,844 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .client import ScraperClient
+from .config import ScraperConfig
+from .metrics import metrics
+from .parser import ParsedPage
+from .service import ScraperService
+
+
+JOB_STATES = ("pending", "running", "done", "cancelled")
+PAGE_STATES = ("pending", "in_flight", "done", "failed")
+
+
+@dataclass(slots=True)
+class CrawlJob:
+    """
+    A crawl over pages 1..max_pages, checkpointed page by page.
+    `pages` counts frontier pages by state.
+    """
+
+    id: int
+    state: str
+    max_pages: int
+    delay: float
+    lookahead: int
+    records: int = 0
+    last_page: Optional[int] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    pages: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class PageLease:
+    """
+    A frontier page claimed by one worker until `expires`.
+    """
+
+    job_id: int
+    page: int
+    owner: str
+    attempts: int
+    delay: float
+    expires: float
+
+
+# ==============================
+# Base Job Store Interface
+# ==============================
+
+class JobStore(ABC):
+    """
+    Durable crawl jobs and their page frontier.
+
+    Pages move pending → in_flight (leased to one worker) → done or
+    failed. A page whose lease expires, e.g. because its worker died,
+    is handed out again, up to `max_attempts` times. A page's records
+    are saved in the same transaction that marks it done, so a
+    restarted crawl resumes from exactly the pages still outstanding.
+
+    The frontier is grown `lookahead` pages ahead of finished pages
+    and trimmed once the end of the site is seen.
+    """
+
+    def __init__(self, lease_timeout: float = 60.0, max_attempts: int = 3) -> None:
+        if lease_timeout <= 0 or max_attempts <= 0:
+            raise ValueError("lease_timeout and max_attempts must be greater than 0.")
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    async def submit(self, max_pages: int, delay: float = 1.0, lookahead: int = 10) -> CrawlJob:
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: int) -> Optional[CrawlJob]:
+        pass
+
+    @abstractmethod
+    async def cancel(self, job_id: int) -> Optional[CrawlJob]:
+        pass
+
+    @abstractmethod
+    async def claim(self, owner: str, limit: int = 1) -> List[PageLease]:
+        pass
+
+    @abstractmethod
+    async def complete(self, lease: PageLease, parsed: ParsedPage) -> bool:
+        pass
+
+    @abstractmethod
+    async def fail(self, lease: PageLease, error: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def renew(self, lease: PageLease) -> bool:
+        """
+        Extend a held lease by `lease_timeout`; False once it was lost.
+        """
+        pass
+
+    @abstractmethod
+    async def records(
+        self,
+        job_id: int,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+# ==============================
+# SQL Job Store
+# ==============================
+
+class SQLSession(ABC):
+    """
+    Minimal statement runner used inside one store transaction.
+    Statements use `:name` parameters and rows come back as dicts.
+    """
+
+    @abstractmethod
+    def all(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        pass
+
+    def one(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        rows = self.all(sql, params)
+        return rows[0] if rows else None
+
+    def run(self, sql: str, params: Optional[Dict[str, Any]] = None) -> None:
+        self.all(sql, params)
+
+
+class SQLJobStore(JobStore):
+    """
+    Job store logic shared by the SQLite and Postgres backends.
+    Subclasses provide the schema, a transaction and the row-locking
+    clauses their database needs.
+    """
+
+    SCHEMA: Tuple[str, ...] = ()
+    # Appended to the claim query so concurrent claimers skip each other's rows.
+    CLAIM_LOCK = ""
+    # Appended to the job lookup that serializes page completions per job.
+    ROW_LOCK = ""
+    # Rows per multi-row INSERT of records.
+    INSERT_BATCH = 250
+
+    @abstractmethod
+    def _transaction(self) -> contextlib.AbstractContextManager[SQLSession]:
+        pass
+
+    def _create_tables(self) -> None:
+        with self._transaction() as tx:
+            for statement in self.SCHEMA:
+                tx.run(statement)
+
+    # ==============================
+    # Jobs
+    # ==============================
+
+    def _load(self, tx: SQLSession, job_id: int) -> Optional[CrawlJob]:
+        row = tx.one("SELECT * FROM crawl_jobs WHERE id = :id", {"id": job_id})
+        if row is None:
+            return None
+
+        job = CrawlJob(**row)
+        job.pages = {state: 0 for state in PAGE_STATES}
+        for count in tx.all(
+            "SELECT state, COUNT(*) AS n FROM crawl_frontier WHERE job_id = :id GROUP BY state",
+            {"id": job_id},
+        ):
+            job.pages[count["state"]] = count["n"]
+        return job
+
+    def _submit(self, max_pages: int, delay: float, lookahead: int) -> CrawlJob:
+        if max_pages <= 0 or lookahead <= 0:
+            raise ValueError("max_pages and lookahead must be greater than 0.")
+
+        now = time.time()
+        with self._transaction() as tx:
+            job_id = tx.one(
+                """
+                INSERT INTO crawl_jobs (state, max_pages, delay, lookahead, records, created_at, updated_at)
+                VALUES ('pending', :max_pages, :delay, :lookahead, 0, :now, :now)
+                RETURNING id
+                """,
+                {"max_pages": max_pages, "delay": delay, "lookahead": lookahead, "now": now},
+            )["id"]
+            for page in range(1, min(lookahead, max_pages) + 1):
+                tx.run(
+                    "INSERT INTO crawl_frontier (job_id, page, state, attempts) VALUES (:id, :page, 'pending', 0)",
+                    {"id": job_id, "page": page},
+                )
+            return self._load(tx, job_id)
+
+    def _get(self, job_id: int) -> Optional[CrawlJob]:
+        with self._transaction() as tx:
+            return self._load(tx, job_id)
+
+    def _cancel(self, job_id: int) -> Optional[CrawlJob]:
+        with self._transaction() as tx:
+            tx.run(
+                """
+                UPDATE crawl_jobs SET state = 'cancelled', updated_at = :now
+                WHERE id = :id AND state IN ('pending', 'running')
+                """,
+                {"now": time.time(), "id": job_id},
+            )
+            return self._load(tx, job_id)
+
+    # ==============================
+    # Frontier
+    # ==============================
+
+    def _claim(self, owner: str, limit: int) -> List[PageLease]:
+        now = time.time()
+        expires = now + self.lease_timeout
+        leases: List[PageLease] = []
+
+        with self._transaction() as tx:
+            rows = tx.all(
+                f"""
+                SELECT f.job_id, f.page, f.attempts, j.delay
+                FROM crawl_frontier AS f
+                JOIN crawl_jobs AS j ON j.id = f.job_id
+                WHERE j.state IN ('pending', 'running')
+                  AND (f.state = 'pending' OR (f.state = 'in_flight' AND f.lease_expires < :now))
+                ORDER BY f.job_id, f.page
+                LIMIT :limit
+                {self.CLAIM_LOCK}
+                """,
+                {"now": now, "limit": limit},
+            )
+
+            for row in rows:
+                job_id, page = row["job_id"], row["page"]
+
+                if row["attempts"] >= self.max_attempts:
+                    # Leased out max_attempts times without finishing.
+                    self._finish_page(tx, job_id, page, "failed", "lease expired")
+                    continue
+
+                tx.run(
+                    """
+                    UPDATE crawl_frontier
+                    SET state = 'in_flight', attempts = attempts + 1,
+                        lease_owner = :owner, lease_expires = :expires
+                    WHERE job_id = :id AND page = :page
+                    """,
+                    {"owner": owner, "expires": expires, "id": job_id, "page": page},
+                )
+                leases.append(PageLease(
+                    job_id, page, owner, row["attempts"] + 1, row["delay"], expires
+                ))
+
+            for job_id in {lease.job_id for lease in leases}:
+                tx.run(
+                    "UPDATE crawl_jobs SET state = 'running', updated_at = :now WHERE id = :id AND state = 'pending'",
+                    {"now": now, "id": job_id},
+                )
+
+        return leases
+
+    def _holds(self, tx: SQLSession, lease: PageLease) -> bool:
+        return tx.one(
+            """
+            SELECT 1 AS held FROM crawl_frontier AS f
+            JOIN crawl_jobs AS j ON j.id = f.job_id
+            WHERE f.job_id = :id AND f.page = :page AND f.state = 'in_flight'
+              AND f.lease_owner = :owner AND j.state = 'running'
+            """,
+            {"id": lease.job_id, "page": lease.page, "owner": lease.owner},
+        ) is not None
+
+    def _finish_page(
+        self,
+        tx: SQLSession,
+        job_id: int,
+        page: int,
+        state: str,
+        error: Optional[str] = None,
+        end_at: Optional[int] = None,
+    ) -> None:
+        # Locking the job row first serializes completions of one job,
+        # so exactly one of them sees the frontier drained.
+        job = tx.one(
+            f"SELECT max_pages, lookahead, last_page FROM crawl_jobs WHERE id = :id{self.ROW_LOCK}",
+            {"id": job_id},
+        )
+
+        # The owner is kept so finished pages show which worker did them.
+        tx.run(
+            """
+            UPDATE crawl_frontier
+            SET state = :state, error = :error, lease_expires = NULL
+            WHERE job_id = :id AND page = :page
+            """,
+            {"state": state, "error": error, "id": job_id, "page": page},
+        )
+
+        last_page = job["last_page"]
+        if end_at is not None and (last_page is None or end_at < last_page):
+            last_page = end_at
+            tx.run(
+                "UPDATE crawl_jobs SET last_page = :last WHERE id = :id",
+                {"last": last_page, "id": job_id},
+            )
+            tx.run(
+                "DELETE FROM crawl_frontier WHERE job_id = :id AND page > :last AND state = 'pending'",
+                {"id": job_id, "last": last_page},
+            )
+
+        following = page + job["lookahead"]
+        if following <= job["max_pages"] and (last_page is None or following <= last_page):
+            tx.run(
+                """
+                INSERT INTO crawl_frontier (job_id, page, state, attempts)
+                VALUES (:id, :page, 'pending', 0)
+                ON CONFLICT (job_id, page) DO NOTHING
+                """,
+                {"id": job_id, "page": following},
+            )
+
+        outstanding = tx.one(
+            """
+            SELECT COUNT(*) AS n FROM crawl_frontier
+            WHERE job_id = :id AND state IN ('pending', 'in_flight')
+            """,
+            {"id": job_id},
+        )["n"]
+        tx.run(
+            f"""
+            UPDATE crawl_jobs
+            SET updated_at = :now{", state = 'done'" if not outstanding else ""}
+            WHERE id = :id AND state = 'running'
+            """,
+            {"now": time.time(), "id": job_id},
+        )
+
+    def _insert_records(self, tx: SQLSession, lease: PageLease, records: List[Dict[str, Any]]) -> None:
+        """
+        Upsert a page's records with multi-row INSERTs, so a page
+        re-scraped after a lost lease overwrites rather than duplicates.
+        """
+
+        for start in range(0, len(records), self.INSERT_BATCH):
+            batch = records[start:start + self.INSERT_BATCH]
+            params: Dict[str, Any] = {"job": lease.job_id, "page": lease.page}
+            values = []
+            for offset, record in enumerate(batch, start):
+                values.append(f"(:job, :page, {offset}, :t{offset}, :a{offset}, :g{offset})")
+                params[f"t{offset}"] = record["text"]
+                params[f"a{offset}"] = record["author"]
+                params[f"g{offset}"] = record.get("tags")
+
+            tx.run(
+                f"""
+                INSERT INTO crawl_records (job_id, page, position, text, author, tags)
+                VALUES {", ".join(values)}
+                ON CONFLICT (job_id, page, position) DO UPDATE
+                SET text = excluded.text, author = excluded.author, tags = excluded.tags
+                """,
+                params,
+            )
+
+    def _complete(self, lease: PageLease, parsed: ParsedPage) -> bool:
+        with self._transaction() as tx:
+            if not self._holds(tx, lease):
+                return False
+
+            self._insert_records(tx, lease, parsed.records)
+            tx.run(
+                "UPDATE crawl_jobs SET records = records + :n WHERE id = :id",
+                {"n": len(parsed.records), "id": lease.job_id},
+            )
+
+            if not parsed.records:
+                end_at = lease.page - 1
+            elif parsed.is_last:
+                end_at = lease.page
+            else:
+                end_at = None
+
+            self._finish_page(tx, lease.job_id, lease.page, "done", end_at=end_at)
+            return True
+
+    def _fail(self, lease: PageLease, error: str) -> bool:
+        with self._transaction() as tx:
+            if not self._holds(tx, lease):
+                return False
+
+            if lease.attempts >= self.max_attempts:
+                self._finish_page(tx, lease.job_id, lease.page, "failed", error)
+            else:
+                tx.run(
+                    """
+                    UPDATE crawl_frontier
+                    SET state = 'pending', error = :error, lease_owner = NULL, lease_expires = NULL
+                    WHERE job_id = :id AND page = :page
+                    """,
+                    {"error": error, "id": lease.job_id, "page": lease.page},
+                )
+            return True
+
+    def _renew(self, lease: PageLease) -> bool:
+        expires = time.time() + self.lease_timeout
+        with self._transaction() as tx:
+            if not self._holds(tx, lease):
+                return False
+            tx.run(
+                """
+                UPDATE crawl_frontier SET lease_expires = :expires
+                WHERE job_id = :id AND page = :page
+                """,
+                {"expires": expires, "id": lease.job_id, "page": lease.page},
+            )
+        lease.expires = expires
+        return True
+
+    def _records(
+        self,
+        job_id: int,
+        after: Optional[Tuple[int, int]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        page, position = after or (0, -1)
+        with self._transaction() as tx:
+            return tx.all(
+                """
+                SELECT page, position, text, author, tags FROM crawl_records
+                WHERE job_id = :id AND (page, position) > (:page, :position)
+                ORDER BY page, position
+                LIMIT :limit
+                """,
+                {"id": job_id, "page": page, "position": position, "limit": limit},
+            )
+
+    async def submit(self, max_pages: int, delay: float = 1.0, lookahead: int = 10) -> CrawlJob:
+        return await asyncio.to_thread(self._submit, max_pages, delay, lookahead)
+
+    async def get(self, job_id: int) -> Optional[CrawlJob]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def cancel(self, job_id: int) -> Optional[CrawlJob]:
+        return await asyncio.to_thread(self._cancel, job_id)
+
+    async def claim(self, owner: str, limit: int = 1) -> List[PageLease]:
+        return await asyncio.to_thread(self._claim, owner, limit)
+
+    async def complete(self, lease: PageLease, parsed: ParsedPage) -> bool:
+        return await asyncio.to_thread(self._complete, lease, parsed)
+
+    async def fail(self, lease: PageLease, error: str) -> bool:
+        return await asyncio.to_thread(self._fail, lease, error)
+
+    async def renew(self, lease: PageLease) -> bool:
+        return await asyncio.to_thread(self._renew, lease)
+
+    async def records(
+        self,
+        job_id: int,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._records, job_id, after, limit)
+
+
+# ==============================
+# SQLite Job Store
+# ==============================
+
+class _SQLiteSession(SQLSession):
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def all(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.conn.execute(sql, params or {})]
+
+
+class SQLiteJobStore(SQLJobStore):
+    """
+    Job store in a SQLite file. WAL mode and `BEGIN IMMEDIATE`
+    transactions let several local worker processes share one file.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS crawl_jobs (
+            id INTEGER PRIMARY KEY,
+            state TEXT NOT NULL,
+            max_pages INTEGER NOT NULL,
+            delay REAL NOT NULL,
+            lookahead INTEGER NOT NULL,
+            records INTEGER NOT NULL DEFAULT 0,
+            last_page INTEGER,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS crawl_frontier (
+            job_id INTEGER NOT NULL,
+            page INTEGER NOT NULL,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires REAL,
+            error TEXT,
+            PRIMARY KEY (job_id, page)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS crawl_frontier_claim
+        ON crawl_frontier (state, lease_expires)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS crawl_records (
+            job_id INTEGER NOT NULL,
+            page INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            author TEXT NOT NULL,
+            tags TEXT,
+            PRIMARY KEY (job_id, page, position)
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def __init__(
+        self,
+        db_name: str = "jobs.db",
+        lease_timeout: float = 60.0,
+        max_attempts: int = 3,
+    ) -> None:
+        super().__init__(lease_timeout, max_attempts)
+        self.db_path = Path(db_name)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[SQLSession]:
+        # IMMEDIATE takes the write lock up front, so concurrent
+        # claimers in other processes queue instead of deadlocking.
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield _SQLiteSession(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ==============================
+# Postgres Job Store
+# ==============================
+
+class _AlchemySession(SQLSession):
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    def all(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        from sqlalchemy import text
+
+        result = self.conn.execute(text(sql), params or {})
+        return [dict(row) for row in result.mappings()] if result.returns_rows else []
+
+
+class PostgresJobStore(SQLJobStore):
+    """
+    Job store in Postgres, shared by workers on any number of hosts.
+    Claims use `FOR UPDATE SKIP LOCKED`, so concurrent workers take
+    disjoint pages without waiting on each other.
+    """
+
+    CLAIM_LOCK = "FOR UPDATE OF f SKIP LOCKED"
+    ROW_LOCK = " FOR UPDATE"
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS crawl_jobs (
+            id BIGSERIAL PRIMARY KEY,
+            state TEXT NOT NULL,
+            max_pages INTEGER NOT NULL,
+            delay DOUBLE PRECISION NOT NULL,
+            lookahead INTEGER NOT NULL,
+            records BIGINT NOT NULL DEFAULT 0,
+            last_page INTEGER,
+            created_at DOUBLE PRECISION NOT NULL,
+            updated_at DOUBLE PRECISION NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS crawl_frontier (
+            job_id BIGINT NOT NULL REFERENCES crawl_jobs (id) ON DELETE CASCADE,
+            page INTEGER NOT NULL,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires DOUBLE PRECISION,
+            error TEXT,
+            PRIMARY KEY (job_id, page)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS crawl_frontier_claim
+        ON crawl_frontier (state, lease_expires)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS crawl_records (
+            job_id BIGINT NOT NULL REFERENCES crawl_jobs (id) ON DELETE CASCADE,
+            page INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            author TEXT NOT NULL,
+            tags TEXT,
+            PRIMARY KEY (job_id, page, position)
+        )
+        """,
+    )
+
+    def __init__(
+        self,
+        database_url: str,
+        lease_timeout: float = 60.0,
+        max_attempts: int = 3,
+    ) -> None:
+        super().__init__(lease_timeout, max_attempts)
+        from sqlalchemy import create_engine
+
+        self.engine = create_engine(database_url, pool_pre_ping=True)
+        self._create_tables()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[SQLSession]:
+        with self.engine.begin() as conn:
+            yield _AlchemySession(conn)
+
+    async def close(self) -> None:
+        self.engine.dispose()
+
+
+# ==============================
+# Factory
+# ==============================
+
+def build_job_store(config: ScraperConfig) -> JobStore:
+    """
+    Postgres when `config.jobs_database_url` is set, else a SQLite
+    file at `config.jobs_path`.
+    """
+
+    if config.jobs_database_url:
+        return PostgresJobStore(
+            config.jobs_database_url,
+            lease_timeout=config.job_lease_timeout,
+            max_attempts=config.job_max_attempts,
+        )
+
+    return SQLiteJobStore(
+        config.jobs_path,
+        lease_timeout=config.job_lease_timeout,
+        max_attempts=config.job_max_attempts,
+    )
+
+
+# ==============================
+# Worker
+# ==============================
+
+class CrawlWorker:
+    """
+    Claims frontier pages and scrapes them with ScraperService.
+
+    Up to `concurrency` pages are leased at a time. Results are
+    checkpointed per page through the store, so a worker can be
+    stopped at any point and another one picks up where it left off.
+    Leases are renewed every `heartbeat_interval` seconds (a third of
+    the store's lease timeout by default) while a page is processed,
+    so pages held up by rate limiting are not handed out twice. A page
+    whose lease is lost or fails to renew is abandoned mid-scrape.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        client: ScraperClient,
+        concurrency: int = 5,
+        poll_interval: float = 1.0,
+        owner: Optional[str] = None,
+        parser_engine: str = "bs4",
+        heartbeat_interval: Optional[float] = None,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than 0.")
+        self.store = store
+        self.heartbeat_interval = heartbeat_interval or store.lease_timeout / 3
+        self.client = client
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.parser_engine = parser_engine
+        self.pages_done = 0
+        self.pages_failed = 0
+        self._services: Dict[float, ScraperService] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _service(self, delay: float) -> ScraperService:
+        # One service (and rate limiter) per politeness setting.
+        service = self._services.get(delay)
+        if service is None:
+            service = self._services[delay] = ScraperService(
+                self.client,
+                delay,
+                max_concurrency=self.concurrency,
+                parser_engine=self.parser_engine,
+            )
+        return service
+
+    async def _heartbeat(self, lease: PageLease) -> None:
+        # Returns once the lease is lost; renewal errors propagate.
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            if not await self.store.renew(lease):
+                return
+
+    async def _process(self, lease: PageLease) -> None:
+        work = asyncio.create_task(self._process_leased(lease))
+        heartbeat = asyncio.create_task(self._heartbeat(lease))
+        try:
+            await asyncio.wait({work, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Whichever is still running: the heartbeat after the page
+            # is done, the page once the heartbeat stopped (or both).
+            work.cancel()
+            heartbeat.cancel()
+            await asyncio.wait({work, heartbeat})
+
+        if not work.cancelled():
+            work.result()  # checkpoint errors are reported by run()
+            return
+
+        # Another worker may own the page now; stop scraping it.
+        error = None if heartbeat.cancelled() else heartbeat.exception()
+        if error is not None:
+            self.logger.error(
+                f"Lease renewal failed for job {lease.job_id} page {lease.page}, "
+                f"page abandoned: {error}"
+            )
+        else:
+            self.logger.warning(
+                f"Lease lost for job {lease.job_id} page {lease.page}, page abandoned"
+            )
+
+    async def _process_leased(self, lease: PageLease) -> None:
+        try:
+            with metrics.span("crawl_page", job=lease.job_id, page=lease.page):
+                parsed = await self._service(lease.delay).scrape_page(lease.page)
+        except Exception as e:
+            self.pages_failed += 1
+            self.logger.warning(f"Job {lease.job_id} page {lease.page} failed: {e}")
+            await self.store.fail(lease, f"{type(e).__name__}: {e}")
+            return
+
+        with metrics.time("job_checkpoint"):
+            completed = await self.store.complete(lease, parsed)
+        if completed:
+            self.pages_done += 1
+        else:
+            self.logger.warning(f"Lease lost for job {lease.job_id} page {lease.page}")
+
+    async def run(self, stop: Optional[asyncio.Event] = None, until_idle: bool = False) -> None:
+        """
+        Process pages until `stop` is set, or, with `until_idle`,
+        until nothing is left to claim. Finished pages are replaced
+        by newly claimed ones right away (sliding window).
+        """
+
+        stop = stop or asyncio.Event()
+        tasks: Set[asyncio.Task] = set()
+        self.logger.info(f"Crawl worker {self.owner} started")
+
+        async with self.client:
+            try:
+                while not stop.is_set():
+                    free = self.concurrency - len(tasks)
+                    leases = await self.store.claim(self.owner, free) if free else []
+                    tasks.update(asyncio.create_task(self._process(lease)) for lease in leases)
+
+                    if tasks:
+                        done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            if task.exception():
+                                self.logger.error(f"Checkpoint failed: {task.exception()}")
+                        continue
+
+                    if until_idle:
+                        break
+                    try:
+                        await asyncio.wait_for(stop.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+
+                # Let leased pages finish so they are checkpointed.
+                if tasks:
+                    await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        self.logger.info(
+            f"Crawl worker {self.owner} stopped | done={self.pages_done} | failed={self.pages_failed}"
+        )
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+import time
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from .config import ScraperConfig
+
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; covers sub-millisecond parses up to slow fetches.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_NOOP = contextlib.nullcontext()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ==============================
+# Metric Types
+# ==============================
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(total[0])}"
+            yield f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}"
+
+
+class Gauge:
+    """
+    Value read from `source` at scrape time, e.g. connection-pool usage.
+    """
+
+    def __init__(self, name: str, help: str, source: Callable[[], float]) -> None:
+        self.name = name
+        self.help = help
+        self.source = source
+
+    def render(self) -> Iterator[str]:
+        try:
+            value = self.source()
+        except Exception:
+            return
+        if value is None:
+            return
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_format_value(value)}"
+
+
+# ==============================
+# Registry
+# ==============================
+
+class Metrics:
+    """
+    Per-stage timings and counters, rendered in the Prometheus text
+    format by `render()`.
+
+    Instrumented code checks `enabled` (or goes through `clock` /
+    `time`, which do) before measuring anything, so a disabled
+    registry costs one attribute lookup per call site. With `tracing`
+    each timed stage is also an OpenTelemetry span.
+    """
+
+    def __init__(self, enabled: bool = False, tracing: bool = False) -> None:
+        self.enabled = enabled
+        self._tracer = None
+        self._gauges: Dict[str, Gauge] = {}
+
+        self.stage_seconds = Histogram(
+            "scraper_stage_seconds",
+            "Time spent per pipeline stage.",
+            ("stage",),
+        )
+        self.http_requests = Counter(
+            "scraper_http_requests_total",
+            "HTTP requests sent, by status code.",
+            ("status",),
+        )
+        self.http_bytes = Counter(
+            "scraper_http_response_bytes_total",
+            "Response body bytes received.",
+        )
+        self.http_retries = Counter(
+            "scraper_http_retries_total",
+            "Requests retried after a retryable status or transport error.",
+        )
+        self.cache_hits = Counter(
+            "scraper_cache_hits_total",
+            "Page fetches answered from the response cache.",
+        )
+        self.page_failures = Counter(
+            "scraper_page_failures_total",
+            "Pages that could not be fetched or parsed.",
+        )
+        self.records_exported = Counter(
+            "scraper_records_exported_total",
+            "Records written, by exporter.",
+            ("exporter",),
+        )
+        self._metrics = [
+            self.stage_seconds,
+            self.http_requests,
+            self.http_bytes,
+            self.http_retries,
+            self.cache_hits,
+            self.page_failures,
+            self.records_exported,
+        ]
+
+        if tracing:
+            self.enable_tracing()
+
+    def enable_tracing(self) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "Tracing requires opentelemetry-api. Install with: pip install opentelemetry-api"
+            ) from e
+        self._tracer = trace.get_tracer("scraper")
+
+    def gauge(self, name: str, help: str, source: Callable[[], float]) -> None:
+        """
+        Register (or replace) a gauge read from `source` on render.
+        """
+
+        self._gauges[name] = Gauge(name, help, source)
+
+    # ==============================
+    # Timing
+    # ==============================
+
+    def clock(self) -> float:
+        """
+        Start time for `observe_since`; 0.0 while disabled.
+        """
+
+        return time.perf_counter() if self.enabled else 0.0
+
+    def observe_since(self, stage: str, started: float) -> None:
+        if self.enabled and started:
+            self.stage_seconds.observe(time.perf_counter() - started, stage)
+
+    def time(self, stage: str) -> ContextManager:
+        """
+        Time a block as `stage`; a shared no-op while disabled.
+        """
+
+        if not self.enabled:
+            return _NOOP
+        return self._timed(stage)
+
+    @contextlib.contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            if self._tracer is None:
+                yield
+            else:
+                with self._tracer.start_as_current_span(stage):
+                    yield
+        finally:
+            self.stage_seconds.observe(time.perf_counter() - started, stage)
+
+    def span(self, name: str, **attributes) -> ContextManager:
+        """
+        OpenTelemetry span around a whole operation, e.g. one scrape;
+        stages timed inside it become its children.
+        """
+
+        if self._tracer is None:
+            return _NOOP
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    # ==============================
+    # Exposition
+    # ==============================
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics + list(self._gauges.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Process-wide registry shared by the client, service, exporters and APIs.
+metrics = Metrics()
+
+
+def configure_metrics(config: ScraperConfig) -> Metrics:
+    """
+    Apply `config.metrics_enabled` / `config.tracing_enabled` to the
+    shared registry.
+    """
+
+    metrics.enabled = config.metrics_enabled
+    if config.tracing_enabled and metrics._tracer is None:
+        metrics.enable_tracing()
+    return metrics
+
+
+def pool_gauges(source: Callable[[], Dict[str, Optional[float]]]) -> None:
+    """
+    Register connection-pool gauges read from a `pool_stats()` callable.
+    """
+
+    for key, help in (
+        ("in_flight", "Requests currently in flight."),
+        ("connections", "Open pooled connections."),
+        ("idle_connections", "Idle pooled connections."),
+        ("max_connections", "Connection pool size limit."),
+    ):
+        metrics.gauge(f"scraper_pool_{key}", help, lambda key=key: source().get(key))
@@ -1,10 +1,54 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Dict, Any
+
 from bs4 import BeautifulSoup
 
 
-class QuoteParser:
-    @staticmethod
-    def parse(html: str):
-        soup = BeautifulSoup(html, "html.parser")
+@dataclass(slots=True)
+class ParsedPage:
+    """
+    Result of parsing a single listing page.
+
+    `is_last` is True when the page carries a pager without a
+    "next" link, i.e. the site has no further pages.
+    """
+
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    is_last: bool = False
+
+
+# ==============================
+# Parser Engines
+# ==============================
+
+class ParserEngine(ABC):
+    """
+    Abstract parsing backend.
+    Every engine must return exactly the same records for the same HTML.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def parse_page(self, html: str) -> ParsedPage:
+        pass
+
+
+class BeautifulSoupEngine(ParserEngine):
+    """
+    BeautifulSoup tree builder; `features` selects the underlying
+    parser ("html.parser" or "lxml").
+    """
+
+    def __init__(self, features: str = "html.parser") -> None:
+        self.features = features
+        self.name = "bs4" if features == "html.parser" else f"bs4-{features}"
+
+    def parse_page(self, html: str) -> ParsedPage:
+        soup = BeautifulSoup(html, self.features)
         quotes = soup.find_all("div", class_="quote")
 
         results = []
@@ -22,4 +66,146 @@ class QuoteParser:
                 "tags": ", ".join(tag.text for tag in quote.find_all("a", class_="tag"))
             })
 
-        return results
\ No newline at end of file
+        pager = soup.find("ul", class_="pager")
+        is_last = pager is not None and pager.find("li", class_="next") is None
+
+        return ParsedPage(records=results, is_last=is_last)
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class LxmlEngine(ParserEngine):
+    """
+    Raw lxml tree queried with precompiled XPath expressions.
+    Requires the optional `lxml` package.
+    """
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        try:
+            import lxml.html
+            from lxml.etree import XPath
+        except ImportError as e:
+            raise ImportError("The 'lxml' parser engine requires `pip install lxml`.") from e
+
+        self._fromstring = lxml.html.document_fromstring
+        self._quotes = XPath(f"//div[{_has_class('quote')}]")
+        self._text = XPath(f"(.//span[{_has_class('text')}])[1]")
+        self._author = XPath(f"(.//small[{_has_class('author')}])[1]")
+        self._tags = XPath(f".//a[{_has_class('tag')}]")
+        self._pager = XPath(f"(//ul[{_has_class('pager')}])[1]")
+        self._next = XPath(f".//li[{_has_class('next')}]")
+
+    @staticmethod
+    def _stripped_text(element) -> str:
+        return "".join(part.strip() for part in element.itertext())
+
+    def parse_page(self, html: str) -> ParsedPage:
+        if not html.strip():
+            return ParsedPage()
+
+        root = self._fromstring(html)
+
+        results = []
+
+        for quote in self._quotes(root):
+            text_el = self._text(quote)
+            author_el = self._author(quote)
+
+            if not text_el or not author_el:
+                continue
+
+            results.append({
+                "text": self._stripped_text(text_el[0]),
+                "author": self._stripped_text(author_el[0]),
+                "tags": ", ".join(tag.text_content() for tag in self._tags(quote))
+            })
+
+        pager = self._pager(root)
+        is_last = bool(pager) and not self._next(pager[0])
+
+        return ParsedPage(records=results, is_last=is_last)
+
+
+class SelectolaxEngine(ParserEngine):
+    """
+    selectolax (Lexbor) CSS-selector backend.
+    Requires the optional `selectolax` package.
+    """
+
+    name = "selectolax"
+
+    def __init__(self) -> None:
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise ImportError(
+                "The 'selectolax' parser engine requires `pip install selectolax`."
+            ) from e
+
+        self._parser = LexborHTMLParser
+
+    def parse_page(self, html: str) -> ParsedPage:
+        tree = self._parser(html)
+
+        results = []
+
+        for quote in tree.css("div.quote"):
+            text_el = quote.css_first("span.text")
+            author_el = quote.css_first("small.author")
+
+            if not text_el or not author_el:
+                continue
+
+            results.append({
+                "text": text_el.text(deep=True, separator="", strip=True),
+                "author": author_el.text(deep=True, separator="", strip=True),
+                "tags": ", ".join(tag.text(deep=True) for tag in quote.css("a.tag"))
+            })
+
+        pager = tree.css_first("ul.pager")
+        is_last = pager is not None and pager.css_first("li.next") is None
+
+        return ParsedPage(records=results, is_last=is_last)
+
+
+ENGINES = {
+    "bs4": lambda: BeautifulSoupEngine("html.parser"),
+    "bs4-lxml": lambda: BeautifulSoupEngine("lxml"),
+    "lxml": LxmlEngine,
+    "selectolax": SelectolaxEngine,
+}
+
+_engine_instances: Dict[str, ParserEngine] = {}
+
+
+def get_engine(name: str) -> ParserEngine:
+    """
+    Return the shared engine instance registered under `name`.
+    """
+
+    engine = _engine_instances.get(name)
+    if engine is None:
+        if name not in ENGINES:
+            raise ValueError(
+                f"Unknown parser engine: {name}. Choose from {sorted(ENGINES)}."
+            )
+        engine = _engine_instances[name] = ENGINES[name]()
+    return engine
+
+
+# ==============================
+# Public Parser
+# ==============================
+
+class QuoteParser:
+    @staticmethod
+    def parse(html: str, engine: str = "bs4"):
+        return QuoteParser.parse_page(html, engine).records
+
+    @staticmethod
+    def parse_page(html: str, engine: str = "bs4") -> ParsedPage:
+        return get_engine(engine).parse_page(html)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional
+
+from .config import ScraperConfig
+
+
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    """
+
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ==============================
+# Token Bucket
+# ==============================
+
+class TokenBucket:
+    """
+    Classic token bucket. `rate` tokens per second are added up to
+    `burst`; a rate of None means unlimited. Waiters are served FIFO.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1) -> None:
+        if burst <= 0:
+            raise ValueError("burst must be greater than 0.")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """
+        Change the rate; tokens earned so far accrue at the old one.
+        """
+        self._refill()
+        self.rate = rate
+
+    async def acquire(self) -> None:
+        if self.rate is None:
+            return
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ==============================
+# Adaptive Per-Host Limiter
+# ==============================
+
+@dataclass(slots=True)
+class HostState:
+    bucket: TokenBucket
+    slots: asyncio.Semaphore
+    blocked_until: float = 0.0
+    latency: Optional[float] = None
+    throttled: int = 0
+    requests: int = 0
+
+
+class HostRateLimiter:
+    """
+    Per-host token-bucket limiter with adaptive politeness (AIMD):
+
+    - 429/503 responses multiply the host's rate by `backoff_factor`
+      and a Retry-After header pauses the host until it has elapsed
+    - successful responses with an average latency under
+      `latency_target` raise the rate by `increase_step` req/s,
+      up to `max_rate`
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: int = 1,
+        max_concurrency: int = 5,
+        min_rate: float = 0.1,
+        max_rate: float = 20.0,
+        increase_step: float = 0.1,
+        backoff_factor: float = 0.5,
+        latency_target: float = 2.0,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1.")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate or 0.0)
+        self.increase_step = increase_step
+        self.backoff_factor = backoff_factor
+        self.latency_target = latency_target
+        self._hosts: Dict[str, HostState] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_delay(
+        cls,
+        delay: float,
+        max_concurrency: int = 5,
+        config: Optional[ScraperConfig] = None,
+    ) -> "HostRateLimiter":
+        """
+        Build a limiter where `delay` is the initial seconds between
+        requests to one host (0 disables throttling until a 429/503).
+        """
+
+        config = config or ScraperConfig(delay=delay)
+        return cls(
+            rate=1.0 / delay if delay > 0 else None,
+            burst=config.rate_limit_burst,
+            max_concurrency=max_concurrency,
+            min_rate=config.rate_limit_min_rate,
+            max_rate=config.rate_limit_max_rate,
+            latency_target=config.rate_limit_latency_target,
+        )
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(
+                bucket=TokenBucket(self.rate, self.burst),
+                slots=asyncio.Semaphore(self.max_concurrency),
+            )
+        return state
+
+    def seed(self, host: str, delay: float) -> None:
+        """
+        Start a host not seen yet at one request per `delay` seconds.
+        Hosts with state keep their adapted rate; a caller wanting a
+        slower pace caps its own requests (see `ScraperService`).
+        """
+
+        if host not in self._hosts:
+            self._state(host).bucket.set_rate(1.0 / delay if delay > 0 else None)
+
+    def current_rate(self, host: str) -> Optional[float]:
+        return self._state(host).bucket.rate
+
+    @contextlib.asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """
+        Wait for a concurrency slot, any Retry-After pause and a token.
+        """
+
+        state = self._state(host)
+
+        async with state.slots:
+            pause = state.blocked_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            await state.bucket.acquire()
+            state.requests += 1
+            yield
+
+    def on_response(
+        self,
+        host: str,
+        status_code: int,
+        latency: float,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        state = self._state(host)
+        bucket = state.bucket
+
+        if status_code in THROTTLE_STATUSES:
+            state.throttled += 1
+            current = bucket.rate or self.max_rate
+            bucket.set_rate(max(self.min_rate, current * self.backoff_factor))
+            bucket.tokens = min(bucket.tokens, 0.0)
+
+            if retry_after:
+                state.blocked_until = max(
+                    state.blocked_until, time.monotonic() + retry_after
+                )
+
+            self.logger.warning(
+                f"Throttled by {host} ({status_code}) | rate={bucket.rate:.2f}/s"
+                + (f" | retry_after={retry_after:.1f}s" if retry_after else "")
+            )
+            return
+
+        state.latency = (
+            latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+        )
+
+        if bucket.rate is not None and state.latency <= self.latency_target:
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.increase_step))
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {
+            host: {
+                "rate": state.bucket.rate,
+                "latency": state.latency,
+                "requests": state.requests,
+                "throttled": state.throttled,
+            }
+            for host, state in self._hosts.items()
+        }
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+from .config import ScraperConfig
+
+
+# ==============================
+# Retry Policy
+# ==============================
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """
+    Which failures to retry and how long to wait between attempts.
+
+    Delays use capped exponential backoff with full jitter; a
+    Retry-After value from the server is honored when it is longer.
+    No further attempt is started once `deadline` seconds have
+    passed since the first one.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+    deadline: Optional[float] = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than 0.")
+        if self.base_delay < 0 or self.max_delay < self.base_delay:
+            raise ValueError("Invalid retry delays.")
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> "RetryPolicy":
+        return cls(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            deadline=config.retry_deadline,
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before retry number `attempt` (1-based).
+        """
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def allows(self, attempt: int, started: float, delay: float) -> bool:
+        """
+        Whether another attempt may start after `attempt` attempts.
+        """
+
+        if attempt >= self.max_attempts:
+            return False
+        if self.deadline is not None:
+            return time.monotonic() - started + delay < self.deadline
+        return True
+
+
+# ==============================
+# Circuit Breaker
+# ==============================
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while a host's circuit is open.
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(slots=True)
+class CircuitState:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens
+    and requests fail fast. Once `reset_timeout` seconds have passed a
+    single probe request is let through (half-open); its outcome closes
+    or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be greater than 0.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts: Dict[str, CircuitState] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout,
+        )
+
+    def _state(self, host: str) -> CircuitState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = CircuitState()
+        return state
+
+    def state(self, host: str) -> str:
+        state = self._state(host)
+        if state.opened_at is None:
+            return "closed"
+        if state.probing or time.monotonic() - state.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self, host: str) -> None:
+        state = self._state(host)
+        if state.opened_at is None:
+            return
+
+        elapsed = time.monotonic() - state.opened_at
+        if elapsed < self.reset_timeout or state.probing:
+            raise CircuitOpenError(host, max(0.0, self.reset_timeout - elapsed))
+
+        state.probing = True
+
+    def record_success(self, host: str) -> None:
+        state = self._state(host)
+        if state.opened_at is not None:
+            self.logger.info(f"Circuit closed for {host}")
+        state.failures = 0
+        state.opened_at = None
+        state.probing = False
+
+    def release_probe(self, host: str) -> None:
+        """
+        Abandon a half-open probe that ended without an outcome, e.g.
+        when its request was cancelled, so the next request can probe.
+        """
+
+        self._state(host).probing = False
+
+    def record_failure(self, host: str) -> None:
+        state = self._state(host)
+        state.failures += 1
+
+        if state.probing or state.failures >= self.failure_threshold:
+            if state.opened_at is None or state.probing:
+                self.logger.warning(
+                    f"Circuit opened for {host} after {state.failures} failures"
+                )
+            state.opened_at = time.monotonic()
+            state.probing = False
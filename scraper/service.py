@@ -2,10 +2,64 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import List, Dict, Any
+import math
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, AsyncIterator, Optional, Union
 
+import httpx
+
+from .cache import ParsedPageMemo
 from .client import ScraperClient
-from .parser import QuoteParser
+from .executor import ParseExecutor
+from .fingerprint import FingerprintStore, PageFingerprint, body_digest
+from .metrics import metrics
+from .ratelimit import HostRateLimiter, TokenBucket, parse_retry_after
+from .parser import QuoteParser, ParsedPage
+
+
+@dataclass(slots=True)
+class PageFailure:
+    """
+    A page that could not be fetched or parsed.
+    """
+
+    page: int
+    error: str
+    status_code: Optional[int] = None
+
+
+@dataclass(slots=True)
+class DeltaStats:
+    """
+    What an incremental scrape found compared to the stored fingerprints.
+    """
+
+    pages_unchanged: int = 0
+    pages_changed: int = 0
+    records_new: int = 0
+    records_changed: int = 0
+    records_unchanged: int = 0
+    records_removed: int = 0
+
+
+@dataclass(slots=True)
+class PageDelta:
+    """
+    A fetched page checked against its stored fingerprint.
+    `parsed` is None when the body is unchanged and parsing was skipped.
+    """
+
+    url: str
+    fingerprint: PageFingerprint
+    previous: Optional[PageFingerprint] = None
+    parsed: Optional[ParsedPage] = None
+
+
+@dataclass(slots=True)
+class ScrapeResult:
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    failures: List[PageFailure] = field(default_factory=list)
+    delta: Optional[DeltaStats] = None
 
 
 class ScraperService:
@@ -15,6 +69,10 @@ class ScraperService:
     - Applying concurrency limits
     - Parsing responses
     - Returning structured data
+
+    With a `fingerprints` store the scrape is incremental: pages whose
+    body is unchanged since the last run are not parsed, and only new
+    or changed records are emitted; `self.delta` summarizes the rest.
     """
 
     def __init__(
@@ -22,65 +80,370 @@ class ScraperService:
         client: ScraperClient,
         delay: float,
         max_concurrency: int = 5,
+        items_per_page: int = 10,
+        parse_memo: Optional[ParsedPageMemo] = None,
+        parser_engine: str = "bs4",
+        parse_executor: Optional[ParseExecutor] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        fingerprints: Optional[FingerprintStore] = None,
     ) -> None:
         self.client = client
         self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.items_per_page = items_per_page
+        self.parse_memo = parse_memo
+        self.parser_engine = parser_engine
+        self.parse_executor = parse_executor
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_limiter = rate_limiter or HostRateLimiter.from_delay(
+            delay, max_concurrency
+        )
+        # A shared limiter paces the host for every caller; `delay`
+        # still caps this service at one request per `delay` seconds.
+        self.pacing = (
+            TokenBucket(1.0 / delay) if rate_limiter is not None and delay > 0 else None
+        )
+        self.fingerprints = fingerprints
+        self.host = httpx.URL(client.base_url).host
+        self.failures: List[PageFailure] = []
+        self.delta: Optional[DeltaStats] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    async def _fetch_and_parse(self, page: int) -> List[Dict[str, Any]]:
+    async def _parse(self, html: str) -> ParsedPage:
+        if self.parse_memo is not None:
+            parsed = self.parse_memo.get(html, self.parser_engine)
+            if parsed is not None:
+                return parsed
+
+        with metrics.time("parse"):
+            if self.parse_executor is None:
+                parsed = QuoteParser.parse_page(html, self.parser_engine)
+            else:
+                parsed = await self.parse_executor.parse(html, self.parser_engine)
+
+        if self.parse_memo is not None:
+            self.parse_memo.set(html, parsed, self.parser_engine)
+        return parsed
+
+    def _observe(self, response: httpx.Response, latency: float) -> None:
+        # Called for every attempt, including ones the client retries.
+        self.rate_limiter.on_response(
+            self.host,
+            response.status_code,
+            latency,
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    async def _rate_limited_fetch(self, page: int) -> str:
+        waited = metrics.clock()
+        if self.pacing is not None:
+            await self.pacing.acquire()
+        async with self.rate_limiter.slot(self.host):
+            metrics.observe_since("rate_limit_wait", waited)
+            return await self.client.fetch_page(page, on_response=self._observe)
+
+    async def _fetch(self, page: int) -> str:
+        waited = metrics.clock()
+        async with self.semaphore:
+            metrics.observe_since("semaphore_wait", waited)
+            return await self._rate_limited_fetch(page)
+
+    def _failed(self, failure: PageFailure) -> None:
+        self.failures.append(failure)
+        if metrics.enabled:
+            metrics.page_failures.inc()
+
+    async def scrape_page(self, page: int) -> ParsedPage:
+        """
+        Fetch and parse a single page under the same concurrency and
+        rate limits as a crawl. Errors are raised to the caller;
+        a 404 yields an empty last page.
+        """
+
+        try:
+            html = await self._fetch(page)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return ParsedPage(is_last=True)
+            raise
+
+        return await self._parse(html)
+
+    async def _compare(self, page: int, html: str) -> PageDelta:
+        url = self.client.page_url(page)
+        previous = await self.fingerprints.get(url)
+
+        if previous is not None and previous.body_hash == body_digest(html):
+            return PageDelta(url, previous, previous)
+
+        parsed = await self._parse(html)
+        return PageDelta(url, PageFingerprint.of(html, parsed), previous, parsed)
+
+    async def _fetch_and_parse(self, page: int) -> Union[ParsedPage, PageDelta, None]:
         """
         Fetch a single page and parse it.
-        Concurrency controlled via semaphore.
+        Fetch concurrency is controlled via semaphore and the per-host
+        rate limiter; the slot is released before parsing so fetches
+        keep flowing meanwhile.
+
+        Returns None when the page could not be processed and
+        records the reason in `self.failures`.
+        A 404 is treated as the end of the site.
+        In incremental mode a PageDelta is returned instead.
         """
 
-        async with self.semaphore:
-            try:
-                html = await self.client.fetch_page(page)
-                parsed = QuoteParser.parse(html)
-                self.logger.debug(f"Page {page} parsed successfully")
-                return parsed
+        try:
+            html = await self._fetch(page)
 
-            except Exception as e:
-                self.logger.error(f"Failed to process page {page}: {e}")
-                return []
+            if self.fingerprints is not None:
+                return await self._compare(page, html)
 
-    async def scrape(self, limit: int) -> List[Dict[str, Any]]:
+            parsed = await self._parse(html)
+            self.logger.debug(f"Page {page} parsed successfully")
+            return parsed
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return ParsedPage(is_last=True)
+            self.logger.error(f"Failed to process page {page}: {e}")
+            self._failed(PageFailure(page, str(e), e.response.status_code))
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Failed to process page {page}: {e}")
+            self._failed(PageFailure(page, f"{type(e).__name__}: {e}"))
+            return None
+
+    # ==============================
+    # Crawl Scheduler
+    # ==============================
+
+    def _pages_needed(self, remaining: int, per_page: float) -> int:
+        return math.ceil(remaining / max(per_page, 1.0))
+
+    async def _changed_records(
+        self,
+        delta: PageDelta,
+        records: List[Dict[str, Any]],
+        taken: int,
+    ) -> List[Dict[str, Any]]:
         """
-        Main scraping orchestration method.
-        Fetches multiple pages concurrently and
-        returns up to `limit` records.
+        Keep the records that are new or changed since the stored
+        fingerprint. When `limit` cuts the page short, only the emitted
+        records are merged into the stored fingerprint, so the rest of
+        the page is still reported on the next run; removals are only
+        counted once the whole page was seen.
+        """
+
+        stats = self.delta
+        if delta.parsed is None:
+            stats.pages_unchanged += 1
+            stats.records_unchanged += taken
+            return []
+
+        stats.pages_changed += 1
+        previous = delta.previous.records if delta.previous else []
+        known = dict(previous)
+
+        changed = []
+        for record, (identity, content) in zip(records, delta.fingerprint.records):
+            if identity not in known:
+                stats.records_new += 1
+            elif known[identity] != content:
+                stats.records_changed += 1
+            else:
+                stats.records_unchanged += 1
+                continue
+            changed.append(record)
+
+        if taken == len(delta.fingerprint.records):
+            current = {identity for identity, _ in delta.fingerprint.records}
+            stats.records_removed += len(known.keys() - current)
+            await self.fingerprints.set(delta.url, delta.fingerprint)
+        else:
+            # The body hash stays stale so the page is parsed again.
+            known.update(delta.fingerprint.records[:taken])
+            await self.fingerprints.set(
+                delta.url,
+                PageFingerprint(
+                    body_hash=delta.previous.body_hash if delta.previous else b"",
+                    records=list(known.items()),
+                    is_last=delta.fingerprint.is_last,
+                ),
+            )
+
+        return changed
+
+    async def _crawl_pages(self, limit: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Sliding-window crawl over numbered pages.
+
+        Keeps at most `max_concurrency` fetches in flight and only as
+        many as the remaining `limit` requires, based on the running
+        average of records per page. Pages are yielded in page order.
+        Crawling stops once `limit` records were yielded or the site
+        runs out of pages; fetches no longer needed are cancelled.
+        """
+
+        in_flight: Dict[int, asyncio.Task] = {}
+        discarded: List[asyncio.Task] = []
+        finished: Dict[int, Union[ParsedPage, PageDelta, None]] = {}
+
+        next_page = 1
+        emit_page = 1
+        last_page: Optional[int] = None
+        remaining = limit
+
+        seen_pages = 0
+        seen_records = 0
+        consecutive_failures = 0
+
+        def cancel_beyond(page: int) -> None:
+            for number in [n for n in in_flight if n > page]:
+                task = in_flight.pop(number)
+                task.cancel()
+                discarded.append(task)
+            for number in [n for n in finished if n > page]:
+                del finished[number]
+
+        try:
+            while True:
+                per_page = (
+                    seen_records / seen_pages if seen_pages else self.items_per_page
+                )
+                while (
+                    len(in_flight) < self.max_concurrency
+                    and (last_page is None or next_page <= last_page)
+                    and len(in_flight) + len(finished)
+                    < self._pages_needed(remaining, per_page)
+                ):
+                    in_flight[next_page] = asyncio.create_task(
+                        self._fetch_and_parse(next_page)
+                    )
+                    next_page += 1
+
+                while emit_page in finished:
+                    outcome = finished.pop(emit_page)
+                    page = emit_page
+                    emit_page += 1
+
+                    if outcome is None:
+                        consecutive_failures += 1
+                        if consecutive_failures >= self.max_concurrency:
+                            self.logger.error(
+                                f"Aborting crawl after {consecutive_failures} failed pages"
+                            )
+                            return
+                        continue
+
+                    consecutive_failures = 0
+
+                    if isinstance(outcome, PageDelta):
+                        parsed = outcome.parsed
+                        size = len(outcome.fingerprint.records)
+                        is_last = outcome.fingerprint.is_last
+                    else:
+                        parsed = outcome
+                        size = len(parsed.records)
+                        is_last = parsed.is_last
+
+                    if not size:
+                        last_page = page - 1
+                        cancel_beyond(last_page)
+                        continue
+
+                    seen_pages += 1
+                    seen_records += size
+
+                    if is_last:
+                        last_page = page
+                        cancel_beyond(last_page)
+
+                    taken = min(size, remaining)
+                    remaining -= taken
+                    records = parsed.records[:taken] if parsed else []
+
+                    if isinstance(outcome, PageDelta):
+                        records = await self._changed_records(outcome, records, taken)
+
+                    if records:
+                        yield records
+
+                    if remaining <= 0:
+                        return
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(
+                    in_flight.values(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for number in [n for n, t in in_flight.items() if t in done]:
+                    finished[number] = in_flight.pop(number).result()
+
+        finally:
+            pending = list(in_flight.values()) + discarded
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iter_records(self, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream up to `limit` records as soon as each page is parsed.
+
+        New fetches are only scheduled while the consumer is pulling,
+        so a slow consumer holds at most one window of pages in memory.
+        Break out early inside `contextlib.aclosing(...)` to cancel
+        outstanding fetches immediately. Pages that failed are listed
+        in `self.failures` once iteration ends.
+
+        In incremental mode `limit` counts the records scanned on the
+        site, of which only new or changed ones are yielded.
         """
 
         if limit <= 0:
             raise ValueError("Limit must be greater than zero.")
 
-        collected: List[Dict[str, Any]] = []
+        self.failures = []
+        self.delta = DeltaStats() if self.fingerprints is not None else None
+
+        async with self.client:
+            async for page_data in self._crawl_pages(limit):
+                for record in page_data:
+                    yield record
+
+    async def scrape_result(self, limit: int) -> ScrapeResult:
+        """
+        Scrape up to `limit` records and report failed pages alongside.
+        """
 
-        # quotes.toscrape.com has 10 quotes per page
-        items_per_page = 10
-        pages_needed = (limit // items_per_page) + 2
+        if limit <= 0:
+            raise ValueError("Limit must be greater than zero.")
 
         self.logger.info(
-            f"Scraping started | limit={limit} | pages={pages_needed}"
+            f"Scraping started | limit={limit} | window={self.max_concurrency}"
         )
 
-        async with self.client:
-            tasks = [
-                self._fetch_and_parse(page)
-                for page in range(1, pages_needed + 1)
-            ]
+        with metrics.span("scrape", limit=limit, host=self.host):
+            collected = [record async for record in self.iter_records(limit)]
 
-            results = await asyncio.gather(*tasks)
+        self.logger.info(
+            f"Scraping completed | records={len(collected)} | failed_pages={len(self.failures)}"
+            + (f" | delta={self.delta}" if self.delta else "")
+        )
 
-            for page_data in results:
-                for item in page_data:
-                    collected.append(item)
-                    if len(collected) >= limit:
-                        break
-                if len(collected) >= limit:
-                    break
+        return ScrapeResult(
+            records=collected,
+            failures=list(self.failures),
+            delta=self.delta,
+        )
 
-        self.logger.info(f"Scraping completed | records={len(collected)}")
+    async def scrape(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Main scraping orchestration method.
+        Returns up to `limit` records; see `scrape_result` for failures.
+        """
 
-        return collected
\ No newline at end of file
+        return (await self.scrape_result(limit)).records
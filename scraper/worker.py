@@ -0,0 +1,154 @@
+"""
+Standalone crawl workers.
+
+Runs one or more worker processes that claim pages from the shared
+job store (SQLite locally, Postgres when SCRAPER_JOBS_DATABASE_URL
+is set) and checkpoint their results there. Start as many as needed,
+on as many hosts as needed; each page is leased to one worker at a time.
+
+Usage:
+    python -m scraper.worker --processes 4
+    python -m scraper.worker --submit 500 --delay 0.5 --until-idle
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import multiprocessing
+import signal
+from typing import List, Optional
+
+from .client import ScraperClient
+from .config import ScraperConfig
+from .jobs import CrawlWorker, build_job_store
+
+
+logger = logging.getLogger("CrawlWorkerPool")
+
+
+def _configure_logging() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(process)d | %(name)s | %(message)s",
+    )
+
+
+async def _submit(config: ScraperConfig, pages: int, delay: float, lookahead: int) -> int:
+    store = build_job_store(config)
+    try:
+        job = await store.submit(pages, delay, lookahead)
+    finally:
+        await store.close()
+    return job.id
+
+
+async def _serve(config: ScraperConfig, until_idle: bool) -> None:
+    store = build_job_store(config)
+    worker = CrawlWorker(
+        store,
+        ScraperClient.from_config(config),
+        concurrency=config.job_worker_concurrency,
+        parser_engine=config.parser_engine,
+    )
+
+    # Let leased pages finish and checkpoint on SIGINT/SIGTERM.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await worker.run(stop, until_idle=until_idle)
+    finally:
+        await store.close()
+
+
+def run_worker(config: ScraperConfig, until_idle: bool = False) -> None:
+    """
+    Entry point of one worker process.
+    """
+
+    _configure_logging()
+    asyncio.run(_serve(config, until_idle))
+
+
+def run_pool(config: ScraperConfig, processes: int, until_idle: bool = False) -> int:
+    """
+    Run `processes` worker processes and wait for all of them.
+    Returns the number of processes that exited with an error.
+    """
+
+    if processes == 1:
+        run_worker(config, until_idle)
+        return 0
+
+    # Spawned rather than forked: every process opens its own
+    # database and HTTP connections.
+    context = multiprocessing.get_context("spawn")
+    pool: List[multiprocessing.process.BaseProcess] = [
+        context.Process(target=run_worker, args=(config, until_idle), name=f"crawl-worker-{n}")
+        for n in range(processes)
+    ]
+    for process in pool:
+        process.start()
+    logger.info(f"Started {processes} crawl worker processes")
+
+    # Children receive the terminal's SIGINT themselves and stop
+    # gracefully; the parent only waits for them.
+    for process in pool:
+        while True:
+            try:
+                process.join()
+                break
+            except KeyboardInterrupt:
+                continue
+
+    return sum(1 for process in pool if process.exitcode)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m scraper.worker",
+        description="Run crawl workers against the shared job store.",
+    )
+    parser.add_argument("--processes", type=int, default=1, help="worker processes to run")
+    parser.add_argument("--concurrency", type=int, help="pages in flight per process")
+    parser.add_argument("--jobs-file", help="SQLite job store path")
+    parser.add_argument("--database-url", help="Postgres job store URL")
+    parser.add_argument("--until-idle", action="store_true", help="exit once no pages are left")
+    parser.add_argument("--submit", type=int, metavar="PAGES", help="queue a crawl of PAGES pages first")
+    parser.add_argument("--delay", type=float, default=1.0, help="politeness delay of a submitted crawl")
+    parser.add_argument("--lookahead", type=int, default=10, help="frontier lookahead of a submitted crawl")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.processes <= 0:
+        raise SystemExit("--processes must be greater than 0.")
+
+    overrides = {
+        "job_worker_concurrency": args.concurrency,
+        "jobs_path": args.jobs_file,
+        "jobs_database_url": args.database_url,
+    }
+    config = dataclasses.replace(
+        ScraperConfig(),
+        **{name: value for name, value in overrides.items() if value is not None},
+    )
+
+    _configure_logging()
+    if args.submit:
+        job_id = asyncio.run(_submit(config, args.submit, args.delay, args.lookahead))
+        logger.info(f"Crawl job {job_id} submitted | pages={args.submit}, delay={args.delay}")
+
+    return 1 if run_pool(config, args.processes, args.until_idle) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+import importlib.util
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# The posts API is exercised against a throwaway SQLite file. Its async
+# engine needs aiosqlite; without it the database tests are skipped.
+try:
+    import aiosqlite  # noqa: F401
+except ImportError:
+    SQLITE_PATH = None
+else:
+    SQLITE_PATH = Path(tempfile.mkdtemp()) / "posts.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{SQLITE_PATH}"
+    os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{SQLITE_PATH}"
+
+# search_vector is a generated TSVECTOR on Postgres; a plain column here.
+POSTS_DDL = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    content TEXT,
+    search_vector TEXT
+)
+"""
+
+
+def load_api():
+    """
+    Import api.py, which uses relative imports, as `app.api`.
+    """
+    module = sys.modules.get("app.api")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("app.api", ROOT / "api.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["app.api"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def posts_db():
+    if SQLITE_PATH is None:
+        pytest.skip("aiosqlite is required for the database tests")
+
+    with sqlite3.connect(SQLITE_PATH) as conn:
+        conn.execute(POSTS_DDL)
+        conn.execute("DELETE FROM posts")
+    return SQLITE_PATH
+
+
+@pytest.fixture
+def posts_api(posts_db):
+    from fastapi.testclient import TestClient
+
+    from app.pagination import post_count_cache
+    from app.response_cache import MemoryCacheBackend
+
+    api = load_api()
+    api.post_response_cache.backend = MemoryCacheBackend()
+    api.limiter.reset()
+    post_count_cache.invalidate()
+
+    with TestClient(api.app) as client:
+        yield client
+    api.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def seeded(posts_db):
+    """
+    Posts 1-25 titled "Post {n}", at https://example.com/{n}.
+    """
+    with sqlite3.connect(posts_db) as conn:
+        conn.executemany(
+            "INSERT INTO posts (title, url, content) VALUES (?, ?, ?)",
+            [(f"Post {n}", f"https://example.com/{n}", f"Body {n}") for n in range(1, 26)],
+        )
+    return posts_db
@@ -0,0 +1,108 @@
+import fnmatch
+import threading
+import time
+
+
+class FakeRedis:
+    """
+    Local stand-in for the subset of the redis-py client used by the
+    shared backends. Keys expire like Redis `PX` keys.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        # Re-entrant so a pipeline can run its commands atomically.
+        self.lock = threading.RLock()
+
+    def _live(self, key):
+        expires = self.expires.get(key)
+        if expires is not None and time.monotonic() >= expires:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def get(self, key):
+        with self.lock:
+            return self.data[key] if self._live(key) else None
+
+    def mget(self, *keys):
+        with self.lock:
+            return [self.data[key] if self._live(key) else None for key in keys]
+
+    def set(self, key, value, px=None, nx=False):
+        with self.lock:
+            if nx and self._live(key):
+                return None
+            self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+            if px is None:
+                self.expires.pop(key, None)
+            else:
+                self.expires[key] = time.monotonic() + px / 1000
+            return True
+
+    def delete(self, *keys):
+        with self.lock:
+            removed = 0
+            for key in keys:
+                removed += self._live(key)
+                self.data.pop(key, None)
+                self.expires.pop(key, None)
+            return removed
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def incrby(self, key, amount):
+        with self.lock:
+            value = int(self.data[key]) + amount if self._live(key) else amount
+            self.data[key] = str(value).encode()
+            return value
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+    def pttl(self, key):
+        with self.lock:
+            if not self._live(key):
+                return -2
+            if key not in self.expires:
+                return -1
+            return int((self.expires[key] - time.monotonic()) * 1000)
+
+    def scan_iter(self, match="*"):
+        with self.lock:
+            keys = [key for key in list(self.data) if self._live(key)]
+        return iter([key for key in keys if fnmatch.fnmatchcase(key, match)])
+
+    def ping(self):
+        return True
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """
+    Queues commands and runs them atomically on `execute`, like a
+    redis-py transaction pipeline.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        with self.client.lock:
+            results = [method(*args, **kwargs) for method, args, kwargs in self.commands]
+        self.commands = []
+        return results
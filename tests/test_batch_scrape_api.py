@@ -0,0 +1,92 @@
+import sqlite3
+
+import httpx
+import pytest
+
+from app.response_cache import post_response_cache
+from app.routers.scraper_router import get_scraper_client
+from conftest import load_api
+from scraper.client import ScraperClient
+
+
+@pytest.fixture
+def site(posts_db):
+    """
+    Pages are served with their path as title. Fetching /raced inserts
+    that URL first, as a concurrent writer would after the lookup.
+    """
+
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        if request.url.path == "/raced":
+            with sqlite3.connect(posts_db) as conn:
+                conn.execute("INSERT INTO posts (title, url) VALUES ('Other writer', ?)", (str(request.url),))
+        return httpx.Response(200, text=f"<html><title> Page {request.url.path} </title></html>")
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def scrape_api(posts_api, site):
+    client = ScraperClient("https://site.test", transport=site)
+    posts_api.portal.call(client.open)
+    load_api().app.dependency_overrides[get_scraper_client] = lambda: client
+    yield posts_api
+    posts_api.portal.call(client.aclose)
+
+
+def test_batch_scrape_mixed_outcomes(posts_db, scrape_api):
+    with sqlite3.connect(posts_db) as conn:
+        conn.execute("INSERT INTO posts (title, url) VALUES ('Known', 'https://site.test/known')")
+    generation = post_response_cache.generation()
+
+    urls = [
+        "https://site.test/a",
+        "https://site.test/known",
+        "https://site.test/missing",
+        "not a url",
+        "https://site.test/a",
+        "https://site.test/raced",
+    ]
+    response = scrape_api.post("/scrape/batch", json={"urls": urls})
+
+    assert response.status_code == 200
+    body = response.json()
+    by_url = {item["url"]: item for item in body["results"]}
+    assert [item["url"] for item in body["results"]] == list(dict.fromkeys(urls))
+    assert (body["total"], body["created"], body["existing"], body["failed"]) == (5, 1, 2, 2)
+
+    assert by_url["https://site.test/a"]["status"] == "created"
+    assert by_url["https://site.test/known"] == {"url": "https://site.test/known", "status": "exists", "id": 1, "error": None}
+    assert "404" in by_url["https://site.test/missing"]["error"]
+    assert by_url["not a url"]["status"] == "failed"
+    # Skipped by ON CONFLICT DO NOTHING; reported with the other row's id.
+    raced = by_url["https://site.test/raced"]
+    assert raced["status"] == "exists" and raced["id"] is not None
+
+    with sqlite3.connect(posts_db) as conn:
+        titles = dict(conn.execute("SELECT url, title FROM posts"))
+    assert titles["https://site.test/a"] == "Page /a"
+    assert titles["https://site.test/raced"] == "Other writer"
+
+    assert post_response_cache.generation() != generation
+    assert scrape_api.get("/posts").json()["total"] == 3
+
+
+def test_batch_scrape_serves_fresh_lists_after_insert(scrape_api):
+    assert scrape_api.get("/posts").json()["data"] == []
+
+    scrape_api.post("/scrape/batch", json={"urls": ["https://site.test/b"]})
+
+    assert [post["url"] for post in scrape_api.get("/posts").json()["data"]] == ["https://site.test/b"]
+
+
+def test_batch_scrape_without_new_posts_keeps_cache(scrape_api):
+    generation = post_response_cache.generation()
+
+    body = scrape_api.post("/scrape/batch", json={"urls": ["https://site.test/missing"]}).json()
+
+    assert body["failed"] == 1
+    assert post_response_cache.generation() == generation
+    assert scrape_api.post("/scrape/batch", json={"urls": []}).status_code == 422
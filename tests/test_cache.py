@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.cache import (
+    CachedResponse,
+    MemoryResponseCache,
+    ParsedPageMemo,
+    SQLiteResponseCache,
+)
+from scraper.client import ScraperClient
+from scraper.parser import ParsedPage
+from scraper.service import ScraperService
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResponseCache(max_entries=2)
+
+    async def run():
+        await cache.set("a", CachedResponse(body="A"))
+        await cache.set("b", CachedResponse(body="B"))
+        await cache.get("a")
+        await cache.set("c", CachedResponse(body="C"))
+        return await cache.get("a"), await cache.get("b")
+
+    a, b = asyncio.run(run())
+
+    assert a.body == "A"
+    assert b is None
+
+
+def test_sqlite_cache_evicts_by_size(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.db"), max_bytes=10)
+
+    async def run():
+        await cache.set("a", CachedResponse(body="x" * 6, etag='"a"'))
+        await cache.set("b", CachedResponse(body="y" * 6, etag='"b"'))
+        result = await cache.get("a"), await cache.get("b")
+        await cache.close()
+        return result
+
+    a, b = asyncio.run(run())
+
+    assert a is None
+    assert b.etag == '"b"'
+    assert cache.total_bytes == 6
+
+
+def test_conditional_get_reuses_cached_body_and_parse():
+    site = StubQuoteSite(pages=3, etags=True)
+    client = ScraperClient(
+        "http://stub.local",
+        transport=httpx.ASGITransport(app=site),
+        cache=MemoryResponseCache(),
+    )
+    memo = ParsedPageMemo()
+
+    first = asyncio.run(ScraperService(client, 0.0, parse_memo=memo).scrape(30))
+    second = asyncio.run(ScraperService(client, 0.0, parse_memo=memo).scrape(30))
+
+    assert first == second
+    assert site.not_modified == 3
+    assert client.pool_stats()["cache_hits"] == 3
+
+
+def test_parsed_page_memo_is_keyed_by_engine():
+    memo = ParsedPageMemo()
+    html = "<html><body>same body</body></html>"
+    memo.set(html, ParsedPage(records=[{"text": "from bs4"}]), "bs4")
+
+    assert memo.get(html, "selectolax") is None
+    memo.set(html, ParsedPage(records=[{"text": "from selectolax"}]), "selectolax")
+
+    assert memo.get(html, "bs4").records == [{"text": "from bs4"}]
+    assert memo.get(html, "selectolax").records == [{"text": "from selectolax"}]
@@ -0,0 +1,31 @@
+import asyncio
+
+import httpx
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from scraper.config import ScraperConfig
+from scraper.service import ScraperService
+
+
+def test_shared_client_survives_scrapes():
+    site = StubQuoteSite(pages=5)
+    config = ScraperConfig(base_url="http://stub.local", max_connections_per_host=2)
+    client = ScraperClient.from_config(config, transport=httpx.ASGITransport(app=site))
+
+    async def run():
+        await client.open()
+        try:
+            first = await ScraperService(client, delay=0.0).scrape(15)
+            second = await ScraperService(client, delay=0.0).scrape(15)
+            return first, second, client.is_open, client.pool_stats()
+        finally:
+            await client.aclose()
+
+    first, second, still_open, stats = asyncio.run(run())
+
+    assert len(first) == len(second) == 15
+    assert still_open
+    assert stats["requests_total"] == 4
+    assert stats["in_flight"] == 0
+    assert stats["max_connections_per_host"] == 2
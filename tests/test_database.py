@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import POOL_OPTIONS, async_engine, engine, get_async_db, pool_options
+
+
+def test_pool_options_defaults_and_overrides():
+    assert pool_options({}) == {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    assert pool_options({
+        "DB_POOL_SIZE": "20",
+        "DB_MAX_OVERFLOW": "0",
+        "DB_POOL_PRE_PING": "false",
+        "DB_POOL_RECYCLE": "-1",
+    }) == {"pool_size": 20, "max_overflow": 0, "pool_pre_ping": False, "pool_recycle": -1}
+
+
+@pytest.mark.parametrize("name, value, message", [
+    ("DB_POOL_SIZE", "ten", "DB_POOL_SIZE must be an integer, got 'ten'"),
+    ("DB_POOL_SIZE", "0", "DB_POOL_SIZE must be at least 1"),
+    ("DB_MAX_OVERFLOW", "-2", "DB_MAX_OVERFLOW must be at least 0"),
+    ("DB_POOL_RECYCLE", "1.5", "DB_POOL_RECYCLE must be an integer"),
+])
+def test_pool_options_reject_invalid_values(name, value, message):
+    with pytest.raises(ValueError, match=message):
+        pool_options({name: value})
+
+
+def test_engines_use_pool_options():
+    for pool in (engine.pool, async_engine.pool):
+        assert pool.size() == POOL_OPTIONS["pool_size"]
+        assert pool._max_overflow == POOL_OPTIONS["max_overflow"]
+        assert pool._pre_ping == POOL_OPTIONS["pool_pre_ping"]
+        assert pool._recycle == POOL_OPTIONS["pool_recycle"]
+
+
+def test_async_dependency_yields_a_working_session(posts_db):
+    async def run():
+        dependency = get_async_db()
+        db = await anext(dependency)
+        try:
+            assert isinstance(db, AsyncSession)
+            assert db.bind is async_engine
+            return await db.scalar(text("SELECT count(*) FROM posts"))
+        finally:
+            await dependency.aclose()
+            assert async_engine.pool.checkedout() == 0
+            # Pooled connections belong to this event loop.
+            await async_engine.dispose()
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,25 @@
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from scraper.executor import ParseExecutor
+from scraper.service import ScraperService
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_pooled_parsing_matches_inline(kind):
+    executor = ParseExecutor(kind=kind, workers=2, batch_size=4)
+
+    def scrape(parse_executor):
+        site = StubQuoteSite(pages=12)
+        client = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+        service = ScraperService(client, 0.0, parse_executor=parse_executor)
+        return asyncio.run(service.scrape(100))
+
+    try:
+        assert scrape(executor) == scrape(None)
+    finally:
+        executor.close()
@@ -0,0 +1,165 @@
+import asyncio
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from scraper.exporter import CSVExporter, JSONExporter, SQLiteExporter
+
+
+def quotes(count):
+    return [
+        {"text": f"Quote {i} about life", "author": f"Author {i}", "tags": "life"}
+        for i in range(count)
+    ]
+
+
+def test_sqlite_search_pages_through_ranked_hits(tmp_path):
+    exporter = SQLiteExporter(str(tmp_path / "quotes.db"))
+    exporter.export(quotes(5) + [{"text": "Unrelated", "author": "Nobody", "tags": ""}])
+
+    first, cursor = exporter.search("life", limit=3)
+    rest, end = exporter.search("life", limit=3, after=cursor)
+
+    ids = [hit["id"] for hit in first + rest]
+    assert sorted(ids) == [1, 2, 3, 4, 5]
+    assert "<b>life</b>" in first[0]["highlight"]
+    assert end is None
+
+
+def test_exporters_stream_generators(tmp_path):
+    csv_exporter = CSVExporter(str(tmp_path / "quotes.csv"))
+    json_exporter = JSONExporter(str(tmp_path / "quotes.json"))
+    ndjson_exporter = JSONExporter(str(tmp_path / "quotes.ndjson"), lines=True)
+    sqlite_exporter = SQLiteExporter(str(tmp_path / "quotes.db"), chunk_size=2)
+
+    for exporter in (csv_exporter, json_exporter, ndjson_exporter, sqlite_exporter):
+        assert exporter.export(iter(quotes(5))) == 5
+
+    with open(tmp_path / "quotes.csv", newline="", encoding="utf-8") as f:
+        assert list(csv.DictReader(f)) == quotes(5)
+
+    assert json.loads((tmp_path / "quotes.json").read_text(encoding="utf-8")) == quotes(5)
+    assert (tmp_path / "quotes.json").read_text(encoding="utf-8") == json.dumps(
+        quotes(5), indent=4, ensure_ascii=False
+    )
+
+    lines = (tmp_path / "quotes.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == quotes(5)
+
+    with sqlite3.connect(tmp_path / "quotes.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM quotes").fetchone() == (5,)
+
+
+def test_aexport_consumes_async_iterables(tmp_path):
+    async def produce():
+        for record in quotes(3):
+            await asyncio.sleep(0)
+            yield record
+
+    exporter = JSONExporter(str(tmp_path / "quotes.ndjson"), lines=True)
+    assert asyncio.run(exporter.aexport(produce())) == 3
+    assert asyncio.run(exporter.aexport(quotes(2))) == 2
+
+
+def test_invalid_record_mid_stream_leaves_no_partial_file(tmp_path):
+    exporter = CSVExporter(str(tmp_path / "quotes.csv"))
+    records = quotes(3) + [{"text": "No author"}]
+
+    with pytest.raises(ValueError, match="Missing required keys"):
+        exporter.export(iter(records))
+
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(ValueError, match="empty dataset"):
+        exporter.export(iter([]))
+    with pytest.raises(TypeError):
+        exporter.export({"text": "x", "author": "y", "tags": ""})
+
+
+def test_parquet_row_groups_dictionary_and_partitions(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from datetime import date
+
+    from scraper.exporter import ParquetExporter
+
+    path = tmp_path / "quotes.parquet"
+    assert ParquetExporter(str(path), row_group_size=2).export(iter(quotes(5))) == 5
+
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    author = metadata.schema.names.index("author")
+    assert "RLE_DICTIONARY" in metadata.row_group(0).column(author).encodings
+    assert pq.read_table(path).to_pylist() == quotes(5)
+
+    dataset = tmp_path / "dataset"
+    records = [{"text": "x", "author": name, "tags": ""} for name in ("Ann", "Bob", "amy")]
+    for partition_by in ("author_initial", "scrape_date"):
+        exporter = ParquetExporter(
+            str(dataset / partition_by),
+            compression="snappy",
+            partition_by=partition_by,
+            scrape_date=date(2026, 1, 2),
+        )
+        exporter.export(records)
+
+    assert sorted(p.name for p in (dataset / "author_initial").iterdir()) == [
+        "author_initial=A", "author_initial=B"
+    ]
+    table = pq.read_table(dataset / "scrape_date", partitioning="hive")
+    assert table.num_rows == 3
+    assert set(table.column("scrape_date").to_pylist()) == {"2026-01-02"}
+
+
+def test_sqlite_bulk_mode_dedupes_by_hash_and_normalizes_tags(tmp_path):
+    path = tmp_path / "quotes.db"
+    records = [
+        {"text": "Be yourself", "author": "Wilde", "tags": "life, humor, life"},
+        {"text": "Be yourself", "author": "Wilde", "tags": "ignored"},
+        {"text": "Stay hungry", "author": "Jobs", "tags": ""},
+    ]
+
+    with SQLiteExporter(str(path), chunk_size=2, bulk=True) as exporter:
+        exporter.export(records)
+        exporter.export(records)
+        assert exporter.inserted == 2
+
+        conn = exporter._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert conn.execute("PRAGMA synchronous").fetchone() == (1,)
+        assert conn.execute("SELECT COUNT(*) FROM tags").fetchone() == (2,)
+        assert conn.execute(
+            "SELECT text, author, tags FROM quotes_view ORDER BY id"
+        ).fetchall() == [
+            ("Be yourself", "Wilde", "life, humor, life"),
+            ("Stay hungry", "Jobs", ""),
+        ]
+
+        conn.execute("DELETE FROM quotes WHERE author = 'Wilde'")
+        conn.commit()
+        assert exporter.search("humor") == ([], None)
+        assert conn.execute("SELECT COUNT(*) FROM quote_tags").fetchone() == (0,)
+
+
+def test_sqlite_migrates_legacy_unique_layout(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("""
+            CREATE TABLE quotes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                author TEXT NOT NULL,
+                tags TEXT,
+                UNIQUE(text, author)
+            )
+        """)
+        conn.execute("INSERT INTO quotes (text, author, tags) VALUES ('Old quote', 'Sage', 'wisdom, old')")
+
+    with SQLiteExporter(str(path)) as exporter:
+        exporter.export([{"text": "Old quote", "author": "Sage", "tags": "wisdom, old"}] + quotes(1))
+        assert exporter.inserted == 1
+
+        hits, _ = exporter.search("wisdom")
+        assert [(hit["id"], hit["tags"]) for hit in hits] == [(1, "wisdom, old")]
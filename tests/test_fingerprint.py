@@ -0,0 +1,123 @@
+import asyncio
+
+import httpx
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from scraper.fingerprint import (
+    MemoryFingerprintStore,
+    PageFingerprint,
+    SQLiteFingerprintStore,
+    record_digests,
+)
+from scraper.service import ScraperService
+
+
+class EditableSite(StubQuoteSite):
+    """
+    Stub site whose page 2 can be edited: one quote retagged,
+    one replaced by a new quote.
+    """
+
+    edited = False
+
+    def render_page(self, page: int) -> str:
+        html = super().render_page(page)
+        if self.edited and page == 2:
+            html = html.replace('href="/tag/t3/">t3</a>', 'href="/tag/new/">new</a>', 1)
+            html = html.replace("Quote number 19<", "Brand new quote<")
+        return html
+
+
+def make_service(site, store):
+    client = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+    return ScraperService(client, delay=0.0, fingerprints=store)
+
+
+def test_incremental_scrape_emits_only_new_and_changed_records():
+    site = EditableSite(pages=3)
+    store = MemoryFingerprintStore()
+
+    async def run():
+        first = await make_service(site, store).scrape_result(100)
+
+        service = make_service(site, store)
+        parsed = []
+        original = service._parse
+
+        async def spy(html):
+            parsed.append(html)
+            return await original(html)
+
+        service._parse = spy
+        unchanged = await service.scrape_result(100)
+
+        site.edited = True
+        edited = await make_service(site, store).scrape_result(100)
+        return first, unchanged, parsed, edited
+
+    first, unchanged, parsed, edited = asyncio.run(run())
+
+    assert len(first.records) == 30
+    assert first.delta.records_new == 30
+
+    assert unchanged.records == []
+    assert unchanged.delta.pages_unchanged == 3
+    assert unchanged.delta.records_unchanged == 30
+    # Only the empty pages past the end are parsed.
+    assert not any('class="quote"' in html for html in parsed)
+
+    texts = sorted(record["text"] for record in edited.records)
+    assert texts == ["Brand new quote", "Quote number 10"]
+    assert edited.delta.pages_changed == 1
+    assert edited.delta.records_new == 1
+    assert edited.delta.records_changed == 1
+    assert edited.delta.records_removed == 1
+
+
+def test_truncated_page_remembers_emitted_records():
+    site = StubQuoteSite(pages=3)
+    store = MemoryFingerprintStore()
+
+    async def run():
+        partial = await make_service(site, store).scrape_result(25)
+        rest = await make_service(site, store).scrape_result(100)
+        again = await make_service(site, store).scrape_result(100)
+        return partial, rest, again
+
+    partial, rest, again = asyncio.run(run())
+
+    assert len(partial.records) == 25
+    assert partial.delta.records_new == 25
+    # Page 3 was cut off after 5 records: only its other 5 are new.
+    assert [record["text"] for record in rest.records] == [
+        f"Quote number {n}" for n in range(25, 30)
+    ]
+    assert rest.delta.records_new == 5
+    assert rest.delta.records_removed == 0
+    assert again.records == []
+    assert again.delta.pages_unchanged == 3
+
+
+def test_sqlite_store_persists_fingerprints(tmp_path):
+    path = str(tmp_path / "fingerprints.db")
+    record = {"text": "Quote", "author": "Author", "tags": "a, b"}
+    fingerprint = PageFingerprint(b"x" * 16, [record_digests(record)], is_last=True)
+
+    async def run():
+        store = SQLiteFingerprintStore(path)
+        await store.set("http://stub.local/page/1/", fingerprint)
+        await store.close()
+
+        reopened = SQLiteFingerprintStore(path)
+        loaded = await reopened.get("http://stub.local/page/1/")
+        missing = await reopened.get("http://stub.local/page/2/")
+        await reopened.close()
+        return loaded, missing
+
+    loaded, missing = asyncio.run(run())
+
+    assert loaded.body_hash == fingerprint.body_hash
+    assert loaded.records == fingerprint.records
+    assert loaded.is_last is True
+    assert missing is None
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import sqlite3
+import time
+
+import httpx
+import pytest
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from scraper.jobs import CrawlWorker, SQLiteJobStore
+from scraper.parser import ParsedPage
+
+
+def make_worker(store, site, **kwargs):
+    client = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+    return CrawlWorker(store, client, poll_interval=0.01, **kwargs)
+
+
+def test_worker_crawls_job_to_the_end_of_the_site(tmp_path):
+    site = StubQuoteSite(pages=7)
+
+    async def run():
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        job = await store.submit(max_pages=100, delay=0.0, lookahead=3)
+        await make_worker(store, site, concurrency=3).run(until_idle=True)
+
+        finished = await store.get(job.id)
+        first = await store.records(job.id, limit=50)
+        rest = await store.records(job.id, after=(first[-1]["page"], first[-1]["position"]))
+        await store.close()
+        return finished, first + rest
+
+    job, records = asyncio.run(run())
+
+    assert job.state == "done"
+    assert job.records == 70
+    assert job.last_page == 7
+    assert job.pages["done"] >= 7  # pages probed past the end are done, empty
+    assert job.pages["pending"] == job.pages["in_flight"] == 0
+    assert [record["text"] for record in records] == [f"Quote number {n}" for n in range(70)]
+
+
+def test_expired_lease_is_resumed_by_another_worker(tmp_path):
+    site = StubQuoteSite(pages=2)
+
+    async def run():
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"), lease_timeout=0.05)
+        job = await store.submit(max_pages=2, delay=0.0, lookahead=2)
+
+        # A worker that dies after claiming page 1.
+        [stale] = await store.claim("crashed", limit=1)
+        await asyncio.sleep(0.1)
+
+        await make_worker(store, site).run(until_idle=True)
+        late = await store.complete(stale, ParsedPage(records=[]))
+        finished = await store.get(job.id)
+        await store.close()
+        return stale, late, finished
+
+    stale, late, job = asyncio.run(run())
+
+    assert stale.page == 1
+    assert late is False
+    assert job.state == "done"
+    assert job.records == 20
+
+
+def test_slow_page_keeps_its_lease_while_processed(tmp_path):
+    # Each page takes several lease timeouts to fetch.
+    site = StubQuoteSite(pages=1, latency=0.3)
+
+    async def run():
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"), lease_timeout=0.1)
+        job = await store.submit(max_pages=1, delay=0.0, lookahead=1)
+        worker = asyncio.create_task(make_worker(store, site).run(until_idle=True))
+
+        await asyncio.sleep(0.2)
+        stolen = await store.claim("other", limit=1)
+        await worker
+        finished = await store.get(job.id)
+        await store.close()
+        return stolen, finished
+
+    stolen, job = asyncio.run(run())
+
+    assert stolen == []
+    assert job.state == "done"
+    assert job.records == 10
+
+
+class FlakyRenewStore(SQLiteJobStore):
+    def __init__(self, path, error=None):
+        super().__init__(path)
+        self.error = error
+
+    async def renew(self, lease):
+        if self.error:
+            raise self.error
+        return False
+
+
+@pytest.mark.parametrize("error, level, message", [
+    (None, logging.WARNING, "Lease lost"),
+    (sqlite3.OperationalError("database is locked"), logging.ERROR, "database is locked"),
+])
+def test_page_is_abandoned_when_its_lease_cannot_be_renewed(tmp_path, caplog, error, level, message):
+    site = StubQuoteSite(pages=1, latency=1.0)
+
+    async def run():
+        store = FlakyRenewStore(str(tmp_path / "jobs.db"), error)
+        job = await store.submit(max_pages=1, delay=0.0, lookahead=1)
+        worker = make_worker(store, site, heartbeat_interval=0.02)
+
+        start = time.monotonic()
+        await worker.run(until_idle=True)
+        elapsed = time.monotonic() - start
+
+        finished = await store.get(job.id)
+        await store.close()
+        return worker, elapsed, finished
+
+    with caplog.at_level(logging.WARNING, logger="CrawlWorker"):
+        worker, elapsed, job = asyncio.run(run())
+
+    # The slow fetch was cancelled rather than checkpointed.
+    assert elapsed < 0.5
+    assert worker.pages_done == 0
+    assert job.records == 0
+    assert job.pages["in_flight"] == 1
+    [record] = [r for r in caplog.records if "abandoned" in r.getMessage()]
+    assert record.levelno == level
+    assert message in record.getMessage()
+
+
+def test_renew_extends_only_a_held_lease(tmp_path):
+    async def run():
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"), lease_timeout=0.05)
+        await store.submit(max_pages=1, delay=0.0, lookahead=1)
+        [lease] = await store.claim("worker", limit=1)
+        claimed_until = lease.expires
+
+        await asyncio.sleep(0.01)
+        renewed = await store.renew(lease)
+        renewed_until = lease.expires
+
+        await asyncio.sleep(0.1)
+        [taken] = await store.claim("other", limit=1)
+        lost = await store.renew(lease)
+        await store.close()
+        return claimed_until, renewed, renewed_until, taken, lost
+
+    claimed_until, renewed, renewed_until, taken, lost = asyncio.run(run())
+
+    assert renewed is True
+    assert renewed_until > claimed_until
+    assert taken.owner == "other"
+    assert lost is False
+
+
+def test_cancelled_job_is_not_claimed_and_restart_resumes(tmp_path):
+    path = str(tmp_path / "jobs.db")
+
+    async def run():
+        store = SQLiteJobStore(path)
+        cancelled = await store.submit(max_pages=5, delay=0.0)
+        kept = await store.submit(max_pages=5, delay=0.0)
+        await store.cancel(cancelled.id)
+        await store.close()
+
+        # Simulate a restart: a fresh store on the same file.
+        reopened = SQLiteJobStore(path)
+        leases = await reopened.claim("worker", limit=10)
+        job = await reopened.get(kept.id)
+        await reopened.close()
+        return cancelled.id, leases, job
+
+    cancelled_id, leases, job = asyncio.run(run())
+
+    assert {lease.job_id for lease in leases} == {job.id}
+    assert cancelled_id != job.id
+    assert job.state == "running"
+    assert job.pages["in_flight"] == 5
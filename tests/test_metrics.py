@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from scraper.exporter import JSONExporter
+from scraper.metrics import Metrics, metrics
+from scraper.service import ScraperService
+
+
+def scrape_to_json(path, pages=3):
+    site = StubQuoteSite(pages=pages)
+    client = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+    service = ScraperService(client, delay=0.0)
+    return asyncio.run(JSONExporter(str(path), lines=True).aexport(service.iter_records(25)))
+
+
+def test_stages_are_timed_only_while_enabled(tmp_path):
+    stages = ("fetch", "semaphore_wait", "rate_limit_wait", "parse", "export_write", "export_close")
+    before = {stage: metrics.stage_seconds.count(stage) for stage in stages}
+    requests = metrics.http_requests.value("200")
+
+    scrape_to_json(tmp_path / "off.ndjson")
+    assert {stage: metrics.stage_seconds.count(stage) for stage in stages} == before
+
+    metrics.enabled = True
+    try:
+        assert scrape_to_json(tmp_path / "on.ndjson") == 25
+    finally:
+        metrics.enabled = False
+
+    counts = {stage: metrics.stage_seconds.count(stage) - before[stage] for stage in stages}
+    assert counts["fetch"] == counts["semaphore_wait"] == counts["parse"] == 3
+    assert counts["export_write"] == 25
+    assert counts["export_close"] == 1
+    assert metrics.http_requests.value("200") - requests == 3
+    assert metrics.records_exported.value("JSON") >= 25
+
+
+def test_render_uses_prometheus_text_format():
+    registry = Metrics(enabled=True)
+    registry.stage_seconds.observe(0.003, "parse")
+    registry.stage_seconds.observe(20.0, "parse")
+    registry.http_requests.inc(2, "200")
+    registry.gauge("scraper_pool_in_flight", "Requests currently in flight.", lambda: 4)
+
+    text = registry.render()
+
+    assert "# TYPE scraper_stage_seconds histogram" in text
+    assert 'scraper_stage_seconds_bucket{stage="parse",le="0.0025"} 0' in text
+    assert 'scraper_stage_seconds_bucket{stage="parse",le="0.005"} 1' in text
+    assert 'scraper_stage_seconds_bucket{stage="parse",le="+Inf"} 2' in text
+    assert 'scraper_stage_seconds_count{stage="parse"} 2' in text
+    assert 'scraper_http_requests_total{status="200"} 2' in text
+    assert "scraper_pool_in_flight 4" in text
+    assert text.endswith("\n")
@@ -0,0 +1,21 @@
+import io
+
+from alembic import command
+from alembic.config import Config
+
+from conftest import ROOT
+
+
+def test_migrations_create_posts_with_search_index(monkeypatch):
+    # Offline mode renders the SQL for Postgres without connecting.
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    output = io.StringIO()
+    config = Config(str(ROOT / "alembic.ini"), output_buffer=output)
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+
+    command.upgrade(config, "head", sql=True)
+    sql = output.getvalue()
+
+    assert sql.index("CREATE TABLE posts") < sql.index("ADD COLUMN search_vector TSVECTOR")
+    assert "CREATE INDEX ix_posts_search_vector ON posts USING gin (search_vector)" in sql
+    assert "'0001_posts_search_vector'" in sql
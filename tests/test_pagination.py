@@ -0,0 +1,57 @@
+import threading
+
+from app.pagination import PostCountCache
+
+
+class SlowCount(PostCountCache):
+    """
+    Counts from `values`; a load blocks until `release` is set.
+    """
+
+    def __init__(self, *values):
+        super().__init__(ttl=0.0)
+        self.values = list(values)
+        self.loading = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _load(self, db):
+        self.loading.set()
+        self.release.wait(5)
+        return self.values.pop(0)
+
+
+def test_count_refresh_does_not_block_other_callers():
+    cache = SlowCount(10, 11)
+    assert cache.get(None) == 10
+
+    cache.release.clear()
+    cache.loading.clear()
+    refreshed = []
+    refresher = threading.Thread(target=lambda: refreshed.append(cache.get(None)))
+    refresher.start()
+    assert cache.loading.wait(5)
+
+    # Served the previous count while the refresh is in flight.
+    assert cache.get(None) == 10
+
+    cache.release.set()
+    refresher.join(5)
+    assert refreshed == [11]
+
+
+def test_count_loaded_before_invalidate_is_not_kept():
+    cache = SlowCount(10, 11)
+    cache.ttl = 60.0
+    cache.release.clear()
+    loaded = []
+    loader = threading.Thread(target=lambda: loaded.append(cache.get(None)))
+    loader.start()
+    assert cache.loading.wait(5)
+
+    cache.invalidate()
+    cache.release.set()
+    loader.join(5)
+
+    assert loaded == [10]
+    assert cache.get(None) == 11
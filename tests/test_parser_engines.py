@@ -0,0 +1,37 @@
+import importlib.util
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from scraper.parser import ENGINES, QuoteParser
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "parser"
+
+REQUIRES = {
+    "bs4-lxml": "lxml",
+    "lxml": "lxml",
+    "selectolax": "selectolax",
+}
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize(
+    "page", sorted(path.stem for path in FIXTURES.glob("*.html"))
+)
+def test_engine_matches_golden_output(engine, page):
+    module = REQUIRES.get(engine)
+    if module and importlib.util.find_spec(module) is None:
+        pytest.skip(f"{module} is not installed")
+
+    html = (FIXTURES / f"{page}.html").read_text(encoding="utf-8")
+    expected = json.loads((FIXTURES / f"{page}.json").read_text(encoding="utf-8"))
+
+    assert asdict(QuoteParser.parse_page(html, engine)) == expected
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        QuoteParser.parse("<html></html>", engine="regex")
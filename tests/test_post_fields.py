@@ -0,0 +1,38 @@
+import pytest
+from fastapi import HTTPException
+
+from conftest import load_api
+
+
+def test_post_columns_always_include_id():
+    api = load_api()
+
+    assert api.post_columns(None) == list(api.POST_COLUMNS.values())
+    assert [column.key for column in api.post_columns("content, title")] == ["id", "title", "content"]
+    assert [column.key for column in api.post_columns("id")] == ["id"]
+
+
+def test_post_columns_rejects_unknown_fields():
+    with pytest.raises(HTTPException) as error:
+        load_api().post_columns("title,password,secret")
+
+    assert error.value.status_code == 400
+    assert error.value.detail == "Unknown fields: password, secret"
+
+
+def test_fields_projection(seeded, posts_api):
+    page = posts_api.get("/posts", params={"fields": "title", "limit": 2}).json()
+    assert page["data"] == [{"id": 1, "title": "Post 1"}, {"id": 2, "title": "Post 2"}]
+
+    post = posts_api.get("/posts/3", params={"fields": "url,content"}).json()
+    assert post == {"id": 3, "url": "https://example.com/3", "content": "Body 3"}
+
+    assert posts_api.get("/posts/3", params={"fields": "id"}).json() == {"id": 3}
+
+
+@pytest.mark.parametrize("path", ["/posts", "/posts/1"])
+def test_unknown_field_is_rejected(seeded, posts_api, path):
+    response = posts_api.get(path, params={"fields": "title,password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: password"
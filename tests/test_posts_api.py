@@ -0,0 +1,39 @@
+import pytest
+
+from app.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_pages_cover_every_post_once(seeded, posts_api):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 10, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        page = posts_api.get("/posts", params=params).json()
+        ids += [post["id"] for post in page["data"]]
+        cursor = page.get("next_cursor")
+        if not cursor:
+            break
+
+    assert ids == list(range(1, 26))
+    assert decode_cursor(encode_cursor(20)) == 20
+    assert posts_api.get("/posts", params={"after_id": 20}).json()["data"][0]["id"] == 21
+
+
+@pytest.mark.parametrize("cursor", ["zz", encode_cursor(3)[:-1] + "!", "aWQ6eA"])
+def test_invalid_cursor_is_rejected(seeded, posts_api, cursor):
+    response = posts_api.get("/posts", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_total_is_omitted_on_request_and_refreshed_after_writes(seeded, posts_api):
+    assert "total" not in posts_api.get("/posts", params={"include_total": "false"}).json()
+    assert posts_api.get("/posts").json()["total"] == 25
+
+    created = posts_api.post("/posts", json={"title": "Fresh post", "url": "https://example.com/new"})
+    assert created.status_code == 201
+    assert posts_api.get("/posts").json()["total"] == 26
+
+    assert posts_api.delete(f"/posts/{created.json()['id']}").status_code == 204
+    assert posts_api.get("/posts").json()["total"] == 25
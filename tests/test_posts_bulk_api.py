@@ -0,0 +1,100 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from limits import parse as parse_limit
+from sqlalchemy.dialects import postgresql
+
+from app.schemas import MAX_BULK_POSTS
+from app.services.post_service import bulk_upsert_posts
+from conftest import load_api
+
+
+def post(n, title=None):
+    return {"title": title or f"Post {n}", "url": f"https://example.com/{n}"}
+
+
+@pytest.fixture
+def existing(posts_db):
+    with sqlite3.connect(posts_db) as conn:
+        conn.execute("INSERT INTO posts (title, url) VALUES ('Old title', 'https://example.com/1')")
+    return posts_db
+
+
+def test_bulk_reports_each_item(existing, posts_api):
+    items = [post(1), post(2), post(2, "Again"), {"title": "x", "url": "https://example.com/3", "extra": 1}]
+
+    response = posts_api.post("/posts/bulk", json={"items": items})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["results"]] == ["exists", "created", "duplicate", "invalid"]
+    assert (body["created"], body["existing"], body["duplicate"], body["invalid"]) == (1, 1, 1, 1)
+    assert body["results"][0]["id"] == 1
+    assert body["results"][2]["id"] == body["results"][1]["id"]
+    assert any("extra" in error for error in body["results"][3]["errors"])
+    assert posts_api.get("/posts/1").json()["title"] == "Old title"
+
+
+def test_bulk_update_overwrites_existing_posts(existing, posts_api):
+    response = posts_api.post(
+        "/posts/bulk", json={"items": [post(1, "New title"), post(4)], "on_conflict": "update"}
+    )
+
+    assert [item["status"] for item in response.json()["results"]] == ["updated", "created"]
+    assert posts_api.get("/posts/1").json()["title"] == "New title"
+    assert posts_api.get("/posts").json()["total"] == 2
+
+
+def test_bulk_size_is_bounded(posts_api):
+    too_many = [post(n) for n in range(MAX_BULK_POSTS + 1)]
+    assert posts_api.post("/posts/bulk", json={"items": too_many}).status_code == 422
+    assert posts_api.post("/posts/bulk", json={"items": []}).status_code == 422
+
+
+def test_bulk_rows_are_rate_limited(posts_api, monkeypatch):
+    monkeypatch.setattr(load_api(), "BULK_ROW_LIMIT", parse_limit("5/minute"))
+
+    assert posts_api.post("/posts/bulk", json={"items": [post(n) for n in range(4)]}).status_code == 200
+    response = posts_api.post("/posts/bulk", json={"items": [post(n) for n in range(4, 8)]})
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert posts_api.get("/posts").json()["total"] == 4
+
+
+class PostgresSession:
+    """
+    Replays canned rows for the lookup and the upsert, as Postgres
+    would return them.
+    """
+
+    def __init__(self, existing, returned):
+        self.results = [existing, returned]
+        self.statements = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=postgresql.dialect())
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return self.results.pop(0) if self.results else []
+
+    def commit(self):
+        pass
+
+
+def test_bulk_status_comes_from_the_upsert_on_postgres():
+    # /1 was deleted after the lookup and re-inserted; /2 was inserted
+    # concurrently before the upsert updated it.
+    session = PostgresSession(
+        existing=[(1, "https://example.com/1")],
+        returned=[(7, "https://example.com/1", True), (8, "https://example.com/2", False)],
+    )
+
+    results = bulk_upsert_posts(session, [post(1), post(2)], on_conflict="update")
+
+    assert [item["status"] for item in results] == ["created", "updated"]
+    sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (url) DO UPDATE" in sql
+    assert "RETURNING posts.id, posts.url, xmax = 0" in sql
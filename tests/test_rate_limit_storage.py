@@ -0,0 +1,102 @@
+import time
+
+import pytest
+from limits import parse as parse_limit
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+
+from app.rate_limit import BoundedMemoryStorage, SharedCounterStorage, build_limiter
+from fake_redis import FakeRedis
+
+
+@pytest.fixture(params=["memory", "shared"])
+def storage(request):
+    if request.param == "memory":
+        return BoundedMemoryStorage(max_keys=1000)
+    return SharedCounterStorage(client=FakeRedis())
+
+
+def test_sliding_window_admits_up_to_limit(storage):
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = parse_limit("5/minute")
+
+    assert [limiter.hit(item, "10.0.0.1") for _ in range(6)] == [True] * 5 + [False]
+    assert limiter.hit(item, "10.0.0.2")
+
+    reset_at, remaining = limiter.get_window_stats(item, "10.0.0.1")
+    assert remaining == 0
+
+    limiter.clear(item, "10.0.0.1")
+    assert limiter.hit(item, "10.0.0.1")
+
+
+def test_sliding_window_charges_cost(storage):
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = parse_limit("100/minute")
+
+    assert limiter.hit(item, "client", cost=60)
+    assert not limiter.hit(item, "client", cost=60)
+    assert not limiter.hit(item, "client", cost=101)
+    # A rejected hit is not counted.
+    assert limiter.get_window_stats(item, "client").remaining == 40
+    assert limiter.hit(item, "client", cost=40)
+
+
+def test_fixed_window_strategy(storage):
+    limiter = FixedWindowRateLimiter(storage)
+    item = parse_limit("2/minute")
+
+    assert limiter.hit(item, "client")
+    assert limiter.hit(item, "client")
+    assert not limiter.hit(item, "client")
+    assert storage.reset() >= 1
+    assert limiter.hit(item, "client")
+
+
+def test_memory_storage_evicts_least_recently_used_keys():
+    storage = BoundedMemoryStorage(max_keys=3)
+    for key in ("a", "b", "c"):
+        storage.incr(key, 60)
+    storage.get("a")
+    storage.incr("d", 60)
+
+    assert len(storage) == 3
+    assert storage.get("b") == 0
+    assert storage.get("a") == 1
+    assert storage.get("d") == 1
+
+
+def test_memory_storage_expires_counters():
+    storage = BoundedMemoryStorage()
+    storage.incr("key", 0.01)
+    assert storage.get("key") == 1
+
+    time.sleep(0.02)
+    assert storage.get("key") == 0
+    assert len(storage) == 0
+
+
+def test_shared_storage_budget_spans_workers():
+    redis = FakeRedis()
+    item = parse_limit("4/minute")
+    workers = [
+        SlidingWindowCounterRateLimiter(SharedCounterStorage(client=redis))
+        for _ in range(2)
+    ]
+
+    results = [workers[n % 2].hit(item, "client") for n in range(6)]
+    assert results == [True] * 4 + [False] * 2
+    assert all(key.startswith("ratelimit:") for key in redis.data)
+
+
+def test_build_limiter_selects_storage(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_STORAGE_URI", raising=False)
+    monkeypatch.setenv("RATE_LIMIT_MAX_KEYS", "50")
+    limiter = build_limiter(lambda request: "client")
+
+    assert isinstance(limiter._storage, BoundedMemoryStorage)
+    assert limiter._storage.max_keys == 50
+    assert isinstance(limiter.limiter, SlidingWindowCounterRateLimiter)
+
+    monkeypatch.setenv("RATE_LIMIT_STORAGE_URI", "memory://")
+    monkeypatch.setenv("RATE_LIMIT_STRATEGY", "fixed-window")
+    assert isinstance(build_limiter(lambda request: "client").limiter, FixedWindowRateLimiter)
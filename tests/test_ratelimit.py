@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from scraper.ratelimit import HostRateLimiter, TokenBucket, parse_retry_after
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=20.0, burst=2)
+
+    async def run():
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # Two tokens are free, the other two wait ~50 ms each.
+    assert 0.08 <= asyncio.run(run()) < 0.5
+
+
+def test_limiter_backs_off_and_recovers():
+    limiter = HostRateLimiter(rate=4.0, max_rate=5.0, increase_step=0.5)
+
+    limiter.on_response("example.com", 429, 0.1)
+    assert limiter.current_rate("example.com") == 2.0
+
+    for _ in range(10):
+        limiter.on_response("example.com", 200, 0.1)
+    assert limiter.current_rate("example.com") == 5.0
+
+
+def test_limiter_honors_retry_after():
+    limiter = HostRateLimiter(rate=None)
+    limiter.on_response("example.com", 503, 0.1, retry_after=0.1)
+
+    async def run():
+        start = time.monotonic()
+        async with limiter.slot("example.com"):
+            return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("not a date") is None
+
+
+def test_seed_only_sets_rate_of_new_hosts():
+    limiter = HostRateLimiter(rate=1.0)
+
+    limiter.seed("example.com", 0.5)
+    assert limiter.current_rate("example.com") == 2.0
+
+    limiter.on_response("example.com", 429, 0.1)
+    limiter.seed("example.com", 0.5)
+    assert limiter.current_rate("example.com") == 1.0
+
+
+def test_set_rate_keeps_tokens_earned_at_the_old_rate():
+    bucket = TokenBucket(rate=10.0, burst=5)
+    bucket.tokens = 0.0
+    time.sleep(0.1)
+
+    bucket.set_rate(0.1)
+
+    assert bucket.rate == 0.1
+    assert 0.9 <= bucket.tokens <= 1.5
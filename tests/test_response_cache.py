@@ -0,0 +1,117 @@
+import time
+
+import pytest
+
+from app.response_cache import (
+    MemoryCacheBackend,
+    PostResponseCache,
+    RedisCacheBackend,
+    etag_matches,
+)
+from fake_redis import FakeRedis
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        backend = MemoryCacheBackend(max_entries=100)
+    else:
+        backend = RedisCacheBackend(FakeRedis())
+    return PostResponseCache(backend, ttl=30.0)
+
+
+def test_read_through_and_invalidation(cache):
+    generation = cache.generation()
+    list_key = cache.list_key(generation, skip=0, limit=10, fields=None)
+    item_key = cache.item_key(1, cache.version(1), "url,title")
+    other_key = cache.item_key(2, cache.version(2), None)
+
+    assert cache.get(list_key) is None
+    listed = cache.set(list_key, {"data": [{"id": 1, "title": "First"}]})
+    cache.set(item_key, {"id": 1, "title": "First"})
+    cache.set(other_key, {"id": 2, "title": "Second"})
+
+    assert cache.get(list_key) == listed
+    assert cache.get(item_key).body == b'{"id":1,"title":"First"}'
+    assert cache.item_key(1, cache.version(1), "title,id,url") == item_key
+
+    cache.invalidate_post(1)
+
+    assert cache.get(cache.item_key(1, cache.version(1), "url,title")) is None
+    assert cache.get(cache.item_key(2, cache.version(2), None)) is not None
+    assert cache.list_key(cache.generation(), skip=0, limit=10, fields=None) != list_key
+
+
+def test_response_read_before_a_write_is_never_served(cache):
+    # A reader keys its entry on the version it read before querying...
+    stale_key = cache.item_key(1, cache.version(1), None)
+    stale_list_key = cache.list_key(cache.generation(), skip=0, limit=10, fields=None)
+
+    # ...a write lands while it runs the query...
+    cache.invalidate_post(1)
+
+    # ...and its store completes afterwards.
+    cache.set(stale_key, {"id": 1, "title": "Old"})
+    cache.set(stale_list_key, {"data": [{"id": 1, "title": "Old"}]})
+
+    assert cache.get(cache.item_key(1, cache.version(1), None)) is None
+    assert cache.get(cache.list_key(cache.generation(), skip=0, limit=10, fields=None)) is None
+
+
+def test_memory_backend_evicts_lru_and_expired_entries():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1", ttl=30)
+    backend.set("b", b"2", ttl=30)
+    backend.get("a")
+    backend.set("c", b"3", ttl=30)
+    backend.set("short", b"4", ttl=0.01)
+
+    assert backend.get("b") is None
+    time.sleep(0.02)
+    assert backend.get("short") is None
+    assert len(backend) <= 2
+
+    assert backend.add("d", b"5", ttl=30) is True
+    assert backend.add("d", b"6", ttl=30) is False
+    assert backend.get("d") == b"5"
+
+
+def test_version_tokens_stay_bounded():
+    backend = MemoryCacheBackend(max_entries=50)
+    cache = PostResponseCache(backend, ttl=30.0)
+
+    for post_id in range(1000):
+        cache.invalidate_post(post_id)
+
+    assert len(backend) <= 50
+
+
+def test_redis_version_tokens_expire():
+    redis = FakeRedis()
+    cache = PostResponseCache(RedisCacheBackend(redis), ttl=30.0)
+
+    cache.invalidate_post(1)
+    cache.version(2)
+
+    for key in ("blog:posts:version:1", "blog:posts:version:2", "blog:" + cache.GENERATION_KEY):
+        assert 30_000 < redis.pttl(key) <= 300_000
+
+
+def test_evicted_version_is_never_reused(cache):
+    stale_key = cache.item_key(1, cache.version(1), None)
+    cache.set(stale_key, {"id": 1, "title": "Old"})
+
+    cache.invalidate_post(1)
+    # Losing the token must not bring back an entry keyed on an old one.
+    cache.backend.delete("posts:version:1")
+
+    assert cache.version(1) not in stale_key
+    assert cache.get(cache.item_key(1, cache.version(1), None)) is None
+
+
+def test_etag_matching():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+import pytest
+
+from scraper.client import ScraperClient
+from scraper.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from scraper.service import ScraperService
+
+
+def flaky_transport(failures):
+    calls = {"count": 0}
+
+    def handler(request):
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, text="<div class='quote'></div>")
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_retries_transient_errors():
+    transport, calls = flaky_transport(failures=2)
+    client = ScraperClient(
+        "http://stub.local",
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0),
+    )
+
+    async def run():
+        async with client:
+            return await client.fetch_page(1)
+
+    assert "quote" in asyncio.run(run())
+    assert calls["count"] == 3
+    assert client.pool_stats()["retries"] == 2
+
+
+def test_circuit_breaker_fails_fast():
+    transport, calls = flaky_transport(failures=100)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = ScraperClient("http://stub.local", transport=transport, circuit_breaker=breaker)
+
+    async def run():
+        async with client:
+            for _ in range(2):
+                await client.get("/page/1/")
+            with pytest.raises(CircuitOpenError):
+                await client.get("/page/1/")
+
+    asyncio.run(run())
+
+    assert calls["count"] == 2
+    assert breaker.state("stub.local") == "open"
+
+
+def test_failures_are_reported_in_result():
+    transport, _ = flaky_transport(failures=100)
+    client = ScraperClient("http://stub.local", transport=transport)
+
+    result = asyncio.run(ScraperService(client, delay=0.0).scrape_result(20))
+
+    assert result.records == []
+    assert result.failures
+    assert result.failures[0].status_code == 503
+
+
+def test_cancelled_probe_releases_half_open_circuit():
+    calls = {"count": 0}
+    gate = asyncio.Event()
+
+    async def handler(request):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(503)
+        if calls["count"] == 2:
+            await gate.wait()
+        return httpx.Response(200, text="ok")
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    client = ScraperClient(
+        "http://stub.local", transport=httpx.MockTransport(handler), circuit_breaker=breaker
+    )
+
+    async def run():
+        async with client:
+            await client.get("/page/1/")
+            assert breaker.state("stub.local") == "half-open"
+
+            probe = asyncio.create_task(client.get("/page/1/"))
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            return await client.get("/page/1/")
+
+    assert asyncio.run(run()).status_code == 200
+    assert breaker.state("stub.local") == "closed"
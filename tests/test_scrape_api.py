@@ -0,0 +1,90 @@
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRAPER_JOBS_FILE", str(tmp_path / "jobs.db"))
+    monkeypatch.delenv("SCRAPER_JOB_EMBEDDED_WORKER", raising=False)
+    monkeypatch.setenv("SCRAPER_CACHE_BACKEND", "none")
+    site = StubQuoteSite(pages=30)
+
+    with TestClient(app) as client:
+        stub = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+        client.portal.call(stub.open)
+        app.state.scraper_client, real = stub, app.state.scraper_client
+        try:
+            yield client
+        finally:
+            app.state.scraper_client = real
+            client.portal.call(stub.aclose)
+
+
+def test_scrapes_share_one_rate_limiter(api):
+    limiter = app.state.rate_limiter
+
+    for _ in range(2):
+        response = api.get("/scrape", params={"limit": 20, "delay": 0})
+        assert response.status_code == 200
+
+    assert app.state.rate_limiter is limiter
+    assert limiter.stats()["stub.local"]["requests"] == 4
+    assert limiter.current_rate("stub.local") is None
+
+
+def test_delay_is_honoured_after_the_host_was_seeded(api):
+    assert api.get("/scrape", params={"limit": 10, "delay": 0}).status_code == 200
+
+    start = time.monotonic()
+    response = api.get("/scrape", params={"limit": 30, "delay": 0.1})
+
+    assert response.status_code == 200
+    # Three pages, spaced 0.1s apart although the host runs unthrottled.
+    assert time.monotonic() - start >= 0.2
+    assert app.state.rate_limiter.current_rate("stub.local") is None
+
+
+def test_job_store_is_opened_on_first_use(api, tmp_path):
+    assert app.state.job_store is None
+    assert not (tmp_path / "jobs.db").exists()
+
+    response = api.post("/jobs", params={"pages": 1})
+
+    assert response.status_code == 202
+    assert response.json()["state"] == "pending"
+    assert (tmp_path / "jobs.db").exists()
+
+
+def test_stream_sends_one_json_record_per_line(api):
+    response = api.get("/scrape", params={"limit": 150, "delay": 0, "stream": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.endswith("\n")
+    *records, summary = [json.loads(line) for line in response.text.splitlines()]
+    assert summary == {"done": True, "records": 150, "failed_pages": []}
+    assert len(records) == 150
+    assert records[0]["text"] == "Quote number 0"
+    assert records[-1]["text"] == "Quote number 149"
+
+
+@pytest.mark.parametrize("params, status", [
+    ({"limit": 100}, 200),
+    ({"limit": 101}, 422),
+    ({"limit": 10_000, "stream": "true"}, 200),
+    ({"limit": 10_001, "stream": "true"}, 422),
+])
+def test_limit_caps(api, params, status):
+    response = api.get("/scrape", params={"delay": 0, **params})
+
+    assert response.status_code == status
+    if status == 422 and "stream" not in params:
+        assert "requires stream=true" in response.json()["detail"]
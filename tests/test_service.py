@@ -0,0 +1,100 @@
+import contextlib
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.client import ScraperClient
+from app.main import stream_ndjson
+from scraper.service import ScraperService
+
+
+def make_service(site):
+    client = ScraperClient("http://stub.local", transport=httpx.ASGITransport(app=site))
+    return ScraperService(client, delay=0.0)
+
+
+def test_scrape_stops_at_limit():
+    site = StubQuoteSite(pages=50)
+    records = asyncio.run(make_service(site).scrape(25))
+
+    assert len(records) == 25
+    assert records[0]["text"] == "Quote number 0"
+    assert site.requests == 3
+
+
+def test_scrape_stops_when_site_runs_out():
+    site = StubQuoteSite(pages=3, quotes_per_page=7)
+    records = asyncio.run(make_service(site).scrape(100))
+
+    assert len(records) == 21
+    assert site.requests <= 3 + 5
+
+
+def test_iter_records_stops_fetching_for_slow_consumer():
+    site = StubQuoteSite(pages=50)
+    service = make_service(site)
+
+    async def consume():
+        records = []
+        async with contextlib.aclosing(service.iter_records(500)) as stream:
+            async for record in stream:
+                records.append(record)
+                if len(records) == 10:
+                    break
+        return records
+
+    records = asyncio.run(consume())
+
+    assert len(records) == 10
+    assert site.completed <= service.max_concurrency
+
+
+def test_stream_ndjson_writes_one_line_per_record():
+    site = StubQuoteSite(pages=5)
+
+    async def collect():
+        return [chunk async for chunk in stream_ndjson(make_service(site), 23)]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) == 24
+    assert all(chunk.endswith(b"\n") and chunk.count(b"\n") == 1 for chunk in chunks)
+    assert json.loads(chunks[22])["text"] == "Quote number 22"
+    assert json.loads(chunks[-1]) == {"done": True, "records": 23, "failed_pages": []}
+
+
+def test_stream_ndjson_reports_failed_pages_in_summary():
+    site = StubQuoteSite(pages=5, error_rate=1.0)
+
+    async def collect():
+        return [chunk async for chunk in stream_ndjson(make_service(site), 10)]
+
+    summary = json.loads(asyncio.run(collect())[-1])
+
+    assert summary["done"] is True
+    assert summary["records"] == 0
+    assert summary["failed_pages"]
+    assert summary["failed_pages"][0]["page"] == 1
+
+
+def test_stream_ndjson_ends_with_error_line_when_scraping_fails():
+    class FailingService:
+        failures = []
+
+        async def iter_records(self, limit):
+            yield {"text": "first"}
+            raise RuntimeError("site went away")
+
+    async def collect():
+        return [chunk async for chunk in stream_ndjson(FailingService(), 10)]
+
+    # Headers are already sent, so the failure is the last line.
+    first, last = asyncio.run(collect())
+    assert first == b'{"text": "first"}\n'
+    assert json.loads(last) == {
+        "error": "Internal scraping error.",
+        "records": 1,
+        "failed_pages": [],
+    }
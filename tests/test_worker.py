@@ -0,0 +1,75 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import uvicorn
+
+from benchmarks.stub_site import StubQuoteSite
+from scraper.jobs import SQLiteJobStore
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def serve(site):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(site, port=port, lifespan="off", log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, port
+
+
+def test_worker_processes_share_one_job(tmp_path):
+    site = StubQuoteSite(pages=30, latency=0.01)
+    server, thread, port = serve(site)
+    db = str(tmp_path / "jobs.db")
+
+    async def submit():
+        store = SQLiteJobStore(db)
+        job = await store.submit(max_pages=100, delay=0.0, lookahead=6)
+        await store.close()
+        return job.id
+
+    job_id = asyncio.run(submit())
+
+    env = dict(os.environ, SCRAPER_BASE_URL=f"http://127.0.0.1:{port}", SCRAPER_JOBS_FILE=db)
+    try:
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "scraper.worker", "--until-idle", "--concurrency", "2"],
+                cwd=ROOT,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for _ in range(3)
+        ]
+        assert [worker.wait(timeout=60) for worker in workers] == [0, 0, 0]
+    finally:
+        server.should_exit = True
+        thread.join()
+
+    async def inspect():
+        store = SQLiteJobStore(db)
+        job = await store.get(job_id)
+        records = await store.records(job_id, limit=1000)
+        await store.close()
+        return job, records
+
+    job, records = asyncio.run(inspect())
+
+    assert job.state == "done"
+    assert job.last_page == 30
+    assert [record["text"] for record in records] == [f"Quote number {n}" for n in range(300)]
+    # Every page was fetched once: no lease was handed out twice.
+    assert site.requests == job.pages["done"]